@@ -0,0 +1,113 @@
+"""Micro-benchmark of the Colorwheels generator.
+
+Compares the per-call latency of ``next(wheels)`` for every generator type with
+the previous implementation, which dispatched on the generator type string and
+rebuilt the color value on every call.
+
+Run from the repository root::
+
+    python benchmarks/bench_generator.py
+
+``suite`` registers the generator measurements for ``run_all.py``.
+"""
+
+import pathlib
+import sys
+import timeit
+from dataclasses import dataclass
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+import colorwheels  # pylint: disable=wrong-import-position
+
+CALLS = 200_000
+REPEAT = 5
+
+
+@dataclass
+class LegacyColorItem:
+    """ColorItem as implemented before slots: a plain dataclass"""
+
+    red: int
+    green: int
+    blue: int
+
+
+class LegacyColorwheels(colorwheels.Colorwheels):
+    """Colorwheels generator as implemented before bound color tables: colors
+    were a list of ColorItem dataclasses, and every call dispatched on the
+    generator type string and rebuilt the color value"""
+
+    def _bind_table(self):
+        super()._bind_table()
+        wheel = self._active_wheel
+        self._legacy_colors = [LegacyColorItem(color.red, color.green, color.blue)
+                               for color in wheel.colors] if wheel is not None else []
+
+    def __next__(self):
+        if self._generator_type == "rgb_tuple":
+            return self.legacy_next()
+        if self._generator_type == "rgba_tuple":
+            return self.legacy_next_rgba()
+        if self._generator_type == "hexadecimal":
+            return self.legacy_next_hex()
+        raise ValueError(f"Unknown generator type '{self._generator_type}'")
+
+    def legacy_color_item(self):
+        color = self._legacy_colors[self.counter]
+        self.counter += 1
+        if self.counter >= len(self._legacy_colors):
+            self.counter = 0
+        return color
+
+    def legacy_next(self):
+        color = self.legacy_color_item()
+        return (color.red, color.green, color.blue)
+
+    def legacy_next_rgba(self, alpha=255):
+        color = self.legacy_next()
+        return color + (alpha,)
+
+    def legacy_next_hex(self):
+        color = self.legacy_next()
+        return "#{:02x}{:02x}{:02x}".format(color[0], color[1], color[2])
+
+
+def per_call(wheels):
+    """Best per-call latency of next(wheels) in nanoseconds"""
+
+    timer = timeit.Timer("next(wheels)", globals={"wheels": wheels})
+    return min(timer.repeat(repeat=REPEAT, number=CALLS)) / CALLS * 1e9
+
+
+def suite(bench):
+    """Generator measurements for run_all.py"""
+
+    context = colorwheels.ColorwheelsContext()
+    wheels = colorwheels.Colorwheels(context=context)
+    wheels.active_wheel = colorwheels.WheelItem.rainbow_wheel_item("bench", 256)
+    for generator_type in colorwheels.colorwheels.generator_types:
+        wheels.set_generator_type(generator_type)
+        bench.measure(f"next/{generator_type}", wheels.__next__, wheel_size=256)
+
+    wheels.set_generator_type("rgb_tuple")
+    frame = bytearray(3 * 1024)
+    bench.measure("next_batch/rgb_tuple", lambda: wheels.next_batch(1024, out=frame),
+                  wheel_size=256, count=1024)
+
+
+def main():
+    print(f"{'generator type':<14} {'legacy ns':>10} {'current ns':>11} {'speedup':>8}")
+    for generator_type in colorwheels.colorwheels.generator_types:
+        results = []
+        for cls in (LegacyColorwheels, colorwheels.Colorwheels):
+            wheels = cls()
+            wheels.active_wheel = colorwheels.WheelItem.rainbow_wheel_item("bench", 256)
+            wheels.set_generator_type(generator_type)
+            results.append(per_call(wheels))
+        legacy, current = results
+        print(f"{generator_type:<14} {legacy:>10.1f} {current:>11.1f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Import time of the colorwheels package.
+
+Runs short-lived programs with ``python -X importtime`` in fresh interpreters,
+and reports the cumulative import time of the package. The check fails, if an
+optional or heavy dependency (YAML, NumPy, asyncio) is imported by a program
+which doesn't need it.
+
+Run from the repository root::
+
+    python benchmarks/bench_import.py [--max-ms MILLISECONDS]
+
+``suite`` registers the import times for ``run_all.py``.
+"""
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+
+import harness
+
+SOURCE = pathlib.Path(__file__).resolve().parents[1] / "src"
+
+# program -> modules it must not import
+PROGRAMS = {
+    "import": ("import colorwheels",
+               ("yaml", "numpy", "asyncio")),
+    "first color": ("import colorwheels; next(colorwheels.Colorwheels())",
+                    ("yaml", "numpy", "asyncio")),
+    "small rainbow": ("import colorwheels; colorwheels.Colorwheels().rainbow(32)",
+                      ("yaml", "numpy", "asyncio")),
+}
+
+
+def import_times(program):
+    """Run program with -X importtime. Returns the cumulative import time in
+    seconds of every module imported at top level, i.e. not by another module
+    (submodules of colorwheels imported on first use are top level entries),
+    and the names of all imported modules"""
+
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        [str(SOURCE)] + os.environ.get("PYTHONPATH", "").split(os.pathsep)))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", program],
+                               env=environment, capture_output=True, text=True, check=True)
+    times = {}
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        # nested imports are indented by two spaces per level
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative) / 1e6
+    return times, modules
+
+
+def package_time(times):
+    """Import time of the package and all its submodules"""
+
+    return sum(seconds for name, seconds in times.items()
+               if name == "colorwheels" or name.startswith("colorwheels."))
+
+
+def check(repeat=5):
+    """Best import time of the package per program, and unwanted imports"""
+
+    results = {}
+    failures = []
+    for name, (program, unwanted) in PROGRAMS.items():
+        runs = [import_times(program) for _ in range(repeat)]
+        results[name] = min(package_time(times) for times, _ in runs)
+        imported = sorted(module for module in unwanted if module in runs[0][1])
+        if imported:
+            failures.append(f"'{name}' imports {', '.join(imported)}")
+    return results, failures
+
+
+def suite(bench):
+    """Import time measurements for run_all.py"""
+
+    results, failures = check(bench.repeat)
+    for name, seconds in results.items():
+        bench.record(f"import/{name}", seconds)
+    for failure in failures:
+        print(f"  WARNING: {failure}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of colorwheels")
+    parser.add_argument("--max-ms", type=float,
+                        help="fail if importing the package takes longer")
+    args = parser.parse_args()
+
+    results, failures = check()
+    for name, seconds in results.items():
+        print(f"  {name:<20} {harness.format_duration(seconds):>12}")
+        if args.max_ms is not None and seconds * 1e3 > args.max_ms:
+            failures.append(f"'{name}' takes more than {args.max_ms} ms")
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark of ColorwheelsConfig.load_wheels.
+
+Generates a definition file of 10k wheels (sequences and rainbows), and compares
+load times of the pure Python YAML loader, the libyaml C loader, and a load from
+the compiled cache.
+
+Run from the repository root::
+
+    python benchmarks/bench_loader.py [number of wheels]
+
+``suite`` registers load times of increasing file sizes for ``run_all.py``.
+"""
+
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+import yaml  # pylint: disable=wrong-import-position
+
+import colorwheels  # pylint: disable=wrong-import-position
+from colorwheels import colorwheels_config  # pylint: disable=wrong-import-position
+
+WHEELS = 10_000
+
+
+def write_definitions(filename, count):
+    """Write a YAML definition file with count wheels"""
+
+    rnd = random.Random(count)
+    wheels = []
+    for i in range(count):
+        if i % 4 == 0:
+            wheels.append({"wheel": {"name": f"rainbow-{i}", "type": "rainbow",
+                                     "size": rnd.randint(16, 256),
+                                     "frequency": round(rnd.uniform(0.01, 0.5), 3)}})
+        else:
+            colors = [{"rgb": [rnd.randint(0, 255) for _ in range(3)]}
+                      for _ in range(rnd.randint(1, 16))]
+            wheels.append({"wheel": {"name": f"sequence-{i}", "colors": colors}})
+
+    with open(filename, "w") as stream:
+        yaml.safe_dump({"meta": {"release": "0.5.0.0"}, "wheels": wheels}, stream)
+
+
+def timed(function):
+    """Run function, return duration in milliseconds"""
+
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def suite(bench):
+    """Loader measurements for run_all.py"""
+
+    sizes = (100, 1000) if bench.quick else (100, 1000, 10_000)
+    context = colorwheels.ColorwheelsContext()
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sizes:
+            filename = pathlib.Path(directory) / f"wheels-{count}.yml"
+            cache_dir = pathlib.Path(directory) / "cache"
+            write_definitions(filename, count)
+            number = max(1, 1000 // count)
+            bench.measure(f"load_wheels/{count}", lambda: context.load_wheels(filename),
+                          number=number, wheels=count)
+
+            def load_all():
+                context.load_wheels(filename)
+                context.preload()
+
+            bench.measure(f"load_wheels+preload/{count}", load_all, number=number, wheels=count)
+            context.load_wheels(filename, cache_dir=cache_dir)
+            bench.measure(f"load_wheels cached/{count}",
+                          lambda: context.load_wheels(filename, cache_dir=cache_dir),
+                          number=number, wheels=count)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else WHEELS
+    config = colorwheels.ColorwheelsConfig()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = pathlib.Path(directory) / "wheels.yml"
+        cache_dir = pathlib.Path(directory) / "cache"
+        write_definitions(filename, count)
+
+        results = {}
+        c_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        colorwheels_config._YamlLoader = yaml.SafeLoader
+        results["cold, Python loader"] = timed(lambda: config.load_wheels(filename))
+        colorwheels_config._YamlLoader = c_loader
+        results[f"cold, {c_loader.__name__}"] = timed(lambda: config.load_wheels(filename))
+        results["cold, writing cache"] = timed(
+            lambda: config.load_wheels(filename, cache_dir=cache_dir))
+        results["cached"] = timed(lambda: config.load_wheels(filename, cache_dir=cache_dir))
+
+    print(f"load_wheels, {count} wheels")
+    for name, duration in results.items():
+        print(f"  {name:<24} {duration:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
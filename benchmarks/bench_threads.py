@@ -0,0 +1,140 @@
+"""Multi-threaded stress test and throughput of ThreadSafeColorwheels.
+
+Worker threads pull colors from one shared generator, while a switcher thread
+keeps activating wheels of different sizes. The run fails if a thread gets an
+exception (e.g. an index past the end of a shorter wheel), a color which does
+not belong to any of the wheels, or - with a shared cursor on a single wheel -
+if any color is skipped or served twice.
+
+Run from the repository root::
+
+    python benchmarks/bench_threads.py [threads] [seconds]
+"""
+
+import collections
+import pathlib
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+import colorwheels  # pylint: disable=wrong-import-position
+
+THREADS = 4
+SECONDS = 2.0
+
+
+def setup(wheels):
+    """Register wheels of different sizes"""
+
+    config = wheels.wheel_configurations
+    for size in (3, 64, 1000):
+        if config.find_wheel(f"stress-{size}") is None:
+            config.add_wheel_item(colorwheels.WheelItem.rainbow_wheel_item(f"stress-{size}", size))
+
+
+def run(wheels, threads, seconds, switch):
+    """Pull colors from threads for a while. Returns colors served, and colors
+    per thread"""
+
+    valid = set()
+    for size in (3, 64, 1000):
+        valid.update(wheels.wheel_configurations.find_wheel(f"stress-{size}").table())
+    stop = threading.Event()
+    errors = []
+    served = [collections.Counter() for _ in range(threads)]
+
+    def worker(counter):
+        try:
+            while not stop.is_set():
+                for _ in range(1000):
+                    counter[next(wheels)] += 1
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    def switcher():
+        names = ["stress-3", "stress-64", "stress-1000"]
+        i = 0
+        while not stop.is_set():
+            wheels.activate_colorwheel(names[i % 3])
+            i += 1
+            time.sleep(0.0005)
+
+    pool = [threading.Thread(target=worker, args=(counter,)) for counter in served]
+    if switch:
+        pool.append(threading.Thread(target=switcher))
+    for thread in pool:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in pool:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    total = sum(served, collections.Counter())
+    invalid = set(total) - valid
+    if invalid:
+        raise AssertionError(f"colors not in any wheel: {sorted(invalid)[:5]}")
+    return total, served
+
+
+def check_sequence(threads):
+    """Shared cursor on one wheel: every color of the wheel served equally often"""
+
+    wheels = colorwheels.ThreadSafeColorwheels()
+    setup(wheels)
+    wheels.activate_colorwheel("stress-64")
+    table = wheels.active_wheel.table()
+    barrier = threading.Barrier(threads)
+    served = collections.Counter()
+    lock = threading.Lock()
+
+    def worker():
+        local = collections.Counter()
+        barrier.wait()
+        for _ in range(64 * 2000):
+            local[next(wheels)] += 1
+        with lock:
+            served.update(local)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    expected = threads * 2000
+    # colors may repeat within the table, so compare per distinct color
+    for color, occurrences in collections.Counter(table).items():
+        if served[color] != expected * occurrences:
+            raise AssertionError(f"color {color} served {served[color]} times")
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else THREADS
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else SECONDS
+
+    check_sequence(threads)
+    print(f"shared cursor, {threads} threads: no colors skipped or repeated")
+
+    print(f"{'generator':<28} {'threads':>7} {'colors/s':>12}")
+    single = colorwheels.Colorwheels()
+    setup(single)
+    single.activate_colorwheel("stress-64")
+    total, _ = run(single, 1, seconds, switch=False)
+    print(f"{'Colorwheels (unsafe)':<28} {1:>7} {sum(total.values()) / seconds:>12,.0f}")
+
+    for per_thread in (False, True):
+        wheels = colorwheels.ThreadSafeColorwheels(per_thread_cursors=per_thread)
+        setup(wheels)
+        wheels.activate_colorwheel("stress-64")
+        for switch in (False, True):
+            total, _ = run(wheels, threads, seconds, switch)
+            name = "per-thread cursors" if per_thread else "shared cursor"
+            name += ", switching" if switch else ""
+            print(f"{name:<28} {threads:>7} {sum(total.values()) / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark of wheel activation, palette generation and transforms.
+
+Measures ``activate_colorwheel`` in configurations of increasing size (with
+wheels already built, and with lazily loaded wheels built on activation),
+``generate_rainbow`` and ``complement_wheel_item`` for small and large wheels.
+
+Run from the repository root::
+
+    python benchmarks/bench_wheels.py
+
+``suite`` registers the measurements for ``run_all.py``.
+"""
+
+import harness
+
+import colorwheels  # pylint: disable=wrong-import-order
+from colorwheels import WheelItem  # pylint: disable=wrong-import-order
+
+
+def suite(bench):
+    """Wheel measurements for run_all.py"""
+
+    sizes = (100, 10_000) if bench.quick else (100, 10_000, 100_000)
+    for count in sizes:
+        context = colorwheels.ColorwheelsContext()
+        context.add_wheel_items([WheelItem.rainbow_wheel_item(f"wheel-{i}", 16 + i % 48)
+                                 for i in range(count)])
+        wheels = colorwheels.Colorwheels(context=context)
+        names = [f"wheel-{count // 2}", f"wheel-{count - 1}"]
+
+        def activate():
+            for name in names:
+                wheels.activate_colorwheel(name)
+
+        bench.measure(f"activate_colorwheel/{count}", activate, wheels=count)
+
+        names = [f"wheel-{i}" for i in range(0, count, max(1, count // 1000))]
+
+        def activate_cold():
+            for name in names:
+                context.find_wheel(name).invalidate()
+                wheels.activate_colorwheel(name)
+
+        bench.measure(f"activate_colorwheel cold tables/{count}", activate_cold,
+                      number=1, wheels=count, activations=len(names))
+
+    for size in (16, 256, 4096):
+        wheel = WheelItem("bench", [])
+        bench.measure(f"generate_rainbow/{size}",
+                      lambda: wheel.generate_rainbow(size, 127, 128, 0.3), size=size)
+        bench.measure(f"complement_wheel_item/{size}",
+                      lambda: WheelItem.complement_wheel_item(wheel), size=size)
+
+
+def main():
+    suite(harness.Benchmark())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Minimal timeit harness shared by the benchmark suites.
+
+A suite module provides a ``suite(bench)`` function, which registers its
+measurements with ``bench.measure``. ``run_all.py`` runs all suites and writes
+the results as JSON, so runs of different versions can be compared.
+"""
+
+import json
+import pathlib
+import platform
+import sys
+import time
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+import colorwheels  # pylint: disable=wrong-import-position
+from colorwheels import wheel_item  # pylint: disable=wrong-import-position
+
+REPEAT = 5
+
+
+class Benchmark:
+    """Collects measurements of one benchmark run"""
+
+    def __init__(self, quick=False, repeat=REPEAT):
+        self.quick = quick
+        self.repeat = 2 if quick else repeat
+        self.results = []
+
+    def measure(self, name, function, number=None, **params):
+        """Time function, and record the best time per call.
+
+        Parameters
+        ----------
+        name:
+            unique name of the measurement, e.g. "next/rgb_tuple"
+        function:
+            callable without arguments
+        number:
+            calls per repetition. Chosen by ``timeit`` if not given
+        params:
+            parameters of the measurement (sizes etc.), stored with the result
+
+        Returns
+        -------
+        float
+            best time per call in seconds
+        """
+
+        timer = timeit.Timer(function)
+        if number is None:
+            number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=self.repeat, number=number)) / number
+        return self.record(name, best, number=number, **params)
+
+    def record(self, name, seconds, number=1, **params):
+        """Record a measurement taken by the suite itself, e.g. in a
+        subprocess. Returns seconds."""
+
+        self.results.append({"name": name, "seconds": seconds, "number": number,
+                             "repeat": self.repeat, "params": params})
+        print(f"  {name:<40} {format_duration(seconds):>12}", flush=True)
+        return seconds
+
+    def metadata(self):
+        """Environment of the run"""
+
+        return {
+            "colorwheels": colorwheels.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": getattr(wheel_item.load_numpy(), "__version__", None),
+            "quick": self.quick,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+
+    def write(self, filename):
+        """Write metadata and results as JSON"""
+
+        with open(filename, "w") as stream:
+            json.dump({"meta": self.metadata(), "results": self.results}, stream, indent=2)
+
+
+def format_duration(seconds):
+    """Human readable duration"""
+
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e9:.1f} ns"
@@ -0,0 +1,79 @@
+"""Run all benchmark suites, and write the results as JSON.
+
+Covers package import time, the generator (``next`` per generator type, batches), the YAML loader
+(files of increasing size, lazy and preloaded, cached), wheel activation in
+large configurations, and palette generation and transforms. Runs offline,
+using the sources in ``src``.
+
+Run from the repository root::
+
+    python benchmarks/run_all.py [--quick] [--output results.json] [--compare old.json]
+
+``--compare`` prints the change of every measurement against an earlier result
+file, e.g. of the previous release. ``bench_threads.py`` is a stress test, and
+is run separately.
+"""
+
+import argparse
+import json
+
+import harness
+
+import bench_generator
+import bench_import
+import bench_loader
+import bench_wheels
+
+SUITES = {
+    "generator": bench_generator.suite,
+    "import": bench_import.suite,
+    "loader": bench_loader.suite,
+    "wheels": bench_wheels.suite,
+}
+
+
+def compare(results, filename):
+    """Print the change of every measurement against an earlier run"""
+
+    with open(filename) as stream:
+        previous = json.load(stream)
+    before = {result["name"]: result["seconds"] for result in previous["results"]}
+
+    print(f"\nCompared to {filename} (colorwheels {previous['meta']['colorwheels']})")
+    for result in results:
+        old = before.get(result["name"])
+        if old is None:
+            continue
+        change = (result["seconds"] / old - 1) * 100
+        print(f"  {result['name']:<40} {harness.format_duration(old):>12} "
+              f"{harness.format_duration(result['seconds']):>12} {change:>+8.1f} %")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run colorwheels benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help="smaller sizes and fewer repetitions")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="JSON result file (default: %(default)s)")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="earlier JSON result file to compare with")
+    parser.add_argument("suites", nargs="*", metavar="SUITE",
+                        help=f"suites to run: {', '.join(SUITES)} (default: all)")
+    args = parser.parse_args()
+    for name in args.suites:
+        if name not in SUITES:
+            parser.error(f"unknown suite '{name}'")
+
+    bench = harness.Benchmark(quick=args.quick)
+    for name in args.suites or SUITES:
+        print(name)
+        SUITES[name](bench)
+
+    bench.write(args.output)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(bench.results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
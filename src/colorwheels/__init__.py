@@ -1,6 +1,68 @@
+"""Colorwheels: endless color sequences for LEDs, terminals and GUIs.
+
+Submodules are imported on first use of one of their names (PEP 562), so
+``import colorwheels`` is fast, and short-lived programs only import what they
+use. Submodules themselves are imported on first attribute access as well,
+e.g. ``colorwheels.wheel_item``.
+"""
+
+import importlib
+
 from .config import __version__
-from .singleton import Singleton
-from .color_item import ColorItem
-from .wheel_item import WheelItem
-from .colorwheels_config import ColorwheelsConfig
-from .colorwheels import Colorwheels
+
+# public name -> submodule defining it
+_exports = {
+    "Singleton": "singleton",
+    "ColorItem": "color_item",
+    "FrozenColor": "color_item",
+    "ColorCorrection": "color_correction",
+    "WheelItem": "wheel_item",
+    "ColorwheelsConfig": "colorwheels_config",
+    "ColorwheelsContext": "colorwheels_config",
+    "Colorwheels": "colorwheels",
+    "register_generator_type": "colorwheels",
+    "ThreadSafeColorwheels": "thread_safe_colorwheels",
+    "PaletteWatcher": "palette_watcher",
+    "ColorStream": "color_stream",
+    "InterpolatedWheel": "interpolation",
+    "WheelGroup": "wheel_group",
+    "FrameRenderer": "frame_renderer",
+    "FrameWriter": "color_export",
+    "FrameReader": "color_export",
+    "RingBufferWriter": "color_export",
+    "RingBufferReader": "color_export",
+    "build_wheels": "wheel_builder",
+    "Metrics": "metrics",
+    "enable_metrics": "metrics",
+    "disable_metrics": "metrics",
+    "active_metrics": "metrics",
+}
+
+__all__ = ["__version__"] + list(_exports)
+
+def _import_submodule(name):
+    """Submodule name, or None if there is no such submodule"""
+
+    if name.startswith("__"):
+        return None
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        # a missing dependency of an existing submodule is an error
+        if error.name != f"{__name__}.{name}":
+            raise
+    return None
+
+def __getattr__(name):
+    module = _exports.get(name)
+    if module is None:
+        submodule = _import_submodule(name)
+        if submodule is None:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+        return submodule
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
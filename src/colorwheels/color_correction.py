@@ -0,0 +1,101 @@
+"""ColorCorrection is a dataclass describing an output correction stage for
+:doc:`colorwheels`: gamma correction, global brightness and color temperature.
+
+LED hardware rarely shows colors the way a screen does. A correction maps every
+color component through a precomputed 256-entry lookup table per channel, so
+correcting a whole wheel is a table translation, and the generator serves the
+corrected colors at no extra cost per color.
+
+The object contains the following values:
+
+* gamma: gamma exponent, one value for all channels or a (red, green, blue) tuple
+* brightness: global brightness factor, 0.0-1.0
+* temperature: (red, green, blue) factors, to warm up or cool down white
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Tuple, Union
+
+def _per_channel(values, name):
+    """Tuple of the red, green and blue value of a sequence"""
+
+    values = tuple(values)
+    if len(values) != 3:
+        raise ValueError(f"{name} requires 3 values, one per channel: {values}")
+    return values
+
+@dataclass(frozen=True)
+class ColorCorrection:
+    """Output correction of colors served by :doc:`colorwheels`.
+
+    A color component ``value`` of channel ``c`` becomes
+    ``255 * (value/255) ** gamma[c] * brightness * temperature[c]``, rounded
+    and limited to 0-255.
+
+    The object is immutable, use ``with_brightness`` (or
+    ``dataclasses.replace``) to derive a changed correction. Per channel
+    values can be given as any sequence of three numbers, e.g. a list read
+    from YAML or JSON, and are stored as tuples.
+
+    Raises
+    ------
+    ValueError
+        Raises ValueError exception if per channel values are not three
+    """
+
+    gamma: Union[float, Tuple[float, float, float]] = 1.0
+    brightness: float = 1.0
+    temperature: Tuple[float, float, float] = (1.0, 1.0, 1.0)
+    _luts: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen dataclass, normalize bypassing __setattr__
+        if not isinstance(self.gamma, (int, float)):
+            object.__setattr__(self, "gamma", _per_channel(self.gamma, "gamma"))
+        object.__setattr__(self, "temperature", _per_channel(self.temperature, "temperature"))
+
+    @property
+    def luts(self):
+        """Lookup tables of red, green and blue channel.
+
+        Returns
+        -------
+        tuple
+            Three ``bytes`` objects of 256 entries each
+        """
+
+        if self._luts is None:
+            gammas = self.gamma if isinstance(self.gamma, tuple) else (self.gamma,) * 3
+            luts = tuple(
+                bytes(min(255, max(0, int(round(
+                    255 * (value / 255) ** gamma * self.brightness * factor))))
+                      for value in range(256))
+                for gamma, factor in zip(gammas, self.temperature))
+            # frozen dataclass, cache the tables bypassing __setattr__
+            object.__setattr__(self, "_luts", luts)
+        return self._luts
+
+    @property
+    def is_identity(self):
+        """Indicates, if the correction leaves all colors unchanged"""
+
+        identity = bytes(range(256))
+        return all(lut == identity for lut in self.luts)
+
+    def with_brightness(self, brightness):
+        """Return a copy of the correction with a different brightness.
+
+        Only the 256-entry lookup tables are calculated again."""
+
+        return replace(self, brightness=brightness)
+
+    def apply(self, wheel):
+        """Correct all colors of a :doc:`wheel_item`.
+
+        Returns
+        -------
+        WheelItem
+            A new wheel item with corrected colors, under the same name
+        """
+
+        return wheel.apply_luts(self.luts, wheel.name)
@@ -0,0 +1,452 @@
+"""Export color frames to other processes: files, named pipes and shared memory.
+
+A producer process runs the :doc:`colorwheels` generators, consumer processes
+render the colors. Frames - ``frame_size`` consecutive colors of a generator,
+packed as RGB (3 bytes per color) or RGBA (4 bytes per color) - are exchanged
+in a fixed binary layout, without serializing single colors:
+
+* ``FrameWriter`` / ``FrameReader``: a stream of frames in a file or a named
+  pipe (FIFO). Files are memory-mapped by the reader, frames are read without
+  copying. Pipes are read into one reused buffer.
+* ``RingBufferWriter`` / ``RingBufferReader``: a ring buffer of frames in
+  shared memory (``multiprocessing.shared_memory``, Python 3.8+). The writer
+  never blocks, readers get frames without copying, and skip frames they were
+  too slow for.
+
+Stream layout (all integers little-endian): header of magic ``b"CWFS"``, format
+version (uint16), bytes per color (uint16), colors per frame (uint32), followed
+by the frames.
+
+Ring buffer layout: header of magic ``b"CWRB"``, format version (uint16), bytes
+per color (uint16), colors per frame (uint32), number of slots (uint32) and
+frames written (uint64), followed by the slots. Frame ``n`` is stored in slot
+``n % slots``. The writer fills a slot first, and then publishes it by
+incrementing the frame counter.
+"""
+
+import mmap
+import os
+import stat
+import struct
+
+STREAM_MAGIC = b"CWFS"
+RING_MAGIC = b"CWRB"
+VERSION = 1
+
+_STREAM_HEADER = struct.Struct("<4sHHI")
+_RING_HEADER = struct.Struct("<4sHHIIQ")
+# offset of the frames written counter in the ring buffer header
+_RING_COUNTER = struct.Struct("<Q")
+_RING_COUNTER_OFFSET = _RING_HEADER.size - _RING_COUNTER.size
+
+# bytes per color of generator types, which can be exported
+_CHANNELS = {"rgb_tuple": 3, "rgba_tuple": 4}
+
+# names of ring buffers created by this process
+_created = set()
+
+def _shared_memory():
+    """multiprocessing.shared_memory, imported on first use"""
+
+    try:
+        from multiprocessing import shared_memory # pylint: disable=import-outside-toplevel
+    except ImportError as exc: # Python 3.7
+        raise ImportError("Shared memory ring buffers require Python 3.8 or later") from exc
+    return shared_memory
+
+def _attach(name):
+    """Attach to an existing shared memory block, without taking ownership"""
+
+    shared_memory = _shared_memory()
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError: # before Python 3.13
+        memory = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and memory.name not in _created:
+            # attaching registers the block for removal, when this process exits
+            from multiprocessing import resource_tracker # pylint: disable=import-outside-toplevel
+            resource_tracker.unregister(memory._name, "shared_memory") # pylint: disable=protected-access
+        return memory
+
+def _check_layout(channels, frame_size):
+    if channels not in (3, 4):
+        raise ValueError("Frames must have 3 (RGB) or 4 (RGBA) bytes per color")
+    if frame_size < 1:
+        raise ValueError("Frames must contain at least one color")
+
+# -- Writers -----------------------------------------------------------------
+
+class _FrameSink:
+    """Common part of frame writers"""
+
+    channels = 3
+    frame_size = 1
+
+    @property
+    def frame_bytes(self):
+        """Size of a frame in bytes"""
+
+        return self.channels * self.frame_size
+
+    def write_frame(self, frame):
+        """Write one frame, a bytes-like object of ``frame_bytes`` bytes"""
+
+        raise NotImplementedError
+
+    def export(self, generator, frames=1):
+        """Write the next frames of a generator.
+
+        Colors are taken with ``next_batch`` into one reused buffer, i.e. the
+        generator continues after the exported colors.
+
+        Parameters
+        ----------
+        generator:
+            :doc:`colorwheels` generator with generator type "rgb_tuple" (3
+            bytes per color) or "rgba_tuple" (4 bytes per color)
+        frames:
+            number of frames to write
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if the generator type doesn't match
+            the bytes per color of the writer
+        """
+
+        generator_type = generator._generator_type
+        if _CHANNELS.get(generator_type) != self.channels:
+            raise ValueError(f"Generator type '{generator_type}' cannot be exported "
+                             f"with {self.channels} bytes per color")
+
+        buffer = bytearray(self.frame_bytes)
+        for _ in range(frames):
+            generator.next_batch(self.frame_size, out=buffer)
+            self.write_frame(buffer)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release resources of the writer"""
+
+class FrameWriter(_FrameSink):
+    """Writes frames to a file or named pipe"""
+
+    def __init__(self, target, frame_size, channels=3):
+        """Create a frame writer, and write the stream header.
+
+        Parameters
+        ----------
+        target:
+            file name, or a binary file object. Opening a named pipe blocks,
+            until a reader opens the other end
+        frame_size:
+            colors per frame
+        channels:
+            bytes per color, 3 (RGB) or 4 (RGBA)
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception for an invalid frame layout
+        """
+
+        _check_layout(channels, frame_size)
+        self.channels = channels
+        self.frame_size = frame_size
+        self._owned = not hasattr(target, "write")
+        self._stream = open(target, "wb") if self._owned else target
+        self._stream.write(_STREAM_HEADER.pack(STREAM_MAGIC, VERSION, channels, frame_size))
+        self.frames = 0
+
+    def write_frame(self, frame):
+        """Write one frame, a bytes-like object of ``frame_bytes`` bytes"""
+
+        if len(frame) != self.frame_bytes:
+            raise ValueError(f"Frames must contain {self.frame_bytes} bytes")
+        self._stream.write(frame)
+        self.frames += 1
+
+    def flush(self):
+        """Flush written frames to the file or pipe"""
+
+        self._stream.flush()
+
+    def close(self):
+        """Flush, and close the file if the writer opened it"""
+
+        if self._owned:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+class RingBufferWriter(_FrameSink):
+    """Writes frames to a ring buffer in shared memory"""
+
+    def __init__(self, frame_size, slots=8, channels=3, name=None):
+        """Create a shared memory ring buffer.
+
+        Parameters
+        ----------
+        frame_size:
+            colors per frame
+        slots:
+            number of frames in the ring. Readers lagging more than
+            ``slots - 1`` frames behind skip frames
+        channels:
+            bytes per color, 3 (RGB) or 4 (RGBA)
+        name:
+            name of the shared memory block. A unique name is generated, if
+            not provided. Readers attach with ``name``
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception for an invalid frame layout
+        """
+
+        _check_layout(channels, frame_size)
+        if slots < 2:
+            raise ValueError("A ring buffer needs at least 2 slots")
+        self.channels = channels
+        self.frame_size = frame_size
+        self.slots = slots
+
+        size = _RING_HEADER.size + slots * self.frame_bytes
+        self._memory = _shared_memory().SharedMemory(name=name, create=True, size=size)
+        self._buffer = self._memory.buf
+        _created.add(self._memory.name)
+        _RING_HEADER.pack_into(self._buffer, 0, RING_MAGIC, VERSION, channels,
+                               frame_size, slots, 0)
+        self.frames = 0
+
+    @property
+    def name(self):
+        """Name of the shared memory block, for readers"""
+
+        return self._memory.name
+
+    def write_frame(self, frame):
+        """Write one frame, a bytes-like object of ``frame_bytes`` bytes. The
+        oldest frame in the ring is overwritten."""
+
+        length = self.frame_bytes
+        if len(frame) != length:
+            raise ValueError(f"Frames must contain {length} bytes")
+        start = _RING_HEADER.size + (self.frames % self.slots) * length
+        self._buffer[start:start + length] = frame
+        self.frames += 1
+        _RING_COUNTER.pack_into(self._buffer, _RING_COUNTER_OFFSET, self.frames)
+
+    def close(self):
+        """Detach from, and remove the shared memory block. Attached readers
+        keep their mapping until they close."""
+
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+            self._memory.close()
+            self._memory.unlink()
+            _created.discard(self._memory.name)
+
+# -- Readers -----------------------------------------------------------------
+
+class FrameReader:
+    """Reads frames written by a ``FrameWriter`` from a file or named pipe.
+
+    Iterating yields frames as memoryviews. Frames of files are views of the
+    memory-mapped file. Frames of pipes are views of one buffer, which is
+    reused for the next frame - copy a frame to keep it.
+    """
+
+    def __init__(self, source):
+        """Open a frame stream, and read its header.
+
+        Parameters
+        ----------
+        source:
+            file name, or a binary file object
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if source is not a frame stream
+        """
+
+        self._owned = not hasattr(source, "read")
+        self._stream = open(source, "rb") if self._owned else source
+        header = self._stream.read(_STREAM_HEADER.size)
+        if len(header) < _STREAM_HEADER.size:
+            raise ValueError("Not a colorwheels frame stream, header incomplete")
+        magic, version, self.channels, self.frame_size = _STREAM_HEADER.unpack(header)
+        if magic != STREAM_MAGIC:
+            raise ValueError("Not a colorwheels frame stream")
+        if version > VERSION:
+            raise ValueError(f"Unsupported frame stream version {version}")
+        self.frame_bytes = self.channels * self.frame_size
+
+        self._map = None
+        self._view = None
+        if stat.S_ISREG(os.fstat(self._stream.fileno()).st_mode):
+            self._map = mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+            self._position = _STREAM_HEADER.size
+        else:
+            self._buffer = bytearray(self.frame_bytes)
+            self._view = memoryview(self._buffer)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        frame = self.read_frame()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def read_frame(self):
+        """Next frame as a memoryview, or None at the end of the stream.
+
+        A file still being written is mapped again when it has grown, so
+        calling ``read_frame`` after it returned None returns the frames
+        appended since."""
+
+        length = self.frame_bytes
+        if self._map is not None:
+            start = self._position
+            if start + length > len(self._map) and not self._remap(start + length):
+                return None
+            self._position = start + length
+            return self._view[start:start + length]
+
+        received = 0
+        while received < length:
+            count = self._stream.readinto(self._view[received:])
+            if not count:
+                return None # writer closed, a partial frame is dropped
+            received += count
+        return self._view
+
+    def _remap(self, required):
+        """Map the file again if it has grown to at least required bytes.
+        Returns True if it has."""
+
+        if os.fstat(self._stream.fileno()).st_size < required:
+            return False
+        # frames returned before keep the old mapping alive, until released
+        self._map = mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        return True
+
+    def close(self):
+        """Release the mapping, and close the file if the reader opened it.
+        Frames returned before must not be used any more."""
+
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._owned:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class RingBufferReader:
+    """Reads frames from a ``RingBufferWriter`` in another process.
+
+    Frames are memoryviews of the shared memory, i.e. not copied. A frame
+    stays valid until the writer wraps around the ring and overwrites it;
+    ``is_valid`` tells whether a frame is still intact after using it.
+    """
+
+    def __init__(self, name):
+        """Attach to a shared memory ring buffer.
+
+        Parameters
+        ----------
+        name:
+            name of the ring buffer, see ``RingBufferWriter.name``
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if the shared memory block is not a
+            ring buffer
+        """
+
+        self._memory = _attach(name)
+        self._buffer = self._memory.buf
+        magic, version, self.channels, self.frame_size, self.slots, written = \
+            _RING_HEADER.unpack_from(self._buffer, 0)
+        if magic != RING_MAGIC or version > VERSION:
+            self.close()
+            raise ValueError(f"Shared memory '{name}' is not a colorwheels ring buffer")
+        self.frame_bytes = self.channels * self.frame_size
+        # start at the newest frame
+        self.next_frame = max(0, written - 1)
+        self.frames_lost = 0
+
+    @property
+    def frames_written(self):
+        """Number of frames published by the writer"""
+
+        return _RING_COUNTER.unpack_from(self._buffer, _RING_COUNTER_OFFSET)[0]
+
+    def _frame(self, number):
+        start = _RING_HEADER.size + (number % self.slots) * self.frame_bytes
+        return self._buffer[start:start + self.frame_bytes]
+
+    def read_frame(self):
+        """Next frame in sequence as a memoryview, or None if the writer has
+        not published a new frame yet. Frames already overwritten are
+        skipped, and counted in ``frames_lost``."""
+
+        written = self.frames_written
+        if self.next_frame >= written:
+            return None
+        # the slot after the newest frame may be being written
+        oldest = written - self.slots + 1
+        if self.next_frame < oldest:
+            self.frames_lost += oldest - self.next_frame
+            self.next_frame = oldest
+        number = self.next_frame
+        self.next_frame += 1
+        return self._frame(number)
+
+    def latest(self):
+        """Newest frame as a memoryview, skipping frames not read yet, or None
+        if the writer has not published a new frame"""
+
+        written = self.frames_written
+        if self.next_frame >= written:
+            return None
+        self.frames_lost += written - 1 - self.next_frame
+        self.next_frame = written
+        return self._frame(written - 1)
+
+    def is_valid(self, number=None):
+        """True, if frame number (default: the last frame read) was not
+        overwritten by the writer yet"""
+
+        if number is None:
+            number = self.next_frame - 1
+        return number >= self.frames_written - self.slots + 1
+
+    def close(self):
+        """Detach from shared memory. Frames returned before must be released
+        (or no longer referenced)."""
+
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+            self._memory.close()
@@ -8,9 +8,28 @@ The object contains the following values:
 
 Further, color format conversions - in between RGB, RGBA (integer representation)
 and float representations - are provided.
+
+ColorItem keeps its components in slots instead of an instance dictionary. For
+colors which don't need to change, ``FrozenColor`` is an immutable, hashable
+and interned variant: every RGB value exists once, no matter how many wheels
+use it.
 """
 
-from dataclasses import dataclass
+import threading
+import weakref
+from dataclasses import FrozenInstanceError, dataclass
+
+def _min_max(a, b, c):
+    """Sum of the smallest and the largest of three values, used to find the
+    complementing color"""
+
+    if c < b:
+        b, c = c, b
+    if b < a:
+        a, b = b, a
+    if c < b:
+        b, c = c, b
+    return a + c
 
 @dataclass
 class ColorItem:
@@ -26,6 +45,8 @@ class ColorItem:
         blue color component. The native format is an integer 0-255
     """
 
+    __slots__ = ("red", "green", "blue")
+
     red: int
     green: int
     blue: int
@@ -67,19 +88,20 @@ class ColorItem:
             `(0, 255, 255)` - cyan.
         """
 
-        def min_max(a, b, c):
-            """inner function to find best delta for complementing color"""
+        k = _min_max(self.red, self.green, self.blue)
+        return ColorItem(k - self.red, k - self.green, k - self.blue)
 
-            if c < b:
-                b, c = c, b
-            if b < a:
-                a, b = b, a
-            if c < b:
-                b, c = c, b
-            return a + c
+    @property
+    def rgb24(self):
+        """Color packed to a 24 bit integer, ``0xRRGGBB``. Components must be
+        in the range 0-255"""
 
-        k = min_max(self.red, self.green, self.blue)
-        return ColorItem(k - self.red, k - self.green, k - self.blue)
+        return (self.red << 16) | (self.green << 8) | self.blue
+
+    def frozen(self):
+        """Return the interned, immutable ``FrozenColor`` of this color"""
+
+        return FrozenColor(self.red, self.green, self.blue)
 
     def from_float(self, colrgb):
         """Convert a float RGB tuple the native format (int tuple)
@@ -95,3 +117,130 @@ class ColorItem:
         self.red = int(255*colrgb[0])
         self.green = int(255*colrgb[1])
         self.blue = int(255*colrgb[2])
+
+class FrozenColor:
+    """Immutable, hashable and interned color.
+
+    ``FrozenColor(red, green, blue)`` returns the same object for the same RGB
+    value, as long as the color is in use, so a color used by many wheels is
+    stored once. Colors no longer referenced are freed. The ``color`` tuple
+    and the 24 bit ``rgb24`` value are computed once, the hex string on first
+    use. The read API is the same as for ``ColorItem``.
+
+    Parameters
+    ----------
+    red, green, blue
+        color components, integers 0-255
+
+    Raises
+    ------
+    ValueError
+        Raises ValueError exception if a component is outside 0-255
+    """
+
+    __slots__ = ("red", "green", "blue", "rgb24", "color", "_hex", "__weakref__")
+
+    # rgb24 value -> weak reference to the color. References of freed colors
+    # are swept, when the table reaches _sweep_size entries
+    _interned = dict()
+    _intern_lock = threading.Lock()
+    _sweep_size = 1024
+
+    def __new__(cls, red, green, blue):
+        red, green, blue = int(red), int(green), int(blue)
+        if not (0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255):
+            raise ValueError(f"Color components must be in range 0-255: {(red, green, blue)}")
+        rgb24 = (red << 16) | (green << 8) | blue
+        reference = cls._interned.get(rgb24)
+        color = reference() if reference is not None else None
+        if color is None:
+            color = cls._intern(red, green, blue, rgb24)
+        return color
+
+    @classmethod
+    def _intern(cls, red, green, blue, rgb24):
+        """Create and intern a color, unless another thread did meanwhile"""
+
+        with cls._intern_lock:
+            interned = cls._interned
+            reference = interned.get(rgb24)
+            color = reference() if reference is not None else None
+            if color is None:
+                color = object.__new__(cls)
+                setter = object.__setattr__
+                setter(color, "red", red)
+                setter(color, "green", green)
+                setter(color, "blue", blue)
+                setter(color, "rgb24", rgb24)
+                setter(color, "color", (red, green, blue))
+                setter(color, "_hex", None)
+                interned[rgb24] = weakref.ref(color)
+                if len(interned) >= cls._sweep_size:
+                    for key in [key for key, entry in interned.items() if entry() is None]:
+                        del interned[key]
+                    # sweep again when the table has doubled
+                    cls._sweep_size = max(1024, 2 * len(interned))
+        return color
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (type(self), self.color)
+
+    def __repr__(self):
+        return f"FrozenColor(red={self.red}, green={self.green}, blue={self.blue})"
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenColor):
+            return self is other
+        if isinstance(other, ColorItem):
+            return self.color == other.color
+        return NotImplemented
+
+    def __hash__(self):
+        return self.rgb24
+
+    @property
+    def color_hex(self):
+        """Return hexadecimal representation of color, see ``ColorItem``"""
+
+        hex_value = self._hex
+        if hex_value is None:
+            hex_value = f"#{self.rgb24:06x}"
+            object.__setattr__(self, "_hex", hex_value)
+        return hex_value
+
+    @property
+    def complement(self):
+        """Return complement (opposite) color, see ``ColorItem``"""
+
+        k = _min_max(self.red, self.green, self.blue)
+        return FrozenColor(k - self.red, k - self.green, k - self.blue)
+
+    def thawed(self):
+        """Return a mutable ``ColorItem`` with the same color"""
+
+        return ColorItem(self.red, self.green, self.blue)
+
+    @classmethod
+    def from_rgb24(cls, value):
+        """Color of a 24 bit integer, ``0xRRGGBB``"""
+
+        return cls((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
+
+    @classmethod
+    def from_float(cls, colrgb):
+        """Color of a float RGB tuple (0.0-1.0 per component), converted like
+        ``ColorItem.from_float``"""
+
+        return cls(int(255*colrgb[0]), int(255*colrgb[1]), int(255*colrgb[2]))
+
+    @classmethod
+    def interned_count(cls):
+        """Number of distinct colors in use"""
+
+        return sum(1 for reference in cls._interned.values() if reference() is not None)
@@ -0,0 +1,105 @@
+"""ColorStream serves colors of :doc:`colorwheels` generators to asyncio code, at
+a fixed frame rate.
+
+Looping over ``next(wheels)`` with ``time.sleep`` blocks an asyncio event loop.
+A ColorStream is an async iterator instead: it waits for the next frame without
+blocking, keeps the frame rate without drift (frame times are calculated from
+the start time, not by adding up sleeps), and counts frames it served late or
+had to skip, because the consumer was too slow.
+
+One stream can drive many generators - e.g. all LEDs of a panel - with one
+clock, so there's no need for a task per wheel, let alone per pixel.
+"""
+
+import asyncio
+
+class ColorStream:
+    """Async iterator of colors or frames, at a fixed rate.
+
+    Every iteration yields, for every generator, either the next color, or -
+    if ``frame_size`` is set - the next frame of ``frame_size`` colors (see
+    ``next_batch`` of :doc:`colorwheels`). With a single generator, the value is
+    yielded as it is, with a list of generators as a tuple of values.
+    """
+
+    def __init__(self, generators, rate, frame_size=None, max_frames=None):
+        """Create a stream.
+
+        Parameters
+        ----------
+        generators:
+            a :doc:`colorwheels` generator, or a list of generators
+        rate:
+            frames per second
+        frame_size:
+            number of colors per frame and generator. One color per generator,
+            if not provided. Frame buffers are reused, a frame is valid until
+            the next iteration
+        max_frames:
+            stop after this many frames. Endless, if not provided
+        """
+
+        if rate <= 0:
+            raise ValueError("Frame rate must be positive")
+
+        self._single = not isinstance(generators, (list, tuple))
+        self.generators = [generators] if self._single else list(generators)
+        self.period = 1.0 / rate
+        self.frame_size = frame_size
+        self.max_frames = max_frames
+
+        self.frames = 0
+        self.missed_deadlines = 0
+        self._tick = 0
+        self._start = None
+        self._buffers = [None] * len(self.generators)
+        self._stopped = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._stopped or (self.max_frames is not None and self.frames >= self.max_frames):
+            raise StopAsyncIteration
+
+        loop = asyncio.get_running_loop()
+        if self._start is None:
+            self._start = loop.time()
+        else:
+            self._tick += 1
+            deadline = self._start + self._tick * self.period
+            now = loop.time()
+            if now > deadline:
+                # this frame is late. If a full period or more, skip the frames
+                # whose time has passed as well, to stay on time
+                skipped = int((now - deadline) / self.period)
+                self.missed_deadlines += 1 + skipped
+                self._tick += skipped
+                deadline += skipped * self.period
+            if deadline > now:
+                await asyncio.sleep(deadline - now)
+
+        self.frames += 1
+        values = tuple(self._next_value(index) for index in range(len(self.generators)))
+        return values[0] if self._single else values
+
+    def _next_value(self, index):
+        """Next color, or next frame of a generator"""
+
+        generator = self.generators[index]
+        if self.frame_size is None:
+            return next(generator)
+
+        # frame buffers depend on generator type, which may change any time
+        generator_type, buffer = self._buffers[index] or (None, None)
+        if generator_type == generator._generator_type:
+            return generator.next_batch(self.frame_size, out=buffer)
+
+        buffer = generator.next_batch(self.frame_size)
+        self._buffers[index] = (generator._generator_type, buffer)
+        return buffer
+
+    def stop(self):
+        """Stop the stream. The running iteration ends after the current frame."""
+
+        self._stopped = True
@@ -4,15 +4,51 @@ in multiple formats. You can activate any available colorwheel anytime, to obtai
 different effects.
 """
 
+import collections
+import copy
 import logging
 
+from .color_correction import ColorCorrection
 from .colorwheels_config import ColorwheelsConfig
-from .wheel_item import WheelItem
+from .frame_renderer import FrameRenderer
+from .interpolation import InterpolatedWheel
+from .metrics import register_generator
+from .wheel_item import WheelItem, color_formats
 
 logger = logging.getLogger(__name__)
 
 generator_types = ["rgb_tuple", "rgba_tuple", "hexadecimal"]
 
+# corrected copies of recently active wheels kept per generator
+CORRECTED_CACHE_SIZE = 4
+
+def register_generator_type(name, converter):
+    """Register a custom generator type (output format).
+
+    Colors of every wheel are converted once, when a wheel is first used with
+    the new type. Serving a color costs the same as for the built-in types.
+
+    Parameters
+    ----------
+    name:
+        name of the new generator type, used with ``set_generator_type``
+    converter:
+        function converting one :doc:`color_item` to the value served by the
+        generator, e.g. ``lambda color: (color.green, color.red, color.blue)``
+        for GRB ordered LED strips
+
+    Raises
+    ------
+    ValueError
+        Raises ValueError exception if name is already registered
+    """
+
+    if name in generator_types:
+        raise ValueError(f"Generator type '{name}' already exists")
+
+    color_formats[name] = converter
+    generator_types.append(name)
+
 class Colorwheels():
     """Base class for returning color sequences.
 
@@ -24,7 +60,7 @@ class Colorwheels():
     examples.
     """
 
-    def __init__(self, add_base_colors=True):
+    def __init__(self, add_base_colors=True, context=None):
         """Create ``Colorwheels`` instance.
 
         wheel configurations is a :doc:`colorwheels_config` object (singleton), which
@@ -32,19 +68,28 @@ class Colorwheels():
         by code.
 
         A default configuration object is created (or inherited from other
-        parts of the code).
+        parts of the code), unless a ``ColorwheelsContext`` is passed as
+        ``context``. The generator then uses the wheels of this context only.
         """
 
         self.counter = 0
+        self._active_wheel = None
+        self._output_wheel = None
+        self._color_correction = None
+        self._corrected_wheels = collections.OrderedDict()
+        self._table = ()
+        self._table_size = 0
         self._generator_type = ""
         self.set_generator_type("rgb_tuple")
 
-        self._wheel_configurations = ColorwheelsConfig()
+        self._wheel_configurations = context if context is not None else ColorwheelsConfig()
+        self._wheel_configurations._attach_generator(self)
         if add_base_colors:
             self.wheel_configurations.add_base_colors()
 
         self.active_wheel = None
         self.activate_colorwheel(self._wheel_configurations.first_wheel.name)
+        register_generator(self)
 
     def __str__(self):
         return (f"Colorwheels - available: {len(self._wheel_configurations._wheel_items)}, "
@@ -58,11 +103,125 @@ class Colorwheels():
         You can manage the configurations from any Colorwheels instance used
         in your program. Handle with care! The configurator is a singleton, i.e.
         if you for example load a different set of colors, all running
-        generators will be affected.
+        generators will be affected - unless the generator was created with a
+        context of its own.
         """
 
         return self._wheel_configurations
 
+    @property
+    def active_wheel(self):
+        """Currently active :doc:`wheel_item`.
+
+        Assigning a wheel item activates it for the generator, without
+        resetting the counter.
+        """
+
+        return self._active_wheel
+
+    @active_wheel.setter
+    def active_wheel(self, wheel):
+        self._active_wheel = wheel
+        self._bind_table()
+
+    def _bind_table(self):
+        """Bind the color table of active wheel for current generator type.
+
+        The generator serves colors from the bound table, so this is called
+        whenever the wheel or the generator type changes. All ``next`` methods
+        serve the bound colors, until the table is bound again."""
+
+        wheel = self._active_wheel
+        if wheel is None or not self._generator_type:
+            self._output_wheel = None
+            self._table = ()
+            self._table_size = 0
+            return
+
+        self._output_wheel = self._corrected_wheel(wheel)
+        self._table = self._output_wheel.table(self._generator_type)
+        self._table_size = len(self._table)
+        if self.counter >= self._table_size:
+            # an empty wheel has no position but 0
+            self.counter = self.counter % self._table_size if self._table_size else 0
+
+    def _corrected_wheel(self, wheel):
+        """Return wheel with color correction applied. Corrected copies of the
+        last CORRECTED_CACHE_SIZE wheels are cached, until the correction or
+        the wheel colors change.
+
+        Without correction, a shallow copy of wheel is returned. It shares
+        colors and tables with wheel, but keeps the colors bound to the
+        generator if colors of wheel are replaced."""
+
+        if self._color_correction is None:
+            return copy.copy(wheel)
+
+        packed = wheel.packed
+        cache = self._corrected_wheels
+        cached = cache.get(id(wheel))
+        if cached is not None and cached[0] is wheel and cached[1] is packed:
+            cache.move_to_end(id(wheel))
+            return cached[2]
+
+        corrected = self._color_correction.apply(wheel)
+        cache[id(wheel)] = (wheel, packed, corrected)
+        cache.move_to_end(id(wheel))
+        while len(cache) > CORRECTED_CACHE_SIZE:
+            cache.popitem(last=False)
+        return corrected
+
+    @property
+    def color_correction(self):
+        """Output correction (:doc:`color_correction`) applied to served colors,
+        None if colors are served unchanged"""
+
+        return self._color_correction
+
+    def set_color_correction(self, correction):
+        """Set an output correction stage: gamma, brightness and color
+        temperature.
+
+        The active wheel is corrected once, via 256-entry lookup tables per
+        channel, and the corrected colors are served. Serving a color costs
+        the same as without correction.
+
+        Parameters
+        ----------
+        correction:
+            a :doc:`color_correction` object, or None to serve the wheel
+            colors unchanged
+        """
+
+        if correction is not None and correction.is_identity:
+            correction = None
+        self._color_correction = correction
+        self._corrected_wheels.clear()
+        self._bind_table()
+
+    def set_brightness(self, brightness):
+        """Change global brightness of served colors, 0.0-1.0.
+
+        Keeps gamma and color temperature of the current color correction.
+        Only the lookup tables are calculated again, wheel colors are not
+        changed.
+        """
+
+        correction = self._color_correction or ColorCorrection()
+        self.set_color_correction(correction.with_brightness(brightness))
+
+    def refresh(self):
+        """Rebind active wheel colors after its colors were replaced.
+
+        The generator keeps serving the colors the active wheel had when it
+        was activated. Call this after assigning new colors to the active
+        wheel item (``wheel.colors = colors``), or changing them with one of
+        its methods, e.g. ``generate_rainbow``, while the generator is in use.
+        The counter is kept, modulo the new wheel size.
+        """
+
+        self._bind_table()
+
     @property
     def active_colors(self):
         """Color list of active colorwheel.
@@ -88,24 +247,25 @@ class Colorwheels():
         """Return next color element. The return value depends on
         generator_type"""
 
-        if self._generator_type == "rgb_tuple":
-            return self.next()
-        if self._generator_type == "rgba_tuple":
-            return self.next_rgba()
-        if self._generator_type == "hexadecimal":
-            return self.next_hex()
+        # hot path: the table of active wheel in the generator type format is
+        # bound by set_generator_type / activate_colorwheel
+        index = self.counter
+        self.counter = index + 1 if index + 1 < self._table_size else 0
+        return self._table[index]
 
-        raise ValueError(f"Unknown generator type '{self._generator_type}'")
+    def _next_index(self):
+        """Returns the index of the next color in active ColorWheel, and
+        advances the counter"""
+
+        # this is the core method of all iterator flavors below
+        index = self.counter
+        self.counter = index + 1 if index + 1 < self._table_size else 0
+        return index
 
     def _next_color_item(self):
         """Returns a next ColorItem available in active ColorWheel"""
 
-        # this is the core method of all iterator flavors below
-        color = self.active_wheel.colors[self.counter]
-        self.counter += 1
-        if self.counter >= len(self.active_wheel.colors):
-            self.counter = 0
-        return color
+        return self._output_wheel.colors[self._next_index()]
 
     def next(self):
         """Get the next color from the ColorWheel as an RGB tuple
@@ -122,8 +282,7 @@ class Colorwheels():
         next_hex: Get the next color from ColorWheel as a hex string
         """
 
-        color = self._next_color_item()
-        return (color.red, color.green, color.blue)
+        return self._output_wheel.table("rgb_tuple")[self._next_index()]
 
     def next_rgba(self, alpha=255):
         """Get the next color from ColorWheel using RGBA
@@ -141,9 +300,9 @@ class Colorwheels():
         next_hex: Get the next color from ColorWheel as a hex string
         """
 
-        color = self.next()
-        color = color + (alpha,)
-        return color
+        if alpha == 255:
+            return self._output_wheel.table("rgba_tuple")[self._next_index()]
+        return self._output_wheel.table("rgb_tuple")[self._next_index()] + (alpha,)
 
     def next_hex(self):
         """Get the next color from ColorWheel as a hex string
@@ -159,13 +318,230 @@ class Colorwheels():
         next_rgba: Get the next color from ColorWheel using RGBA
         """
 
-        color = self.next()
-        return "#{:02x}{:02x}{:02x}".format(color[0], color[1], color[2])
+        return self._output_wheel.table("hexadecimal")[self._next_index()]
+
+    def next_batch(self, count, out=None, alpha=255):
+        """Get the next ``count`` colors from ColorWheel in one call.
+
+        The counter advances by ``count`` positions, wrapping around the end
+        of the wheel exactly as repeated ``next`` calls would. The return
+        value depends on generator_type:
+
+        * ``"rgb_tuple"``: a ``bytearray`` of packed RGB triplets (3 bytes per color)
+        * ``"rgba_tuple"``: a ``bytearray`` of packed RGBA quadruplets (4 bytes per color)
+        * ``"hexadecimal"``: a list of hex strings
+        * custom generator types: a list of values
+
+        Parameters
+        ----------
+        count:
+            number of colors to be returned
+        out:
+            optional buffer to write into, to avoid an allocation per frame.
+            Any writable buffer (``bytearray``, ``array('B')``, ``memoryview``)
+            of at least the required size works for the packed formats, a
+            list of at least ``count`` elements for other types
+        alpha:
+            alpha value used for ``"rgba_tuple"``
+
+        Returns
+        -------
+        bytearray, list or the supplied buffer
+            ``out`` is returned if supplied, otherwise a new buffer
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if ``out`` is too small
+        """
+
+        start = self.counter
+        if count and not self._table_size:
+            raise IndexError("Active wheel has no colors")
+        out = self._batch(self._generator_type, self._output_wheel, self._table,
+                          start, count, out, alpha)
+        self.counter = (start + count) % self._table_size if self._table_size else 0
+        return out
+
+    def _batch(self, generator_type, wheel, table, start, count, out, alpha):
+        """Fill a batch of colors from output wheel (and its table) in
+        generator_type format"""
+
+        if generator_type == "rgb_tuple":
+            return self._fill_batch(wheel.packed, start, count, 3, out)
+        if generator_type == "rgba_tuple":
+            return self._fill_batch(wheel.packed_rgba(alpha), start, count, 4, out)
+        return self._fill_batch(table, start, count, 1, out)
+
+    @staticmethod
+    def _fill_batch(table, start, count, width, out):
+        """Copy ``count`` entries of ``width`` elements from ``table``, starting at
+        entry ``start`` and wrapping around, into ``out`` (or a new buffer)"""
+
+        length = count * width
+        if out is None:
+            out = bytearray(length) if width > 1 else [None] * length
+        elif len(out) < length:
+            raise ValueError(f"Output buffer too small, {length} elements required")
+
+        # byte buffers are written through a flat memoryview, so that typed arrays
+        # (e.g. array('B')) and memoryviews can be used as targets
+        target = memoryview(out).cast("B") if width > 1 else out
+
+        table_length = len(table)
+        position = start * width
+        written = 0
+        while written < length:
+            chunk = min(table_length - position, length - written)
+            target[written:written + chunk] = table[position:position + chunk]
+            written += chunk
+            position = 0
+        return out
+
+    def seek(self, position):
+        """Move the counter to position, i.e. the next color served is the
+        color at position (modulo wheel size). On an empty wheel, the counter
+        stays at 0"""
+
+        self.counter = position % self._table_size if self._table_size else 0
+
+    def skip(self, count=1):
+        """Move the counter ``count`` colors forward (or backward, if count is
+        negative), without serving colors. Resyncs a generator after dropped
+        frames in O(1)."""
+
+        if self._table_size:
+            self.counter = (self.counter + count) % self._table_size
+
+    def peek(self, offset=0):
+        """Return the color ``offset`` steps ahead of the next color, without
+        moving the counter. ``peek()`` returns the color ``next`` would return.
+        The return value depends on generator_type
+
+        Raises
+        ------
+        IndexError
+            Raises IndexError exception if the active wheel has no colors
+        """
+
+        if not self._table_size:
+            raise IndexError("Active wheel has no colors")
+        return self._table[(self.counter + offset) % self._table_size]
+
+    def previous(self):
+        """Step backwards: move the counter back by one color and return that
+        color. ``previous`` after ``next`` returns the same color again. The
+        return value depends on generator_type
+
+        Raises
+        ------
+        IndexError
+            Raises IndexError exception if the active wheel has no colors
+        """
+
+        if not self._table_size:
+            raise IndexError("Active wheel has no colors")
+        index = (self.counter - 1) % self._table_size
+        self.counter = index
+        return self._table[index]
+
+    def color_at(self, step, generator_type=None):
+        """Return the color at step of active wheel, without using or moving
+        the counter.
+
+        Consumers computing the color for a frame or time step ``t`` can share
+        one generator this way, without sharing a cursor.
+
+        Parameters
+        ----------
+        step:
+            any integer, taken modulo wheel size
+        generator_type:
+            output format, one of generator_types. Defaults to the generator
+            type of the generator
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if generator_type is not available
+        IndexError
+            Raises IndexError exception if the active wheel has no colors
+        """
+
+        if generator_type is None:
+            table = self._table
+        elif generator_type in generator_types:
+            table = self._output_wheel.table(generator_type)
+        else:
+            raise ValueError(f"Unknown generator type '{generator_type}'")
+        if not table:
+            raise IndexError("Active wheel has no colors")
+        return table[step % len(table)]
+
+    def interpolated(self, steps=16, space="rgb"):
+        """Smooth fades between the colors of active wheel.
+
+        Returns a :doc:`interpolation` generator, which serves ``steps`` colors
+        blended in between each two neighboring colors of the active wheel (with
+        color correction applied). A small palette with interpolation replaces
+        a huge generated wheel.
+
+        Parameters
+        ----------
+        steps:
+            number of colors served per wheel color
+        space:
+            "rgb" or "linear", see :doc:`interpolation`
+        """
+
+        return InterpolatedWheel(self._output_wheel, steps, space)
+
+    def stream(self, rate, frame_size=None, max_frames=None):
+        """Serve colors to asyncio code at a fixed frame rate.
+
+        Returns a :doc:`color_stream` async iterator, yielding the next color -
+        or the next frame of ``frame_size`` colors - every ``1/rate`` seconds:
+
+        .. code-block:: python
+
+            async for color in wheels.stream(rate=30):
+                # apply color to button / LED etc.
+
+        See Also
+        --------
+        next_batch: Get the next colors from ColorWheel in one call
+        """
+
+        # asyncio is imported only by programs streaming colors
+        from .color_stream import ColorStream # pylint: disable=import-outside-toplevel
+        return ColorStream(self, rate, frame_size, max_frames)
+
+    def frame_renderer(self, width, height=1, **options):
+        """Render strip or matrix frames from active wheel.
+
+        Returns a :doc:`frame_renderer`, which fills a ``width`` x ``height``
+        frame per call with index arithmetic over the active wheel (with color
+        correction applied), starting at the current counter.
+
+        Parameters
+        ----------
+        width, height:
+            frame size in pixels. Strips have height 1
+        options:
+            spacing, direction, speed, offset, row_offset and serpentine, see
+            :doc:`frame_renderer`
+        """
+
+        return FrameRenderer(self, width, height, **options)
 
     def set_generator_type(self, new_type):
         """
         Set the generator type to a value out of generator_types.
 
+        The color table of the active wheel in the new format is bound to the
+        generator, so serving a color is a single table read. Custom types can
+        be added with ``register_generator_type``.
+
         Raises
         ------
         ValueError
@@ -177,22 +553,33 @@ class Colorwheels():
 
         if new_type != self._generator_type:
             self._generator_type = new_type
+            self._bind_table()
             logger.info("Setting generator type to '%s'", self._generator_type)
 
-    def activate_colorwheel(self, name):
+    def activate_colorwheel(self, name, keep_cursor=False):
         """Activates colorwheel by name, from configuration file. Sets
         active_wheel with new setting.
 
+        Parameters
+        ----------
+        name:
+            name of the wheel
+        keep_cursor:
+            if True, the counter is kept (modulo the size of the new wheel),
+            otherwise the new wheel starts at its first color
+
         Raises
         ------
         ValueError
             Raises ValueError exception if name is not found
         """
 
-        self.counter = 0 # always reset counter
-        self.active_wheel = self._wheel_configurations.find_wheel(name)
+        wheel = self._wheel_configurations.find_wheel(name)
 
-        if self.active_wheel is not None:
+        if wheel is not None:
+            if not keep_cursor:
+                self.counter = 0
+            self.active_wheel = wheel
             logger.info("Activating wheel '%s'", name)
         else:
             message = f"Wheel '{name}' cannot be activated. Not found"
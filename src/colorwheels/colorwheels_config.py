@@ -1,21 +1,64 @@
 """ColorwheelsConfig is a configuration helper for :doc:`colorwheels`, implemented
 as a singleton.
 
-The helper loads a configuration YAML file and serves the colors by name to
-a Colorwheels generator."""
-
+The helper loads a configuration YAML file (or a compiled binary palette file)
+and serves the colors by name to a Colorwheels generator.
+
+ColorwheelsContext is the same helper as an ordinary class: every instance is
+an independent, scoped configuration, which can be handed to Colorwheels
+generators instead of the global singleton.
+
+Generators read the set of wheels of a configuration without locking. Wheels
+are added to the set in place, as adding a dictionary entry is atomic. Other
+changes (removing, renaming, loading wheels) build a new set and publish it
+with one assignment, so generators never see a half loaded set of wheels."""
+
+import functools
+import glob
+import hashlib
+import json
 import logging
-
-import yaml
+import os
+import threading
+import time
+import weakref
 
 from .singleton import Singleton
 from .color_item import ColorItem
-from .wheel_item import WheelItem
+from .wheel_item import WheelItem, rainbow_defaults
+from .palette_file import PaletteFile, save_palette
+from .metrics import active_metrics
 
 logger = logging.getLogger(__name__)
 
-class ColorwheelsConfig(metaclass=Singleton):
-    """Configuration helper for :doc:`colorwheels`."""
+def _is_number(value):
+    """True for ints and floats of definition files. YAML booleans are not
+    numbers"""
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# YAML loader, set on first load. PyYAML is imported only when definition files
+# are loaded, programs using generated wheels don't pay for importing it
+_YamlLoader = None
+
+def _load_yaml(stream):
+    """Parse a YAML definition file"""
+
+    global _YamlLoader # pylint: disable=global-statement
+    import yaml # pylint: disable=import-outside-toplevel
+    if _YamlLoader is None:
+        # libyaml based loader is much faster, if PyYAML was built with it
+        _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=_YamlLoader)
+
+def _digest(definition):
+    """Digest of the YAML definition of one wheel, to detect changed wheels"""
+
+    text = json.dumps(definition, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+class ColorwheelsContext:
+    """Scoped configuration helper for :doc:`colorwheels`."""
 
     def __init__(self):
         """ Initialize configuration helper for :doc:`colorwheels`.
@@ -27,11 +70,22 @@ class ColorwheelsConfig(metaclass=Singleton):
         under the wheel name 'default'. This is equivalent to an RGB
         definition."""
 
-        self._wheel_items = list() # list of WheelItem objects
+        # WheelItem objects by name. Dictionaries keep insertion order, which
+        # is the order of wheel definitions. Wheels not used yet may be stored
+        # as a function creating the WheelItem, see find_wheel.
+        # Entries are only added in place, other changes publish a new one
+        self._wheel_items = dict()
+        # digests of the YAML definitions of loaded wheels by name, to detect
+        # changed wheels on reload
+        self._definitions = dict()
+        # serializes changes. Readers never lock
+        self._write_lock = threading.RLock()
+        # generators using this configuration, see reload_wheels
+        self._generators = weakref.WeakSet()
 
         self.release = "unknown"
 
-        self._wheel_items.append(
+        self.add_wheel_item(
             WheelItem("default", [
                 ColorItem(255, 0, 0),
                 ColorItem(0, 255, 0),
@@ -40,7 +94,7 @@ class ColorwheelsConfig(metaclass=Singleton):
     def __str__(self):
         """Show humanly readable configuration summary"""
 
-        return f"ColorwheelsConfig: {len(self._wheel_items)} wheel definitions"
+        return f"{type(self).__name__}: {len(self._wheel_items)} wheel definitions"
 
 # -- Configuration Handling --------------------------------------------------
 
@@ -49,22 +103,39 @@ class ColorwheelsConfig(metaclass=Singleton):
         """Get the first wheel available"""
 
         # should be always available.... no need to raise
-        return self._wheel_items[0]
+        items = self._wheel_items
+        return self._resolve(items, next(iter(items)))
 
     def find_wheel(self, name):
-        """Find wheelitem by name. None if not found"""
+        """Find wheelitem by name. None if not found
 
-        items = [item for item in self._wheel_items if item.name == name]
-        return items[0] if items else None
+        Wheels loaded lazily are created on first use."""
+
+        return self._resolve(self._wheel_items, name)
+
+    def _resolve(self, items, name):
+        """Find wheelitem by name in a set of wheels, and create it if it was
+        loaded lazily"""
+
+        item = items.get(name)
+        if item is None or isinstance(item, WheelItem):
+            return item
+
+        # the created wheel replaces its factory in the same set, even if a
+        # newer set of wheels was published meanwhile. Created under the lock,
+        # so concurrent readers all get the same wheel object
+        with self._write_lock:
+            item = items[name]
+            if not isinstance(item, WheelItem):
+                item = item()
+                items[name] = item
+        return item
 
     @property
     def wheel_names(self):
         """Return list of wheel names available in configuration"""
 
-        names = list()
-        for wheel in self._wheel_items:
-            names.append(wheel.name)
-        return names
+        return list(self._wheel_items)
 
     def add_wheel_item(self, item):
         """Adds a :doc:`wheel_item` to definitions list.
@@ -81,13 +152,87 @@ class ColorwheelsConfig(metaclass=Singleton):
             Raises error if item name already exists
         """
 
-        if not isinstance(item, WheelItem):
-            raise ValueError("cannot add object. Not of type WheelItem")
+        self.add_wheel_items([item])
 
-        if self.find_wheel(item.name) is None:
-            self._wheel_items.append(item)
-        else:
-            raise ValueError("Item '%s' cannot be added. Already exists" % item.name)
+    def add_wheel_items(self, items):
+        """Adds several :doc:`wheel_item` objects to definitions list at once.
+
+        Items are validated before any of them is added, so either all items
+        are added, or none.
+
+        Parameters
+        ----------
+        items:
+            An iterable of :doc:`wheel_item` objects
+
+        Raises
+        ------
+        ValueError
+            Raises error if an item name already exists, or is duplicated in
+            items
+        """
+
+        items = list(items)
+        with self._write_lock:
+            wheel_items = self._wheel_items
+            names = set()
+            for item in items:
+                if not isinstance(item, WheelItem):
+                    raise ValueError("cannot add object. Not of type WheelItem")
+                if item.name in wheel_items or item.name in names:
+                    raise ValueError("Item '%s' cannot be added. Already exists" % item.name)
+                names.add(item.name)
+
+            # readers never see a half added entry, no copy needed
+            for item in items:
+                wheel_items[item.name] = item
+
+    def remove_wheel(self, name):
+        """Removes a :doc:`wheel_item` from definitions list, and returns it.
+
+        Colorwheels generators, which have the wheel active, keep using it.
+
+        Raises
+        ------
+        ValueError
+            Raises error if name is not found, or if it is the last wheel
+            available
+        """
+
+        with self._write_lock:
+            if name not in self._wheel_items:
+                raise ValueError(f"Item '{name}' cannot be removed. Not found")
+            if len(self._wheel_items) == 1:
+                raise ValueError(f"Item '{name}' cannot be removed. Last wheel available")
+
+            item = self.find_wheel(name)
+            self._wheel_items = {
+                key: value for key, value in self._wheel_items.items() if key != name}
+            return item
+
+    def rename_wheel(self, name, new_name):
+        """Renames a :doc:`wheel_item`, keeping its position in definitions list.
+
+        The renamed wheel is a new wheel item with the same colors. Generators,
+        which have the wheel active, keep using it under its old name.
+
+        Raises
+        ------
+        ValueError
+            Raises error if name is not found, or new_name already exists
+        """
+
+        with self._write_lock:
+            if name not in self._wheel_items:
+                raise ValueError(f"Item '{name}' cannot be renamed. Not found")
+            if new_name in self._wheel_items:
+                raise ValueError(f"Item '{new_name}' cannot be added. Already exists")
+
+            item = self.find_wheel(name)
+            renamed = type(item)(new_name, item.colors)
+            self._wheel_items = {
+                (new_name if key == name else key): (renamed if key == name else value)
+                for key, value in self._wheel_items.items()}
 
     def create_wheel_item(self, name, colors):
         """Create a :doc:`wheel_item` from parts. Function returns the created item
@@ -103,6 +248,44 @@ class ColorwheelsConfig(metaclass=Singleton):
         new_item = WheelItem(name=name, colors=colors)
         return new_item
 
+    def generate_wheels(self, specs, processes=None):
+        """Generate rainbow wheels in worker processes, and add them in one
+        batch (see ``add_wheel_items``).
+
+        Parameters
+        ----------
+            specs:
+                iterable of dictionaries with the fields of a YAML rainbow
+                wheel: ``name``, ``size``, ``amplitude``, ``center`` and
+                ``frequency``. See :doc:`wheel_builder`
+            processes:
+                number of worker processes. Defaults to the number of CPUs
+
+        Returns
+        -------
+        list
+            the added :doc:`wheel_item` objects
+
+        Raises
+        ------
+        ValueError
+            Raises error for invalid specs, or if a name already exists
+        """
+
+        # process pools are only needed here, don't import them with the package
+        from .wheel_builder import build_wheels # pylint: disable=import-outside-toplevel
+
+        specs = list(specs)
+        for spec in specs:
+            name = spec.get("wheel", spec).get("name")
+            if name in self._wheel_items:
+                # fail before generating anything
+                raise ValueError("Item '%s' cannot be added. Already exists" % name)
+
+        wheel_items = build_wheels(specs, processes)
+        self.add_wheel_items(wheel_items)
+        return wheel_items
+
 # -- Loading Configuration ---------------------------------------------------
 
     def add_base_colors(self):
@@ -120,30 +303,45 @@ class ColorwheelsConfig(metaclass=Singleton):
         """
 
         logger.info("Adding base colors")
-        if self.find_wheel("red") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("red", [ColorItem(red=255, green=0, blue=0)]))
-        if self.find_wheel("green") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("green", [ColorItem(red=0, green=255, blue=0)]))
-        if self.find_wheel("blue") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("blue", [ColorItem(red=0, green=0, blue=255)]))
-        if self.find_wheel("cyan") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("cyan", [ColorItem(red=0, green=255, blue=255)]))
-        if self.find_wheel("magenta") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("magenta", [ColorItem(red=255, green=0, blue=255)]))
-        if self.find_wheel("yellow") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("yellow", [ColorItem(red=255, green=255, blue=0)]))
-        if self.find_wheel("black") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("black", [ColorItem(red=0, green=0, blue=0)]))
-        if self.find_wheel("white") is None:
-            self.add_wheel_item(
-                self.create_wheel_item("white", [ColorItem(red=255, green=255, blue=255)]))
+        with self._write_lock:
+            self.add_wheel_items(self._base_color_items(self._wheel_items))
+
+    def _base_color_items(self, wheel_items):
+        """Create base color wheel items missing in a set of wheels"""
+
+        base_colors = {
+            "red": (255, 0, 0),
+            "green": (0, 255, 0),
+            "blue": (0, 0, 255),
+            "cyan": (0, 255, 255),
+            "magenta": (255, 0, 255),
+            "yellow": (255, 255, 0),
+            "black": (0, 0, 0),
+            "white": (255, 255, 255),
+        }
+        return [self.create_wheel_item(name, [ColorItem(*rgb)])
+                for name, rgb in base_colors.items()
+                if name not in wheel_items]
+
+    def _publish(self, wheel_items, release, add_base_colors, definitions=None):
+        """Replace all wheels with a new set of wheels, at once"""
+
+        if add_base_colors:
+            logger.info("Adding base colors")
+            for item in self._base_color_items(wheel_items):
+                wheel_items[item.name] = item
+
+        with self._write_lock:
+            self.release = release
+            self._definitions = definitions if definitions is not None else dict()
+            self._wheel_items = wheel_items
+        self._check_release()
+
+    def _attach_generator(self, generator):
+        """Register a Colorwheels generator using this configuration. Its active
+        wheel is updated, when the wheel is changed by ``reload_wheels``"""
+
+        self._generators.add(generator)
 
     def _check_release(self):
         """Validate the version of the configuration file."""
@@ -151,8 +349,85 @@ class ColorwheelsConfig(metaclass=Singleton):
         # First version doesn't need any validation. Reserved for future
         logger.info("Color definition file is at version '%s'", self.release)
 
+    @staticmethod
+    def _create_wheel_item(definition):
+        """Convert the yaml definition of one wheel to a wheel item
+
+        Parameters
+        ----------
+            definition:
+                content of one *wheel* element (dictionary). See
+                :doc:`yaml_definitions`
+        """
+
+        color_list = list()
+
+        name = definition["name"]
+        element_type = definition["type"] if "type" in definition else "sequence"
+
+        if element_type == "sequence":
+            for color_def in definition["colors"]:
+                col = ColorItem(color_def["rgb"][0], color_def["rgb"][1], color_def["rgb"][2])
+                color_list.append(col)
+
+            return WheelItem(name, color_list)
+
+        if element_type == "rainbow":
+            new_def = WheelItem(name, color_list)
+            # Read rainbow parameters and use sensible defaults if not available
+            parameters = {key: definition.get(key, default)
+                          for key, default in rainbow_defaults.items()}
+            new_def.generate_rainbow(**parameters)
+
+            return new_def
+
+        raise ValueError(f"Unknown wheel type {element_type}")
+
+    @staticmethod
+    def _validate_definition(definition):
+        """Check the fields required by the type of one wheel definition.
+        Returns the name of the wheel.
+
+        Raises
+        ------
+            ValueError:
+                If a required field is missing or malformed
+        """
+
+        if not isinstance(definition, dict) or "name" not in definition:
+            raise ValueError(f"Wheel definition without name: {definition}")
+        name = definition["name"]
+        element_type = definition["type"] if "type" in definition else "sequence"
+
+        if element_type == "sequence":
+            colors = definition.get("colors")
+            if not isinstance(colors, list):
+                raise ValueError(f"Wheel '{name}' of type sequence has no list of colors")
+            for color_def in colors:
+                rgb = color_def.get("rgb") if isinstance(color_def, dict) else None
+                if not isinstance(rgb, list) or len(rgb) != 3:
+                    raise ValueError(f"Wheel '{name}' has a color without rgb value: {color_def}")
+                if not all(_is_number(component) for component in rgb):
+                    raise ValueError(f"Wheel '{name}' has a color with non-numeric rgb value: "
+                                     f"{color_def}")
+        elif element_type == "rainbow":
+            size = definition.get("size", rainbow_defaults["size"])
+            if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+                raise ValueError(f"Wheel '{name}' has an invalid size: {size!r}")
+            for key in ("amplitude", "center", "frequency"):
+                if not _is_number(definition.get(key, rainbow_defaults[key])):
+                    raise ValueError(f"Wheel '{name}' has a non-numeric {key}: "
+                                     f"{definition[key]!r}")
+        else:
+            raise ValueError(f"Unknown wheel type {element_type}")
+
+        return name
+
     def _create_wheel_items(self, yaml_data):
-        """Convert yaml data to wheel items
+        """Convert yaml data to wheel items. Returns the new set of wheels.
+
+        Wheel definitions are validated, but the colors of a wheel are created
+        on first use of the wheel (see ``find_wheel`` and ``preload``).
 
         Parameters
         ----------
@@ -161,47 +436,39 @@ class ColorwheelsConfig(metaclass=Singleton):
                 :doc:`yaml_definitions`
         """
 
-        self._wheel_items.clear()
-
-        # handle metadata
-        self.release = yaml_data["meta"]["release"]
-        self._check_release()
-
         # handle wheel elements
+        sources = dict()
         for wheel_def in yaml_data["wheels"]:
+            if not isinstance(wheel_def, dict) or "wheel" not in wheel_def:
+                raise ValueError(f"Element of wheels is not a wheel: {wheel_def}")
+            definition = wheel_def["wheel"]
+            name = self._validate_definition(definition)
+            if name in sources:
+                raise ValueError("Item '%s' cannot be added. Already exists" % name)
+
+            sources[name] = functools.partial(self._create_wheel_item, definition)
+
+        return sources
+
+    def preload(self, names=None):
+        """Create wheels loaded lazily now, instead of on first use.
+
+        Parameters
+        ----------
+            names:
+                names of wheels to be created. All wheels, if not provided
+
+        Raises
+        ------
+        ValueError
+            Raises error if a name is not found
+        """
+
+        for name in (self.wheel_names if names is None else names):
+            if self.find_wheel(name) is None:
+                raise ValueError(f"Wheel '{name}' cannot be preloaded. Not found")
 
-            color_list = list()
-
-            name = wheel_def["wheel"]["name"]
-            element_type = wheel_def["wheel"]["type"] \
-                if "type" in wheel_def["wheel"] else "sequence"
-
-            if element_type == "sequence":
-                for color_def in wheel_def["wheel"]["colors"]:
-                    col = ColorItem(color_def["rgb"][0], color_def["rgb"][1], color_def["rgb"][2])
-                    color_list.append(col)
-
-                new_def = WheelItem(name, color_list)
-                self.add_wheel_item(new_def)
-
-            elif element_type == "rainbow":
-                new_def = WheelItem(name, color_list)
-                # Read rainbow parameters and use sensible defaults if not available
-                rainb_size = wheel_def["wheel"]["size"] \
-                    if "size" in wheel_def["wheel"] else 32
-                rainb_amplitude = wheel_def["wheel"]["amplitude"] \
-                    if "amplitude" in wheel_def["wheel"] else 127
-                rainb_center = wheel_def["wheel"]["center"] \
-                    if "center" in wheel_def["wheel"] else 128
-                rainb_frequency = wheel_def["wheel"]["frequency"] \
-                    if "frequency" in wheel_def["wheel"] else 0.3
-                new_def.generate_rainbow(rainb_size, rainb_amplitude, rainb_center, rainb_frequency)
-
-                self.add_wheel_item(new_def)
-            else:
-                raise ValueError(f"Unknown wheel type {element_type}")
-
-    def load_wheels(self, filename, add_base_colors=True):
+    def load_wheels(self, filename, add_base_colors=True, cache_dir=None):
         """loads YAML color definition file. The loaded file is converted to a list of
         :doc:`wheel_item` objects.
 
@@ -212,6 +479,10 @@ class ColorwheelsConfig(metaclass=Singleton):
         ----------
             filename: filename of file containing color definitions in YAML format. See
                 :doc:`yaml_definitions` for more details
+            cache_dir: optional directory for compiled definitions. The first load of a
+                file stores its wheels as a :doc:`palette_file` in the directory, and as
+                long as the definition file is unchanged (same path, modification time
+                and size), later loads use the palette file and skip YAML parsing
 
         Raises
         ------
@@ -219,19 +490,229 @@ class ColorwheelsConfig(metaclass=Singleton):
                 If file is not found on system
             YAMLError:
                 If file is a wrongly formatted YAML file
+            ValueError:
+                If a wheel definition is invalid, e.g. misses its colors
         """
 
+        metrics = active_metrics()
+        start = time.perf_counter() if metrics is not None else 0.0
         try:
+            cache_file = self._cache_file(filename, cache_dir) if cache_dir else None
+            if cache_file and os.path.exists(cache_file):
+                logger.info("Loading '%s' from cache '%s'", filename, cache_file)
+                self._load_palette(cache_file, add_base_colors,
+                                   self._read_cached_definitions(cache_file))
+                if metrics is not None:
+                    metrics.record_cache(True, filename)
+                    metrics.record_duration("load_wheels", time.perf_counter() - start,
+                                            filename=filename)
+                return
+            if cache_file and metrics is not None:
+                metrics.record_cache(False, filename)
+
+            import yaml # pylint: disable=import-outside-toplevel
             with open(filename, 'r') as stream:
                 try:
-                    yml = yaml.safe_load(stream)
-                    self._create_wheel_items(yml)
-                    if add_base_colors:
-                        self.add_base_colors()
+                    yml = _load_yaml(stream)
+                    if metrics is not None:
+                        metrics.record_duration("parse", time.perf_counter() - start,
+                                                filename=filename)
+                    wheel_items = self._create_wheel_items(yml)
+                    # handle metadata
+                    release = yml["meta"]["release"]
+                    # before writing the cache, which creates the wheels
+                    definitions = {name: _digest(source.args[0])
+                                   for name, source in wheel_items.items()}
+                    if cache_file:
+                        self._write_cache(cache_file, wheel_items, release, definitions)
+                    self._publish(wheel_items, release, add_base_colors, definitions)
                 except yaml.YAMLError as exc:
                     logger.fatal("Loading configuration file '%s' failed: %s", filename, exc)
                     raise exc
 
+            if metrics is not None:
+                metrics.record_duration("load_wheels", time.perf_counter() - start,
+                                        filename=filename)
+
         except FileNotFoundError as exc:
             logger.fatal("File '%s' not found ...", filename)
             raise exc
+
+    def reload_wheels(self, filename, add_base_colors=True):
+        """reloads a changed YAML color definition file, without interrupting
+        running generators.
+
+        Wheels with unchanged definitions are kept as they are. Changed wheels
+        are created again, and Colorwheels generators using this configuration,
+        which have a changed wheel active, continue on the new wheel at the same
+        position. Generators on removed wheels keep their current wheel.
+
+        Parameters
+        ----------
+            filename: filename of file containing color definitions in YAML format
+
+        Returns
+        -------
+        list
+            names of changed wheels
+
+        Raises
+        ------
+            FileNotFoundError:
+                If file is not found on system
+            YAMLError:
+                If file is a wrongly formatted YAML file
+            ValueError:
+                If a wheel definition is invalid, e.g. misses its colors
+        """
+
+        metrics = active_metrics()
+        start = time.perf_counter() if metrics is not None else 0.0
+        with open(filename, 'r') as stream:
+            yml = _load_yaml(stream)
+        if metrics is not None:
+            metrics.record_duration("parse", time.perf_counter() - start, filename=filename)
+        wheel_items = self._create_wheel_items(yml)
+        definitions = {name: _digest(source.args[0]) for name, source in wheel_items.items()}
+
+        with self._write_lock:
+            old_items = self._wheel_items
+            changed = list()
+            for name, definition in definitions.items():
+                if name in old_items and self._definitions.get(name) == definition:
+                    wheel_items[name] = old_items[name]
+                elif name in old_items:
+                    changed.append(name)
+            self._publish(wheel_items, yml["meta"]["release"], add_base_colors, definitions)
+
+        logger.info("Reloaded '%s', changed wheels: %s", filename, changed)
+        changed_names = set(changed)
+        for generator in list(self._generators):
+            wheel = generator.active_wheel
+            if (wheel is not None and wheel.name in changed_names
+                    and old_items.get(wheel.name) is wheel):
+                generator.active_wheel = self.find_wheel(wheel.name)
+
+        if metrics is not None:
+            metrics.record_duration("reload_wheels", time.perf_counter() - start,
+                                    filename=filename)
+        return changed
+
+    @staticmethod
+    def _cache_file(filename, cache_dir):
+        """Name of the cache file of a definition file, in its current state"""
+
+        path = os.path.abspath(filename)
+        status = os.stat(path)
+        prefix = hashlib.sha1(path.encode("utf-8")).hexdigest()[:20]
+        return os.path.join(cache_dir, f"{prefix}-{status.st_mtime_ns}-{status.st_size}.cwp")
+
+    def _write_cache(self, cache_file, wheel_items, release, definitions):
+        """Store a set of wheels as a palette file, and the digests of their
+        definitions next to it (see ``reload_wheels``). Stale cache files of the
+        same definition file are removed. Failing to write the cache is not an
+        error, the wheels are just not cached. This includes wheels with colors
+        outside 0-255, which can't be stored in a palette file."""
+
+        directory = os.path.dirname(cache_file)
+        prefix = os.path.basename(cache_file).split("-")[0]
+        definitions_file = os.path.splitext(cache_file)[0] + ".cwd"
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # the digests first, so that every complete palette file has them
+            with open(temp_file, "w") as stream:
+                json.dump(definitions, stream)
+            os.replace(temp_file, definitions_file)
+            wheels = (self._resolve(wheel_items, name) for name in list(wheel_items))
+            save_palette(temp_file, wheels, release)
+            os.replace(temp_file, cache_file)
+            for stale in glob.glob(os.path.join(directory, f"{prefix}-*.cw[pd]")):
+                if stale not in (cache_file, definitions_file):
+                    os.remove(stale)
+        except (OSError, ValueError) as exc:
+            logger.warning("Writing cache file '%s' failed: %s", cache_file, exc)
+        finally:
+            # no partial files, and no digests without their palette file
+            leftovers = [temp_file]
+            if not os.path.exists(cache_file):
+                leftovers.append(definitions_file)
+            for leftover in leftovers:
+                try:
+                    os.remove(leftover)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _read_cached_definitions(cache_file):
+        """Digests of the definitions stored with a cache file. Empty, if they
+        can't be read, then every wheel counts as changed on reload."""
+
+        try:
+            with open(os.path.splitext(cache_file)[0] + ".cwd") as stream:
+                return json.load(stream)
+        except (OSError, ValueError) as exc:
+            logger.warning("Reading definitions of cache file '%s' failed: %s", cache_file, exc)
+            return dict()
+
+    def load_palette(self, filename, add_base_colors=True):
+        """loads a binary palette file, written by ``save_palette``.
+
+        The file is memory-mapped, and colors of a wheel are read on first
+        use of the wheel (``find_wheel``, or activation in a Colorwheels
+        generator). Loading a large palette library is therefore fast, no
+        matter its size.
+
+        Parameters
+        ----------
+            filename: filename of binary palette file. See :doc:`palette_file`
+
+        Raises
+        ------
+            FileNotFoundError:
+                If file is not found on system
+            ValueError:
+                If file is not a valid palette file
+        """
+
+        self._load_palette(filename, add_base_colors)
+
+    def _load_palette(self, filename, add_base_colors, definitions=None):
+        """Load a binary palette file, see ``load_palette``. definitions are
+        the digests of the YAML definitions of the wheels, if it is a cache
+        file"""
+
+        metrics = active_metrics()
+        start = time.perf_counter() if metrics is not None else 0.0
+        try:
+            palette = PaletteFile(filename)
+        except FileNotFoundError as exc:
+            logger.fatal("File '%s' not found ...", filename)
+            raise exc
+
+        wheel_items = {name: functools.partial(palette.wheel, name) for name in palette.names}
+        self._publish(wheel_items, palette.release, add_base_colors, definitions)
+        if metrics is not None:
+            metrics.record_duration("load_palette", time.perf_counter() - start,
+                                    filename=filename)
+
+    def save_palette(self, filename):
+        """Saves all wheel definitions to a binary palette file, which can
+        be loaded with ``load_palette``.
+
+        Parameters
+        ----------
+            filename: filename of binary palette file. See :doc:`palette_file`
+        """
+
+        wheel_items = self._wheel_items
+        wheels = (self._resolve(wheel_items, name) for name in list(wheel_items))
+        save_palette(filename, wheels, self.release)
+
+class ColorwheelsConfig(ColorwheelsContext, metaclass=Singleton):
+    """Configuration helper for :doc:`colorwheels`, shared by the whole program.
+
+    All Colorwheels generators created without a context of their own use this
+    singleton. Use a :class:`ColorwheelsContext` for configurations scoped to
+    some generators only.
+    """
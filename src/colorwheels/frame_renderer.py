@@ -0,0 +1,197 @@
+"""FrameRenderer fills LED strips and RGB matrices from a color wheel.
+
+Scrolling rainbows on a strip need a different wheel color per pixel: pixel
+``x`` shows the wheel color ``spacing * x`` steps ahead of the first pixel, and
+the whole pattern moves ``speed`` colors per frame. Instead of calling ``next``
+per pixel, the renderer computes the wheel index of every pixel with index
+arithmetic, and copies a whole frame out of the packed wheel table:
+
+* with NumPy (if installed), a frame is one vectorized gather
+* without NumPy, a row is copied with (at most) three stepped slice copies
+  of per-channel tables, independent of the row length
+"""
+
+import math
+
+from .wheel_item import load_numpy
+
+class FrameRenderer:
+    """Renders frames of a strip (``height`` 1) or a ``width`` x ``height``
+    matrix from a wheel.
+
+    Frames are packed RGB buffers, 3 bytes per pixel, rows top to bottom. The
+    pixel at column ``x``, row ``y`` of frame ``n`` shows wheel color::
+
+        offset + n * speed + direction * spacing * x + row_offset * y
+
+    (modulo wheel size). With ``serpentine`` wiring, odd rows run backwards.
+    """
+
+    def __init__(self, source, width, height=1, spacing=1, direction=1, speed=1,
+                 offset=None, row_offset=0, serpentine=False):
+        """Create a frame renderer.
+
+        Parameters
+        ----------
+        source:
+            :doc:`wheel_item`, or :doc:`colorwheels` generator. A generator
+            contributes its active wheel (with color correction applied), and
+            its counter as default offset
+        width, height:
+            frame size in pixels. Strips have height 1
+        spacing:
+            wheel colors between neighboring pixels of a row
+        direction:
+            1 - wheel runs along the row, -1 - wheel runs backwards
+        speed:
+            wheel colors the pattern scrolls per frame. May be negative or
+            fractional
+        offset:
+            wheel color of the first pixel in the first frame
+        row_offset:
+            wheel colors between neighboring rows, e.g. for diagonal patterns
+        serpentine:
+            True for matrices wired in zigzag, where odd rows run right to left
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception for invalid frame size, spacing or
+            direction, or an empty wheel
+        """
+
+        if width < 1 or height < 1:
+            raise ValueError("Frame width and height must be at least 1")
+        if spacing < 1:
+            raise ValueError("Spacing must be at least 1")
+        if direction not in (1, -1):
+            raise ValueError("Direction must be 1 or -1")
+
+        self._source = source
+        self.width = width
+        self.height = height
+        self.spacing = spacing
+        self.direction = direction
+        self.speed = speed
+        self.offset = getattr(source, "counter", 0) if offset is None else offset
+        self.row_offset = row_offset
+        self.serpentine = serpentine
+        self.frame_count = 0
+        self.refresh()
+
+    def __str__(self):
+        return f"FrameRenderer - {self.width}x{self.height}, frame {self.frame_count}"
+
+    @property
+    def frame_size(self):
+        """Size of a frame in bytes"""
+
+        return 3 * self.width * self.height
+
+    def refresh(self):
+        """Rebuild the tables of the renderer, after the wheel (or the active
+        wheel of a generator) changed"""
+
+        wheel = getattr(self._source, "_output_wheel", self._source)
+        if not wheel.colors:
+            raise ValueError(f"Wheel '{wheel.name}' has no colors")
+
+        packed = wheel.packed
+        size = len(wheel.colors)
+        self._size = size
+
+        # Wheel repeated often enough, that a row can be sliced from any start
+        # index without wrapping around
+        span = self.width * self.spacing
+        repeats = -(-span // size) + 2
+        self._base = size * (repeats - 1)
+        extended = packed * repeats
+        self._packed = extended
+        self._channels = tuple(extended[channel::3] for channel in range(3))
+
+        numpy = self._numpy = load_numpy()
+        if numpy is not None:
+            columns = numpy.arange(self.width, dtype=numpy.int64) * (self.direction * self.spacing)
+            rows = numpy.arange(self.height, dtype=numpy.int64).reshape(-1, 1)
+            indexes = rows * self.row_offset + columns
+            if self.serpentine:
+                indexes[1::2] = indexes[1::2, ::-1]
+            self._np_indexes = indexes.reshape(-1)
+            self._np_table = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(-1, 3)
+
+    def _position(self, frame):
+        """Wheel index of the first pixel in frame"""
+
+        return math.floor(self.offset + frame * self.speed)
+
+    def _copy_row(self, target, position, start, step):
+        """Copy the wheel colors ``start + x * step`` of a row to target at
+        byte position"""
+
+        width = self.width
+        start = start % self._size
+        if step < 0:
+            # slice backwards from a repetition far enough down the table
+            start += self._base
+        end = start + width * step
+        length = 3 * width
+
+        if step == 1:
+            target[position:position + length] = self._packed[3 * start:3 * end]
+            return
+        for channel, table in enumerate(self._channels):
+            target[position + channel:position + length:3] = table[start:end:step]
+
+    def render_frame(self, frame, out=None):
+        """Render frame number ``frame``, without changing ``frame_count``.
+
+        Parameters
+        ----------
+        frame:
+            frame number, i.e. scroll position in multiples of ``speed``
+        out:
+            optional writable buffer of at least ``frame_size`` bytes
+
+        Returns
+        -------
+        bytearray or the supplied buffer
+            packed RGB frame
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if out is too small
+        """
+
+        length = self.frame_size
+        if out is None:
+            out = bytearray(length)
+        elif len(out) < length:
+            raise ValueError(f"Output buffer too small, {length} bytes required")
+        target = memoryview(out).cast("B")
+        position = self._position(frame)
+
+        numpy = self._numpy
+        if numpy is not None:
+            indexes = (self._np_indexes + position) % self._size
+            pixels = numpy.frombuffer(target, dtype=numpy.uint8, count=length).reshape(-1, 3)
+            numpy.take(self._np_table, indexes, axis=0, out=pixels)
+            return out
+
+        step = self.direction * self.spacing
+        row_length = 3 * self.width
+        for row in range(self.height):
+            start = position + row * self.row_offset
+            if self.serpentine and row % 2:
+                self._copy_row(target, row * row_length, start + (self.width - 1) * step, -step)
+            else:
+                self._copy_row(target, row * row_length, start, step)
+        return out
+
+    def render(self, out=None):
+        """Render the next frame, and scroll by ``speed``. See
+        ``render_frame`` for parameters and return value."""
+
+        out = self.render_frame(self.frame_count, out)
+        self.frame_count += 1
+        return out
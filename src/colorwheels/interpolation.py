@@ -0,0 +1,203 @@
+"""InterpolatedWheel serves smooth fades between the colors of a :doc:`wheel_item`.
+
+A Colorwheels generator steps through the colors of a wheel one by one. For
+smooth fades, instead of generating huge wheels (a 4096 color rainbow), an
+interpolated wheel blends between neighboring colors of a small palette: a 16
+color palette with 256 steps per color gives the same smoothness.
+
+Blending is done in fixed point arithmetic, with per-segment start colors and
+deltas, and per-step fractions precomputed, so serving a color costs a few
+integer operations on top of a table lookup.
+
+Colors can be blended in two color spaces:
+
+* ``"rgb"``: components are blended as they are
+* ``"linear"``: components are blended in linear light (gamma 2.2 decoded),
+  which avoids the dark, muddy middle of fades between saturated colors
+
+Linear light is represented with 16 bits per component. Wheel colors are served
+exactly as they are, in both color spaces.
+"""
+
+import math
+
+FRACTION_BITS = 16
+_ONE = 1 << FRACTION_BITS
+_HALF = 1 << (FRACTION_BITS - 1)
+
+LINEAR_BITS = 16
+_LINEAR_MAX = (1 << LINEAR_BITS) - 1
+_GAMMA = 2.2
+
+color_spaces = ["rgb", "linear"]
+
+# decode and encode tables of the linear color space, built on first use
+_linear_tables = None
+
+def _linear():
+    """Tables converting components to linear light (a tuple), and back to
+    0-255 (bytes)"""
+
+    global _linear_tables # pylint: disable=global-statement
+    if _linear_tables is None:
+        decode = tuple(int(round((value / 255) ** _GAMMA * _LINEAR_MAX))
+                       for value in range(256))
+        encode = bytes(int(round((value / _LINEAR_MAX) ** (1 / _GAMMA) * 255))
+                       for value in range(_LINEAR_MAX + 1))
+        _linear_tables = (decode, encode)
+    return _linear_tables
+
+class InterpolatedWheel:
+    """Endless generator of colors interpolated between wheel colors.
+
+    Colors are returned as RGB tuples. After the last color of the wheel, the
+    generator fades back to the first one.
+    """
+
+    def __init__(self, wheel, steps=16, space="rgb"):
+        """Create an interpolated wheel.
+
+        Parameters
+        ----------
+        wheel:
+            :doc:`wheel_item` with the colors to blend between. Colors must be
+            in the range 0-255
+        steps:
+            number of colors served per wheel color, i.e. from one wheel color
+            to the next
+        space:
+            color space to blend in, out of color_spaces
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception for an empty wheel, less than one step,
+            or an unknown color space
+        """
+
+        if not wheel.colors:
+            raise ValueError(f"Wheel '{wheel.name}' has no colors")
+        if steps < 1:
+            raise ValueError("At least one step per color is required")
+        if space not in color_spaces:
+            raise ValueError(f"Unknown color space '{space}'")
+
+        self.name = wheel.name
+        self.steps = steps
+        self.space = space
+        self.size = len(wheel.colors)
+
+        colors = wheel.table("rgb_tuple")
+        # wheel colors are served from here, as linear light doesn't
+        # round trip all dark components
+        self._colors = colors
+        if space == "linear":
+            decode, self._encode = _linear()
+            colors = tuple(tuple(decode[component] for component in color) for color in colors)
+        else:
+            self._encode = None
+
+        # per segment: start color and delta to the next color
+        self._segments = tuple(
+            color + tuple(following - component
+                          for component, following in zip(color, colors[(i + 1) % self.size]))
+            for i, color in enumerate(colors))
+
+        # fixed point fraction of every step in between two colors
+        self._fractions = tuple((step << FRACTION_BITS) // steps for step in range(steps))
+        self._length = self.size * steps
+        self._step = 0
+
+    def __str__(self):
+        return (f"InterpolatedWheel '{self.name}' - {self.size} colors, "
+                f"{self.steps} steps each, {self.space}")
+
+    def __iter__(self):
+        """Return the iterator"""
+
+        return self
+
+    def __next__(self):
+        """Return next interpolated color as an RGB tuple"""
+
+        step = self._step
+        self._step = step + 1 if step + 1 < self._length else 0
+        segment, sub_step = divmod(step, self.steps)
+
+        # same as _blend, inlined on the hot path
+        fraction = self._fractions[sub_step]
+        red, green, blue, d_red, d_green, d_blue = self._segments[segment]
+        red += (d_red * fraction + _HALF) >> FRACTION_BITS
+        green += (d_green * fraction + _HALF) >> FRACTION_BITS
+        blue += (d_blue * fraction + _HALF) >> FRACTION_BITS
+
+        encode = self._encode
+        if encode is None:
+            return (red, green, blue)
+        if not fraction:
+            return self._colors[segment]
+        return (encode[red], encode[green], encode[blue])
+
+    def _blend(self, segment, fraction):
+        """Color at a fixed point fraction in between segment color and the
+        next color"""
+
+        red, green, blue, d_red, d_green, d_blue = self._segments[segment]
+        red += (d_red * fraction + _HALF) >> FRACTION_BITS
+        green += (d_green * fraction + _HALF) >> FRACTION_BITS
+        blue += (d_blue * fraction + _HALF) >> FRACTION_BITS
+
+        encode = self._encode
+        if encode is None:
+            return (red, green, blue)
+        if not fraction:
+            return self._colors[segment]
+        return (encode[red], encode[green], encode[blue])
+
+    @property
+    def position(self):
+        """Current position, in wheel colors (float). 2.5 is half way in
+        between the third and the fourth color"""
+
+        return self._step / self.steps
+
+    @position.setter
+    def position(self, value):
+        self._step = int(round(value * self.steps)) % self._length
+
+    def color_at(self, position):
+        """Color at a fractional position, without moving the generator.
+
+        Parameters
+        ----------
+        position:
+            position in wheel colors, e.g. 2.5 is half way in between the
+            third and the fourth color. Wraps around the wheel
+
+        Returns
+        -------
+        tuple
+            RGB tuple
+        """
+
+        segment = math.floor(position)
+        fraction = int((position - segment) * _ONE)
+        return self._blend(segment % self.size, fraction)
+
+    def color_at_time(self, elapsed, seconds_per_color=1.0):
+        """Color at a point in time, for time based fades.
+
+        Parameters
+        ----------
+        elapsed:
+            seconds since the start of the fade
+        seconds_per_color:
+            time it takes to fade from one wheel color to the next
+
+        Returns
+        -------
+        tuple
+            RGB tuple
+        """
+
+        return self.color_at(elapsed / seconds_per_color)
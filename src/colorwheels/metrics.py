@@ -0,0 +1,259 @@
+"""Opt-in metrics of colorwheels: colors served, activations, load times.
+
+Metrics are disabled by default, and cost nothing then: generators run their
+regular code, and loaders check a single module variable.
+
+``enable_metrics`` switches all generators (existing and new ones) to a metered
+variant of their class, which counts the colors served per wheel and wheel
+activations. Wheel configurations record the duration of loads and of YAML
+parsing, and cache hits and misses. ``Metrics.snapshot`` exports all values as
+a dict, callbacks receive events as they happen.
+
+.. code-block:: python
+
+    metrics = colorwheels.enable_metrics()
+    metrics.add_callback(lambda event, data: print(event, data))
+    ...
+    print(metrics.snapshot())
+    colorwheels.disable_metrics()
+"""
+
+import collections
+import copy
+import threading
+import weakref
+
+# every generator created, to switch classes when metrics are enabled or disabled
+_generators = weakref.WeakSet()
+# metered variant of every generator class, see _metered_class
+_metered_classes = dict()
+# Metrics instance while metrics are enabled, otherwise None
+_metrics = None
+
+class Metrics:
+    """Metrics collected while enabled.
+
+    Colors served by a generator are added to the totals when the generator
+    switches wheels, and on ``snapshot``. Counts of a generator shared by
+    threads are approximate.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = list()
+        self.reset()
+
+    def reset(self):
+        """Set all metrics to zero"""
+
+        with self._lock:
+            self._colors_served = collections.Counter()
+            self._activations = collections.Counter()
+            self._durations = dict()
+            self._cache = {"hits": 0, "misses": 0}
+        for generator in list(_generators):
+            if isinstance(generator, _MeteredGenerator):
+                generator._colors_served = 0
+
+    def add_callback(self, callback):
+        """Register callback(event, data), called for every "activation",
+        "duration" and "cache" event. Callbacks must be fast, they run in the
+        thread causing the event."""
+
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """Remove a callback added with ``add_callback``"""
+
+        self._callbacks.remove(callback)
+
+    def _emit(self, event, data):
+        for callback in list(self._callbacks):
+            callback(event, data)
+
+    def _add_colors_served(self, wheel_name, count):
+        with self._lock:
+            self._colors_served[wheel_name] += count
+
+    def record_activation(self, wheel_name):
+        """Count an activation of wheel"""
+
+        with self._lock:
+            self._activations[wheel_name] += 1
+        self._emit("activation", {"wheel": wheel_name})
+
+    def record_duration(self, operation, seconds, **details):
+        """Add the duration of an operation, e.g. "load_wheels" or "parse"
+
+        Parameters
+        ----------
+        operation:
+            name of the operation
+        seconds:
+            duration in seconds
+        details:
+            passed to callbacks with the event, e.g. the filename
+        """
+
+        with self._lock:
+            entry = self._durations.get(operation)
+            if entry is None:
+                entry = self._durations[operation] = {"count": 0, "total": 0.0,
+                                                      "max": 0.0, "last": 0.0}
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            entry["last"] = seconds
+        self._emit("duration", dict(details, operation=operation, seconds=seconds))
+
+    def record_cache(self, hit, filename):
+        """Count a cache hit or miss of a definition file"""
+
+        with self._lock:
+            self._cache["hits" if hit else "misses"] += 1
+        self._emit("cache", {"hit": hit, "filename": filename})
+
+    def snapshot(self):
+        """All metrics as a dict.
+
+        Returns
+        -------
+        dict
+            ``colors_served`` and ``activations`` per wheel name, ``durations``
+            per operation (count, total, max and last in seconds), and
+            ``cache`` hits and misses
+        """
+
+        for generator in list(_generators):
+            if isinstance(generator, _MeteredGenerator):
+                generator._flush_colors_served()
+
+        with self._lock:
+            return {
+                "colors_served": dict(self._colors_served),
+                "activations": dict(self._activations),
+                "durations": copy.deepcopy(self._durations),
+                "cache": dict(self._cache),
+            }
+
+class _MeteredGenerator:
+    """Mixin counting colors served, put in front of a generator class while
+    metrics are enabled"""
+
+    _colors_served = 0
+    _metered_wheel = None
+
+    def _flush_colors_served(self):
+        count = self._colors_served
+        metrics = _metrics
+        if count and self._metered_wheel is not None and metrics is not None:
+            self._colors_served = 0
+            metrics._add_colors_served(self._metered_wheel, count)
+
+    def _bind_table(self):
+        self._flush_colors_served()
+        super()._bind_table()
+        wheel = self._active_wheel
+        self._metered_wheel = wheel.name if wheel is not None else None
+
+    def activate_colorwheel(self, name, keep_cursor=False):
+        super().activate_colorwheel(name, keep_cursor)
+        if _metrics is not None:
+            _metrics.record_activation(name)
+
+    def __next__(self):
+        self._colors_served += 1
+        return super().__next__()
+
+    def next(self):
+        self._colors_served += 1
+        return super().next()
+
+    def next_rgba(self, alpha=255):
+        self._colors_served += 1
+        return super().next_rgba(alpha)
+
+    def next_hex(self):
+        self._colors_served += 1
+        return super().next_hex()
+
+    def previous(self):
+        self._colors_served += 1
+        return super().previous()
+
+    def next_batch(self, count, out=None, alpha=255):
+        result = super().next_batch(count, out, alpha)
+        self._colors_served += count
+        return result
+
+def _metered_class(cls):
+    """Metered variant of a generator class"""
+
+    metered = _metered_classes.get(cls)
+    if metered is None:
+        metered = type(cls.__name__, (_MeteredGenerator, cls),
+                       {"__module__": cls.__module__, "__qualname__": cls.__qualname__})
+        _metered_classes[cls] = metered
+    return metered
+
+def _meter(generator):
+    """Switch generator to its metered class"""
+
+    if not isinstance(generator, _MeteredGenerator):
+        generator.__class__ = _metered_class(type(generator))
+        wheel = generator._active_wheel
+        generator._metered_wheel = wheel.name if wheel is not None else None
+
+def _unmeter(generator):
+    """Switch generator back to its regular class"""
+
+    if isinstance(generator, _MeteredGenerator):
+        generator._flush_colors_served()
+        generator.__class__ = generator.__class__.__mro__[2]
+        generator.__dict__.pop("_colors_served", None)
+        generator.__dict__.pop("_metered_wheel", None)
+
+def register_generator(generator):
+    """Called by generators on creation. Meters the generator, if metrics are
+    enabled"""
+
+    _generators.add(generator)
+    if _metrics is not None:
+        _meter(generator)
+
+def active_metrics():
+    """The enabled ``Metrics`` object, or None if metrics are disabled"""
+
+    return _metrics
+
+def enable_metrics():
+    """Enable metrics for all generators and wheel configurations.
+
+    Returns
+    -------
+    Metrics
+        the metrics object. Enabling metrics again returns the same object
+    """
+
+    global _metrics # pylint: disable=global-statement
+    if _metrics is None:
+        _metrics = Metrics()
+        for generator in list(_generators):
+            _meter(generator)
+    return _metrics
+
+def disable_metrics():
+    """Disable metrics. Generators switch back to their regular classes.
+
+    Returns
+    -------
+    Metrics or None
+        the metrics object of the enabled period, with its final values
+    """
+
+    global _metrics # pylint: disable=global-statement
+    metrics = _metrics
+    for generator in list(_generators):
+        _unmeter(generator)
+    _metrics = None
+    return metrics
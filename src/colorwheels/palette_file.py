@@ -0,0 +1,162 @@
+"""Compact binary palette files for :doc:`colorwheels_config`.
+
+A palette file stores compiled wheel definitions - names and packed RGB colors -
+so large palette libraries load without parsing YAML. Files are memory-mapped
+on load, and colors of a wheel are only read when the wheel is first used.
+
+File layout (all integers little-endian):
+
+* header: magic ``b"CWPL"``, format version (uint16), release length (uint16),
+  wheel count (uint32)
+* release: release string of the definitions, UTF-8
+* index: per wheel name length (uint16), color count (uint32), data offset
+  (uint64) and the name, UTF-8
+* data: colors of all wheels, packed as RGB triplets (3 bytes per color)
+"""
+
+import mmap
+import struct
+
+from .wheel_item import WheelItem
+
+MAGIC = b"CWPL"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_INDEX_ENTRY = struct.Struct("<HIQ")
+
+def save_palette(filename, wheels, release="unknown"):
+    """Save wheels to a binary palette file.
+
+    Parameters
+    ----------
+        filename:
+            name of the palette file to be written
+        wheels:
+            iterable of :doc:`wheel_item` objects. Colors must be in the
+            range 0-255
+        release:
+            release string stored with the palette, see :doc:`yaml_definitions`
+    """
+
+    wheels = list(wheels)
+    release_data = str(release).encode("utf-8")
+    names = [wheel.name.encode("utf-8") for wheel in wheels]
+
+    offset = _HEADER.size + len(release_data) + sum(
+        _INDEX_ENTRY.size + len(name) for name in names)
+
+    index = bytearray()
+    for wheel, name in zip(wheels, names):
+        index += _INDEX_ENTRY.pack(len(name), len(wheel.colors), offset)
+        index += name
+        offset += 3 * len(wheel.colors)
+
+    with open(filename, "wb") as stream:
+        stream.write(_HEADER.pack(MAGIC, VERSION, len(release_data), len(wheels)))
+        stream.write(release_data)
+        stream.write(index)
+        for wheel in wheels:
+            stream.write(wheel.packed)
+
+class PaletteFile:
+    """Memory-mapped binary palette file.
+
+    Opening a palette file reads its header and name index only. Colors are
+    read when a wheel is requested with ``wheel``.
+    """
+
+    def __init__(self, filename):
+        """Open and memory-map a palette file.
+
+        Raises
+        ------
+            FileNotFoundError:
+                If file is not found on system
+            ValueError:
+                If file is not a palette file, of an unsupported version, or
+                truncated
+        """
+
+        self.filename = filename
+        with open(filename, "rb") as stream:
+            try:
+                self._data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError: # empty file
+                raise ValueError(f"'{filename}' is not a palette file") from None
+
+        try:
+            self._read_index()
+        except struct.error:
+            self._data.close()
+            raise ValueError(f"Palette file '{filename}' is truncated") from None
+        except ValueError:
+            self._data.close()
+            raise
+
+    def _read_index(self):
+        """Read header, release and index of the file. Checks that the
+        colors of every wheel are within the file."""
+
+        filename = self.filename
+        if len(self._data) < _HEADER.size:
+            raise ValueError(f"'{filename}' is not a palette file")
+        magic, version, release_length, count = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"'{filename}' is not a palette file")
+        if version != VERSION:
+            raise ValueError(f"Palette file '{filename}' has unsupported version {version}")
+
+        position = _HEADER.size
+        self.release = self._data[position:position + release_length].decode("utf-8")
+        position += release_length
+
+        self._entries = dict() # name -> (offset, color count), in file order
+        for _ in range(count):
+            name_length, size, offset = _INDEX_ENTRY.unpack_from(self._data, position)
+            position += _INDEX_ENTRY.size
+            if position + name_length > len(self._data):
+                raise ValueError(f"Palette file '{filename}' is truncated")
+            name = self._data[position:position + name_length].decode("utf-8")
+            position += name_length
+            if offset + 3 * size > len(self._data):
+                raise ValueError(f"Palette file '{filename}' is truncated, "
+                                 f"colors of wheel '{name}' are missing")
+            self._entries[name] = (offset, size)
+
+    def __str__(self):
+        return f"PaletteFile '{self.filename}': {len(self._entries)} wheel definitions"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def names(self):
+        """Return list of wheel names in the palette file"""
+
+        return list(self._entries)
+
+    def wheel(self, name):
+        """Read a wheel from the palette file.
+
+        Returns
+        -------
+        WheelItem
+            A new :doc:`wheel_item`
+
+        Raises
+        ------
+        KeyError
+            Raises KeyError exception if name is not in the palette file
+        """
+
+        offset, size = self._entries[name]
+        return WheelItem.from_packed(name, self._data[offset:offset + 3 * size])
+
+    def close(self):
+        """Close the memory map. Wheels can't be read anymore."""
+
+        self._data.close()
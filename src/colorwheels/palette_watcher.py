@@ -0,0 +1,114 @@
+"""PaletteWatcher reloads a YAML color definition file, whenever the file changes.
+
+The watcher polls the modification time and size of the file - no external
+service or library is needed. Changed wheels are swapped into running
+:doc:`colorwheels` generators, which keep their position, so you can tune
+colors of an installation live, without restarting the render loop.
+"""
+
+import logging
+import os
+import threading
+
+from .colorwheels_config import ColorwheelsConfig
+
+logger = logging.getLogger(__name__)
+
+class PaletteWatcher:
+    """Watches a YAML color definition file, and reloads it on change.
+
+    The watcher either runs in a background thread (``start``/``stop``), or
+    can be polled by calling ``check`` from your own loop. Polling from the
+    render loop is the safe choice for plain :doc:`colorwheels` generators,
+    which must not be changed from other threads. A
+    :doc:`thread_safe_colorwheels` generator can be updated from the
+    background thread.
+    """
+
+    def __init__(self, filename, context=None, interval=1.0, add_base_colors=True):
+        """Create a watcher. If the configuration has no YAML definitions
+        loaded yet, the file is loaded on first ``check``. Otherwise, the file
+        is expected to be loaded already, and is reloaded when it changes.
+
+        Parameters
+        ----------
+        filename:
+            YAML color definition file, see :doc:`yaml_definitions`
+        context:
+            configuration to be reloaded, a ``ColorwheelsContext``. The global
+            :doc:`colorwheels_config` if not provided
+        interval:
+            seconds between checks of the background thread
+        add_base_colors:
+            see ``load_wheels``
+        """
+
+        self.filename = filename
+        self.context = context if context is not None else ColorwheelsConfig()
+        self.interval = interval
+        self.add_base_colors = add_base_colors
+        # None makes the first check load the file
+        self._signature = self._file_signature() if self.context._definitions else None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _file_signature(self):
+        """Modification time and size of file, None if not available"""
+
+        try:
+            status = os.stat(self.filename)
+        except OSError:
+            return None
+        return (status.st_mtime_ns, status.st_size)
+
+    def check(self):
+        """Reload the file, if it changed since the last check.
+
+        A file which fails to load (e.g. saved half way by an editor) is
+        logged, and loaded again on its next change.
+
+        Returns
+        -------
+        list
+            names of changed wheels, None if the file was not reloaded
+        """
+
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return None
+
+        self._signature = signature
+        try:
+            return self.context.reload_wheels(self.filename, self.add_base_colors)
+        except Exception as exc: # pylint: disable=broad-except
+            logger.error("Reloading '%s' failed: %s", self.filename, exc)
+            return None
+
+    def start(self):
+        """Start checking the file in a background (daemon) thread"""
+
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PaletteWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
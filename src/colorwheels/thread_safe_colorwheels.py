@@ -0,0 +1,276 @@
+"""``ThreadSafeColorwheels`` is a :doc:`colorwheels` generator, which can be shared
+by several threads.
+
+A plain Colorwheels generator keeps the active wheel and its counter in separate
+attributes, so threads calling ``next`` while another thread activates a wheel
+can skip colors, or index past the end of a shorter wheel.
+
+The thread safe generator keeps the active wheel, its color table and a cursor
+together in one immutable state object. Activating a wheel publishes a new state
+with a single assignment, and every ``next`` call works on the one state it read.
+Colors are served either from one shared cursor (each color is served exactly
+once, in sequence, to whichever thread asks), or from independent per-thread
+cursors, which need no locking at all.
+"""
+
+import threading
+from collections import namedtuple
+
+from .colorwheels import Colorwheels, generator_types
+
+_WheelState = namedtuple("_WheelState",
+                         ["wheel", "output_wheel", "generator_type", "table", "cursor"])
+
+class _SharedCursor:
+    """Cursor shared by all threads. Advancing is a short critical section."""
+
+    def __init__(self, size, position):
+        self.size = size
+        self._position = position
+        self._lock = threading.Lock()
+
+    @property
+    def position(self):
+        """Index of the next color"""
+
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        with self._lock:
+            self._position = value % self.size
+
+    def advance(self, count=1):
+        """Reserve count consecutive colors. Returns index of the first."""
+
+        with self._lock:
+            start = self._position
+            self._position = (start + count) % self.size
+        return start
+
+    def resized(self, size):
+        """New cursor for a wheel of size colors, at the same position
+        (modulo size)"""
+
+        return _SharedCursor(size, self._position % size)
+
+class _ThreadCursor:
+    """Independent cursor per thread. Threads start at the same position.
+
+    Positions are kept in a thread local, which resized cursors share. Each
+    cursor takes the positions modulo its own size, so threads still serving
+    from a previous state get indexes valid for its table."""
+
+    def __init__(self, size, position, local=None):
+        self.size = size
+        self._start = position % size
+        self._local = local if local is not None else threading.local()
+
+    @property
+    def position(self):
+        """Index of the next color of calling thread"""
+
+        position = self._local.__dict__.get("position", self._start)
+        return position if position < self.size else position % self.size
+
+    @position.setter
+    def position(self, value):
+        self._local.position = value % self.size
+
+    def advance(self, count=1):
+        """Reserve count consecutive colors. Returns index of the first."""
+
+        local = self._local.__dict__
+        start = local.get("position", self._start)
+        if start >= self.size:
+            start %= self.size # set by a cursor of a larger wheel
+        local["position"] = (start + count) % self.size
+        return start
+
+    def resized(self, size):
+        """New cursor for a wheel of size colors. Every thread keeps its
+        position (modulo size)"""
+
+        return _ThreadCursor(size, self._start, self._local)
+
+class ThreadSafeColorwheels(Colorwheels):
+    """Colorwheels generator, which can be shared by threads.
+
+    The API is the same as for :doc:`colorwheels`. ``counter`` is the position of
+    the shared cursor, or of the calling thread's cursor if per-thread cursors
+    are used.
+    """
+
+    def __init__(self, add_base_colors=True, context=None, per_thread_cursors=False):
+        """Create ``ThreadSafeColorwheels`` instance.
+
+        Parameters
+        ----------
+        add_base_colors, context:
+            see :doc:`colorwheels`
+        per_thread_cursors:
+            if True, every thread walks through the wheel with its own cursor,
+            i.e. every thread gets the complete color sequence. Otherwise
+            threads share one cursor, and every color is served once
+        """
+
+        self._per_thread_cursors = per_thread_cursors
+        self._state = None
+        self._reset_cursor = False
+        # serializes state changes. Readers never lock, they read one state
+        self._writer_lock = threading.RLock()
+        super().__init__(add_base_colors, context)
+
+    @property
+    def counter(self):
+        """Index of the next color in active wheel"""
+
+        state = self._state
+        return state.cursor.position if state is not None else 0
+
+    @counter.setter
+    def counter(self, value):
+        state = self._state
+        if state is not None:
+            state.cursor.position = value
+
+    def _bind_table(self):
+        """Publish a new state for active wheel and generator type. The
+        cursor is kept, unless the wheel changed."""
+
+        with self._writer_lock:
+            super()._bind_table()
+
+            old_state = self._state
+            wheel = self._active_wheel
+            if wheel is None or not self._table:
+                self._state = None
+                return
+
+            if (old_state is not None and not self._reset_cursor
+                    and old_state.wheel is wheel
+                    and old_state.output_wheel._colors is self._output_wheel._colors):
+                cursor = old_state.cursor
+            elif old_state is not None and not self._reset_cursor:
+                cursor = old_state.cursor.resized(self._table_size)
+            else:
+                cursor_type = _ThreadCursor if self._per_thread_cursors else _SharedCursor
+                cursor = cursor_type(self._table_size, 0)
+
+            self._state = _WheelState(wheel, self._output_wheel, self._generator_type,
+                                      self._table, cursor)
+
+    def activate_colorwheel(self, name, keep_cursor=False):
+        """Activates colorwheel by name, see :doc:`colorwheels`. Threads switch
+        to the new wheel atomically. All cursors start at its first color,
+        unless keep_cursor is True. Per-thread cursors then continue at the
+        position of every thread."""
+
+        with self._writer_lock:
+            self._reset_cursor = not keep_cursor
+            try:
+                super().activate_colorwheel(name, keep_cursor)
+            finally:
+                self._reset_cursor = False
+
+# -- Generator Functions -----------------------------------------------------
+
+    def __next__(self):
+        """Return next color element. The return value depends on
+        generator_type"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        return state.table[state.cursor.advance()]
+
+    def _next_color_item(self):
+        """Returns a next ColorItem available in active ColorWheel"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        return state.output_wheel.colors[state.cursor.advance()]
+
+    def next(self):
+        """Get the next color from the ColorWheel as an RGB tuple, see
+        :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        return state.output_wheel.table("rgb_tuple")[state.cursor.advance()]
+
+    def next_rgba(self, alpha=255):
+        """Get the next color from ColorWheel using RGBA, see
+        :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        color = state.output_wheel.table("rgba_tuple")[state.cursor.advance()]
+        return color if alpha == 255 else color[:3] + (alpha,)
+
+    def next_hex(self):
+        """Get the next color from ColorWheel as a hex string, see
+        :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        return state.output_wheel.table("hexadecimal")[state.cursor.advance()]
+
+    def next_batch(self, count, out=None, alpha=255):
+        """Get the next ``count`` colors from ColorWheel in one call, see
+        :doc:`colorwheels`. The batch is a consecutive run of colors, even if
+        other threads use the same cursor."""
+
+        state = self._state
+        if state is None:
+            if count:
+                raise IndexError("Active wheel has no colors")
+            return self._batch(self._generator_type, self._output_wheel, self._table,
+                               0, 0, out, alpha)
+        start = state.cursor.advance(count)
+        return self._batch(state.generator_type, state.output_wheel, state.table,
+                           start, count, out, alpha)
+
+    def skip(self, count=1):
+        """Move the cursor ``count`` colors forward or backward, see
+        :doc:`colorwheels`"""
+
+        state = self._state
+        if state is not None:
+            state.cursor.advance(count)
+
+    def peek(self, offset=0):
+        """Return the color ``offset`` steps ahead of the next color, see
+        :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        return state.table[(state.cursor.position + offset) % len(state.table)]
+
+    def previous(self):
+        """Step backwards by one color, see :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        index = (state.cursor.advance(-1) - 1) % len(state.table)
+        return state.table[index]
+
+    def color_at(self, step, generator_type=None):
+        """Return the color at step of active wheel, see :doc:`colorwheels`"""
+
+        state = self._state
+        if state is None:
+            raise IndexError("Active wheel has no colors")
+        if generator_type is None:
+            table = state.table
+        elif generator_type in generator_types:
+            table = state.output_wheel.table(generator_type)
+        else:
+            raise ValueError(f"Unknown generator type '{generator_type}'")
+        return table[step % len(table)]
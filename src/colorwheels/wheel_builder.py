@@ -0,0 +1,101 @@
+"""Generate many rainbow wheels at once, in a pool of worker processes.
+
+Programs using hundreds of parametrized rainbows spend their start-up time in
+``generate_rainbow``. ``build_wheels`` spreads the work over processes: specs
+are sent to the workers in chunks, and every worker returns the colors of a
+wheel as packed RGB ``bytes`` (see ``WheelItem.packed``), so no color object is
+pickled. Wheel items are created from the packed colors in the calling process.
+
+A spec has the fields of a YAML *rainbow* wheel (see :doc:`yaml_definitions`):
+``name``, and optionally ``size``, ``amplitude``, ``center`` and ``frequency``.
+``ColorwheelsContext.generate_wheels`` builds the wheels and adds them to a
+configuration in one batch.
+
+As with every use of ``multiprocessing``, programs on platforms starting
+workers with *spawn* (Windows, macOS) have to build wheels from code guarded
+by ``if __name__ == "__main__":``.
+"""
+
+import os
+
+from .wheel_item import WheelItem, rainbow_defaults
+
+# Chunks per worker process, to balance uneven wheel sizes
+CHUNKS_PER_PROCESS = 4
+
+def _rainbow_parameters(spec):
+    """Validated name and generator parameters of a spec"""
+
+    if "wheel" in spec:
+        spec = spec["wheel"] # a complete *wheel* element of a definition file
+    if "name" not in spec:
+        raise ValueError(f"Wheel spec without name: {spec}")
+    element_type = spec.get("type", "rainbow")
+    if element_type != "rainbow":
+        raise ValueError(f"Wheel '{spec['name']}' of type {element_type} cannot be built")
+    return spec["name"], {key: spec.get(key, default)
+                          for key, default in rainbow_defaults.items()}
+
+def _build_chunk(chunk):
+    """Generate a chunk of wheels. Returns (name, packed colors) per wheel.
+
+    Runs in the worker processes."""
+
+    results = list()
+    for name, parameters in chunk:
+        wheel = WheelItem(name, list())
+        wheel.generate_rainbow(**parameters)
+        try:
+            results.append((name, wheel.packed))
+        except ValueError:
+            raise ValueError(f"Wheel '{name}' has colors outside 0-255") from None
+    return results
+
+def build_wheels(specs, processes=None):
+    """Generate rainbow wheels from specs, in worker processes.
+
+    Parameters
+    ----------
+    specs:
+        iterable of dictionaries with the fields of a YAML rainbow wheel
+        (``name``, ``size``, ``amplitude``, ``center``, ``frequency``), or of
+        complete *wheel* elements
+    processes:
+        number of worker processes. Defaults to the number of CPUs. With 1,
+        wheels are generated in the calling process
+
+    Returns
+    -------
+    list
+        :doc:`wheel_item` objects, in the order of specs
+
+    Raises
+    ------
+    ValueError
+        Raises ValueError exception for a spec without name, a duplicate
+        name, an unsupported wheel type, or parameters producing colors
+        outside 0-255
+    """
+
+    jobs = [_rainbow_parameters(spec) for spec in specs]
+    names = set()
+    for name, _ in jobs:
+        if name in names:
+            raise ValueError(f"Wheel '{name}' is defined twice")
+        names.add(name)
+
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(jobs))
+    if processes <= 1:
+        results = _build_chunk(jobs)
+    else:
+        # the pool is only needed here, don't import it with the package
+        from concurrent.futures import ProcessPoolExecutor # pylint: disable=import-outside-toplevel
+
+        chunk_size = -(-len(jobs) // (processes * CHUNKS_PER_PROCESS))
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = [result for chunk in executor.map(_build_chunk, chunks)
+                       for result in chunk]
+
+    return [WheelItem.from_packed(name, packed) for name, packed in results]
@@ -0,0 +1,150 @@
+"""WheelGroup advances many wheels in lockstep.
+
+Foreground/background pairs, or a color wheel per LED of an array, drift apart
+when they are driven by independent :doc:`colorwheels` generators. A wheel group
+keeps one tick counter for all its wheels, optionally with a phase offset per
+wheel, and returns the current colors of all wheels as one packed RGB buffer
+per tick.
+
+Colors of all wheels are concatenated in one table, so a tick is a single
+vectorized gather with NumPy (if installed), or one slice copy per wheel in
+pure Python.
+"""
+
+from .wheel_item import load_numpy
+
+class WheelGroup:
+    """Group of wheels advancing together.
+
+    Every tick returns a packed RGB buffer, 3 bytes per wheel, in group order.
+    Wheel ``i`` serves its color at index ``(tick + offsets[i]) % size``.
+    """
+
+    def __init__(self, wheels, offsets=None):
+        """Create a wheel group.
+
+        Parameters
+        ----------
+        wheels:
+            list of :doc:`wheel_item` objects, or :doc:`colorwheels` generators.
+            A generator contributes its active wheel (with color correction
+            applied), and its counter as default offset
+        offsets:
+            phase offset per wheel, in colors. Defaults to 0 for wheel items
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if offsets don't match wheels, or a
+            wheel is empty
+        """
+
+        self._sources = list(wheels)
+        if offsets is None:
+            offsets = [getattr(source, "counter", 0) for source in self._sources]
+        if len(offsets) != len(self._sources):
+            raise ValueError("One offset per wheel is required")
+        self._offsets = list(offsets)
+        self.tick_count = 0
+        self.refresh()
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __str__(self):
+        return f"WheelGroup - {len(self)} wheels, tick {self.tick_count}"
+
+    @staticmethod
+    def _wheel(source):
+        """Wheel item of a group member"""
+
+        # Colorwheels generators serve their corrected output wheel
+        return getattr(source, "_output_wheel", source)
+
+    def refresh(self):
+        """Rebuild the color table of the group, after wheels (or the active
+        wheels of generators) changed"""
+
+        wheels = [self._wheel(source) for source in self._sources]
+        for wheel in wheels:
+            if not wheel.colors:
+                raise ValueError(f"Wheel '{wheel.name}' has no colors")
+
+        self._table = b"".join(wheel.packed for wheel in wheels)
+        self._sizes = [len(wheel.colors) for wheel in wheels]
+        self._bases = list()
+        base = 0
+        for size in self._sizes:
+            self._bases.append(base)
+            base += size
+
+        numpy = self._numpy = load_numpy()
+        if numpy is not None:
+            self._np_table = numpy.frombuffer(self._table, dtype=numpy.uint8).reshape(-1, 3)
+            self._np_bases = numpy.array(self._bases, dtype=numpy.int64)
+            self._np_sizes = numpy.array(self._sizes, dtype=numpy.int64)
+            self._np_offsets = numpy.array(self._offsets, dtype=numpy.int64)
+
+    @property
+    def offsets(self):
+        """Phase offsets of wheels, in colors"""
+
+        return tuple(self._offsets)
+
+    def set_offset(self, index, offset):
+        """Set the phase offset of wheel at index"""
+
+        self._offsets[index] = offset
+        if self._numpy is not None:
+            self._np_offsets[index] = offset
+
+    def seek(self, tick):
+        """Set the tick counter, i.e. move all wheels to ``tick``"""
+
+        self.tick_count = tick
+
+    def current(self, out=None):
+        """Current colors of all wheels, without advancing.
+
+        Parameters
+        ----------
+        out:
+            optional writable buffer of at least ``3 * len(group)`` bytes
+
+        Returns
+        -------
+        bytearray or the supplied buffer
+            RGB triplet per wheel
+        """
+
+        length = 3 * len(self._sources)
+        if out is None:
+            out = bytearray(length)
+        elif len(out) < length:
+            raise ValueError(f"Output buffer too small, {length} bytes required")
+        target = memoryview(out).cast("B")
+
+        tick = self.tick_count
+        numpy = self._numpy
+        if numpy is not None:
+            indexes = self._np_bases + (tick + self._np_offsets) % self._np_sizes
+            frame = numpy.frombuffer(target, dtype=numpy.uint8, count=length).reshape(-1, 3)
+            numpy.take(self._np_table, indexes, axis=0, out=frame)
+            return out
+
+        table = self._table
+        position = 0
+        for base, size, offset in zip(self._bases, self._sizes, self._offsets):
+            index = 3 * (base + (tick + offset) % size)
+            target[position:position + 3] = table[index:index + 3]
+            position += 3
+        return out
+
+    def tick(self, out=None):
+        """Current colors of all wheels, then advance all wheels by one color.
+
+        See ``current`` for parameters and return value."""
+
+        out = self.current(out)
+        self.tick_count += 1
+        return out
@@ -1,26 +1,195 @@
-"""WheelItem: a dataclass containing one ColorWheel definition
+"""WheelItem: an object containing one ColorWheel definition
 
 The object contains the following values:
 
 * name: ColorWheel name. The name is used to retrieve a named color sequence
-* colors: List of ColorItem colors
+* colors: sequence of the wheel colors
 
 WheelItem encapsulates a colorwheel selection and is used internally by
 colorwheels.
+
+Colors are stored packed, as one ``bytes`` object of RGB triplets (3 bytes per
+color, see ``packed``). ``colors`` is a read-only view of the packed colors,
+which serves every color as an interned ``FrozenColor``. To change the colors
+of a wheel, assign a new list of colors, or use the WheelItem methods. Only
+wheels with color components outside 0-255, which cannot be packed, keep the
+colors they were given, as a tuple.
+
+Tuples of ready-made values for every color format (see ``color_formats``) are
+built from the colors on first use, and dropped whenever the colors change.
+
+Generated palettes and bulk color transforms (complement, brightness, gamma,
+invert, blend) are calculated with NumPy, if it is installed. The results are
+identical to the pure Python implementation.
+
+Wheels can be used as display palettes: ``quantize`` maps arbitrary RGB frames
+to the nearest wheel colors, using a cached lookup grid.
 """
 
+import array
+import itertools
 import math
-from dataclasses import dataclass
-from typing import List
+import operator
+from collections.abc import Sequence
+
+from .color_item import ColorItem, FrozenColor
+
+# NumPy is optional, and imported on first use of a vectorized path. False
+# until then, afterwards the module or None
+_numpy = False
+
+# Palettes smaller than this are faster to generate in pure Python
+VECTORIZE_THRESHOLD = 64
+
+# Default resolution of quantization grids, bits per channel
+QUANTIZE_BITS = 5
+
+# Parameters of generated rainbows, if not specified in a definition (see
+# :doc:`yaml_definitions`)
+rainbow_defaults = {"size": 32, "amplitude": 127, "center": 128, "frequency": 0.3}
+
+# Color formats served from precompiled tables. Every entry converts one
+# ColorItem to the value stored in the table of that format.
+color_formats = {
+    "rgb_tuple": lambda color: (color.red, color.green, color.blue),
+    "rgba_tuple": lambda color: (color.red, color.green, color.blue, 255),
+    "hexadecimal": lambda color: color.color_hex,
+}
+
+def _hex_table(packed):
+    digits = packed.hex()
+    return tuple("#" + digits[start:start + 6] for start in range(0, len(digits), 6))
+
+# Tables of the built-in formats are built from the packed colors in bulk,
+# without creating a color object per color
+_packed_tables = {
+    "rgb_tuple": lambda packed: tuple(zip(packed[0::3], packed[1::3], packed[2::3])),
+    "rgba_tuple": lambda packed: tuple(zip(packed[0::3], packed[1::3], packed[2::3],
+                                           itertools.repeat(255))),
+    "hexadecimal": _hex_table,
+}
+
+def load_numpy():
+    """Return the NumPy module, or None if NumPy is not installed.
+
+    NumPy is imported on the first call, so programs which never reach a
+    vectorized code path don't pay for importing it."""
+
+    global _numpy # pylint: disable=global-statement
+    if _numpy is False:
+        try:
+            import numpy # pylint: disable=import-outside-toplevel
+        except ImportError: # NumPy is optional
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+def rainbow_array(size, amplitude=127, center=128, frequency=0.3):
+    """Calculate a Rainbow palette with NumPy, see ``WheelItem.generate_rainbow``.
+
+    The result is identical to the pure Python implementation: the few values,
+    which could truncate differently because NumPy and the math module may
+    round ``sin`` differently in the last digit, are recalculated with ``math.sin``.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape (size, 3) and type uint8, one RGB row per color
+
+    Raises
+    ------
+    ImportError
+        Raises ImportError exception if NumPy is not installed
+    ValueError
+        Raises ValueError exception if parameters produce color components
+        outside 0-255
+    """
+
+    numpy = load_numpy()
+    if numpy is None:
+        raise ImportError("rainbow_array requires NumPy")
+
+    steps = frequency * numpy.arange(size, dtype=numpy.float64)
+    phases = numpy.array([0, 2, 4], dtype=numpy.float64)
+    values = numpy.sin(steps[:, None] + phases) * amplitude + center
+
+    # fix up values close to an integer, where truncation is sensitive to
+    # the last digit of sin
+    near = numpy.abs(values - numpy.rint(values)) < 1e-9 * numpy.maximum(1.0, numpy.abs(values))
+    for i, channel in zip(*numpy.nonzero(near)):
+        values[i, channel] = math.sin(frequency*int(i) + 2*int(channel)) * amplitude + center
+
+    if size and (values.min() <= -1.0 or values.max() >= 256.0):
+        raise ValueError("Rainbow parameters produce colors outside 0-255")
+
+    return numpy.trunc(values).astype(numpy.uint8)
+
+class PackedColors(Sequence):
+    """Read-only sequence of colors packed as RGB triplets.
+
+    Items are interned ``FrozenColor`` objects (see :doc:`color_item`), created
+    on access. Slices are lists.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, packed):
+        self._packed = packed
+
+    def __len__(self):
+        return len(self._packed) // 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self._packed) // 3
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("color index out of range")
+        packed = self._packed
+        position = 3 * index
+        return FrozenColor(packed[position], packed[position + 1], packed[position + 2])
+
+    def __iter__(self):
+        packed = self._packed
+        return map(FrozenColor, packed[0::3], packed[1::3], packed[2::3])
+
+    def __eq__(self, other):
+        if isinstance(other, PackedColors):
+            return self._packed == other._packed
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PackedColors({list(self)!r})"
 
-from .color_item import ColorItem
-
-@dataclass
 class WheelItem:
-    """Content of one colorwheel"""
+    """Content of one colorwheel.
+
+    Parameters
+    ----------
+    name
+        name of the wheel
+    colors
+        sequence of :doc:`color_item` objects. The colors are copied, changing
+        them later doesn't change the wheel
+    """
+
+    def __init__(self, name, colors):
+        self.name = name
+        self.colors = colors
 
-    name: str
-    colors: List[ColorItem]
+    def __repr__(self):
+        return f"{type(self).__name__}(name={self.name!r}, colors={list(self.colors)!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.name == other.name and self.colors == other.colors
+
+    __hash__ = None
 
     def __str__(self):
         """Print overview of WheelItem instance"""
@@ -33,6 +202,142 @@ class WheelItem:
 
         return len(self.colors) == 1
 
+    @property
+    def colors(self):
+        """Colors of the wheel, a read-only sequence.
+
+        Colors are served as interned ``FrozenColor`` objects, see
+        :doc:`color_item`. Assign a new list of colors to change them.
+        """
+
+        return self._colors
+
+    @colors.setter
+    def colors(self, colors):
+        if isinstance(colors, PackedColors):
+            self._set_packed(colors._packed)
+            return
+        colors = tuple(colors)
+        try:
+            packed = bytes(component for color in colors
+                           for component in (color.red, color.green, color.blue))
+        except (TypeError, ValueError):
+            # components outside 0-255 (or not integers) cannot be packed
+            self._packed = None
+            self._colors = colors
+            self._tables = dict()
+        else:
+            self._set_packed(packed)
+
+# -- Color tables ------------------------------------------------------------
+
+    def invalidate(self):
+        """Drop precompiled color tables, to free their memory. Tables are
+        rebuilt on next use."""
+
+        self._tables.clear()
+
+    def _cached_table(self, key):
+        """Return a cached table, or None if it has to be built"""
+
+        return self._tables.get(key)
+
+    @property
+    def packed(self):
+        """Colors packed as RGB triplets, 3 bytes per color.
+
+        Returns
+        -------
+        bytes
+            Red, green and blue byte of every color, in wheel order
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if the wheel has color components
+            outside 0-255
+        """
+
+        packed = self._packed
+        if packed is None:
+            raise ValueError(f"Wheel '{self.name}' has colors outside 0-255, "
+                             "which cannot be packed")
+        return packed
+
+    def packed_rgba(self, alpha=255):
+        """Colors packed as RGBA quadruplets, 4 bytes per color.
+
+        Parameters
+        ----------
+            alpha:
+                alpha value of every color. The table for the default value is
+                cached
+
+        Returns
+        -------
+        bytes
+            Red, green, blue and alpha byte of every color, in wheel order
+        """
+
+        table = self._cached_table("packed_rgba") if alpha == 255 else None
+        if table is None:
+            packed = self.packed
+            size = len(self.colors)
+            rgba = bytearray(4 * size)
+            rgba[0::4] = packed[0::3]
+            rgba[1::4] = packed[1::3]
+            rgba[2::4] = packed[2::3]
+            rgba[3::4] = bytes((alpha,)) * size
+            table = bytes(rgba)
+            if alpha == 255:
+                self._tables["packed_rgba"] = table
+        return table
+
+    def table(self, color_format="rgb_tuple"):
+        """Tuple of precomputed color values in the requested format.
+
+        Parameters
+        ----------
+            color_format:
+                one of the formats in ``color_formats``, i.e. "rgb_tuple",
+                "rgba_tuple" or "hexadecimal"
+
+        Returns
+        -------
+        tuple
+            One value per color, in wheel order
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if color_format is not available
+        """
+
+        table = self._cached_table(color_format)
+        if table is None:
+            if color_format not in color_formats:
+                raise ValueError(f"Unknown color format '{color_format}'")
+            if self._packed is not None and color_format in _packed_tables:
+                table = _packed_tables[color_format](self._packed)
+            else:
+                converter = color_formats[color_format]
+                table = tuple(converter(color) for color in self.colors)
+            self._tables[color_format] = table
+        return table
+
+    def _set_packed(self, packed):
+        """Replace colors with colors packed as RGB triplets"""
+
+        packed = bytes(packed)
+        if len(packed) % 3:
+            raise ValueError("Packed colors must contain 3 bytes per color")
+
+        self._packed = packed
+        self._colors = PackedColors(packed)
+        self._tables = dict()
+
+# -- Color generators --------------------------------------------------------
+
     def generate_rainbow(self, size, amplitude, center, frequency):
         """Generate colors with a Rainbow palette. Overwrites colors list.
 
@@ -45,13 +350,24 @@ class WheelItem:
         amplitude=127, center=128, frequency=0.3
         """
 
-        self.colors.clear()
+        if size >= VECTORIZE_THRESHOLD and load_numpy() is not None:
+            try:
+                palette = rainbow_array(size, amplitude, center, frequency)
+            except ValueError:
+                pass # colors outside 0-255, not representable as bytes
+            else:
+                self._set_packed(palette.tobytes())
+                return
+
+        colors = list()
 
         for i in range(size):
             red = math.sin(frequency*i + 0) * amplitude + center
             green = math.sin(frequency*i + 2) * amplitude + center
             blue = math.sin(frequency*i + 4) * amplitude + center
-            self.colors.append(ColorItem(red=int(red), green=int(green), blue=int(blue)))
+            colors.append(ColorItem(red=int(red), green=int(green), blue=int(blue)))
+
+        self.colors = colors
 
     def from_float_list(self, color_list):
         """Convert a list of float RGB tuples to native format
@@ -69,15 +385,344 @@ class WheelItem:
                 A list of colors in float format(0.0-1.0 for each segment)
         """
 
-        self.colors.clear()
+        colors = list()
 
         for color in color_list:
             new_color = ColorItem(0, 0, 0)
             new_color.from_float(color)
-            self.colors.append(new_color)
+            colors.append(new_color)
+
+        self.colors = colors
+
+# -- Bulk color transforms ---------------------------------------------------
+#
+# Transforms work on the packed color table of the whole wheel at once, and
+# return a new wheel item. Colors must be in the 0-255 range.
+
+    def apply_luts(self, luts, name=""):
+        """Map every color component through a lookup table.
+
+        Parameters
+        ----------
+            luts:
+                a 256 byte lookup table applied to all channels, or a tuple of
+                three tables for red, green and blue
+            name:
+                name of the new wheel item. If no name is provided, uses
+                original name with the '_mapped' suffix
+
+        Returns
+        -------
+        WheelItem
+            A new wheel item with mapped colors
+        """
+
+        new_name = name if name else f"{self.name}_mapped"
+        packed = self.packed
+
+        if len(luts) == 3:
+            mapped = bytearray(len(packed))
+            for channel, lut in enumerate(luts):
+                mapped[channel::3] = packed[channel::3].translate(bytes(lut))
+        else:
+            mapped = packed.translate(bytes(luts))
+
+        return type(self).from_packed(new_name, mapped)
+
+    def complemented(self, name=""):
+        """Complement (opposite) colors of the whole wheel. Same as
+        ``ColorItem.complement`` for every color.
+
+        If no name is provided, uses original name with the '_complement' suffix"""
+
+        new_name = name if name else f"{self.name}_complement"
+        packed = self.packed
+
+        numpy = load_numpy() if len(self.colors) >= VECTORIZE_THRESHOLD else None
+        if numpy is not None:
+            colors = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(-1, 3).astype(numpy.int16)
+            keys = colors.min(axis=1) + colors.max(axis=1)
+            complement = (keys[:, None] - colors).astype(numpy.uint8)
+            return type(self).from_packed(new_name, complement.tobytes())
+
+        reds, greens, blues = packed[0::3], packed[1::3], packed[2::3]
+        keys = [min(color) + max(color) for color in zip(reds, greens, blues)]
+        complement = bytearray(len(packed))
+        complement[0::3] = bytes(map(operator.sub, keys, reds))
+        complement[1::3] = bytes(map(operator.sub, keys, greens))
+        complement[2::3] = bytes(map(operator.sub, keys, blues))
+        return type(self).from_packed(new_name, complement)
+
+    def scaled(self, factor, name=""):
+        """Scale brightness of all colors by factor. Components are limited
+        to 255.
+
+        If no name is provided, uses original name with the '_scaled' suffix"""
+
+        new_name = name if name else f"{self.name}_scaled"
+        lut = bytes(min(255, int(value * factor)) for value in range(256))
+        return self.apply_luts(lut, new_name)
+
+    def gamma_corrected(self, gamma, name=""):
+        """Apply gamma correction to all colors, i.e. every component
+        becomes ``255 * (value/255) ** gamma``, rounded.
+
+        If no name is provided, uses original name with the '_gamma' suffix"""
+
+        new_name = name if name else f"{self.name}_gamma"
+        lut = bytes(int(round(255 * (value / 255) ** gamma)) for value in range(256))
+        return self.apply_luts(lut, new_name)
+
+    def inverted(self, name=""):
+        """Invert all colors, i.e. every component becomes ``255 - value``.
+
+        If no name is provided, uses original name with the '_inverted' suffix"""
+
+        new_name = name if name else f"{self.name}_inverted"
+        lut = bytes(255 - value for value in range(256))
+        return self.apply_luts(lut, new_name)
+
+    def blended(self, other, ratio=0.5, name=""):
+        """Blend colors with colors of another wheel.
+
+        Every component becomes ``value * (1 - ratio) + other_value * ratio``,
+        calculated in 8 bit fixed point. If the other wheel is shorter, its
+        colors are repeated, a one color wheel blends all colors with the same
+        color.
+
+        Parameters
+        ----------
+            other:
+                :doc:`wheel_item` to blend with
+            ratio:
+                weight of the other wheel colors, 0.0-1.0
+            name:
+                name of the new wheel item. If no name is provided, uses
+                original name with the '_blend' suffix
+        """
+
+        new_name = name if name else f"{self.name}_blend"
+        packed = self.packed
+        other_packed = other.packed
+        if not other_packed:
+            raise ValueError(f"Cannot blend with empty wheel '{other.name}'")
+        repeats = -(-len(packed) // len(other_packed))
+        other_packed = (other_packed * repeats)[:len(packed)]
+
+        weight = int(round(min(max(ratio, 0.0), 1.0) * 256))
+        numpy = load_numpy() if len(self.colors) >= VECTORIZE_THRESHOLD else None
+        if numpy is not None:
+            colors = numpy.frombuffer(packed, dtype=numpy.uint8).astype(numpy.uint16)
+            others = numpy.frombuffer(other_packed, dtype=numpy.uint8).astype(numpy.uint16)
+            blend = (colors * (256 - weight) + others * weight + 128) >> 8
+            return type(self).from_packed(new_name, blend.astype(numpy.uint8).tobytes())
+
+        inverse = 256 - weight
+        blend = bytes((value * inverse + other_value * weight + 128) >> 8
+                      for value, other_value in zip(packed, other_packed))
+        return type(self).from_packed(new_name, blend)
+
+# -- Quantization ------------------------------------------------------------
+#
+# Arbitrary RGB values are mapped to the nearest wheel color (squared euclidean
+# distance) through a lookup grid: the RGB cube is split into 2**bits cells per
+# channel, and the grid holds the index of the wheel color nearest to the center
+# of every cell. The grid is cached with the other color tables.
+
+    def quantization_grid(self, bits=QUANTIZE_BITS):
+        """Lookup grid of nearest wheel color indexes.
+
+        Cell ``(red >> shift) << 2*bits | (green >> shift) << bits | blue >> shift``
+        (with ``shift = 8 - bits``) holds the index of the wheel color nearest
+        to the cell center. Ties go to the lower index.
+
+        Parameters
+        ----------
+            bits:
+                grid resolution per channel, 1-8. The grid has ``2**(3*bits)``
+                cells, 32768 for the default of 5 bits
+
+        Returns
+        -------
+        bytes or array.array
+            One index per cell, bytes for wheels of up to 256 colors, an array
+            of unsigned shorts otherwise
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception for invalid bits, an empty wheel or
+            colors outside 0-255
+        """
+
+        key = f"quantization_grid_{bits}"
+        grid = self._cached_table(key)
+        if grid is not None:
+            return grid
+
+        if not 1 <= bits <= 8:
+            raise ValueError("Quantization grid bits must be in range 1-8")
+        if not self.colors:
+            raise ValueError(f"Wheel '{self.name}' has no colors to quantize to")
+
+        packed = self.packed
+        size = len(self.colors)
+        levels = 1 << bits
+        shift = 8 - bits
+        centers = [(level << shift) + ((1 << shift) >> 1) for level in range(levels)]
+
+        numpy = load_numpy() if size * levels >= VECTORIZE_THRESHOLD else None
+        if numpy is not None:
+            palette = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(-1, 3).astype(numpy.int32)
+            axis = numpy.array(centers, dtype=numpy.int32)
+            cells = numpy.stack(numpy.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+            indexes = numpy.empty(len(cells), dtype=numpy.uint8 if size <= 256 else numpy.uint16)
+            # limit the distance matrix of a chunk to about a million entries
+            chunk = max(1, (1 << 20) // size)
+            # |cell - color|**2 without the |cell|**2 term, constant per cell
+            norms = (palette * palette).sum(axis=1)
+            for start in range(0, len(cells), chunk):
+                products = cells[start:start + chunk] @ palette.T
+                indexes[start:start + chunk] = (norms - 2 * products).argmin(axis=1)
+            grid = indexes.tobytes() if size <= 256 else array.array("H", indexes.tobytes())
+        else:
+            # distances per channel and level, summed per cell with map
+            distances = [[[(center - value) ** 2 for value in packed[channel::3]]
+                          for center in centers] for channel in range(3)]
+            grid = bytearray(levels ** 3) if size <= 256 else array.array("H", bytes(2 * levels ** 3))
+            position = 0
+            for red in distances[0]:
+                for green in distances[1]:
+                    partial = list(map(operator.add, red, green))
+                    for blue in distances[2]:
+                        cell = list(map(operator.add, partial, blue))
+                        grid[position] = cell.index(min(cell))
+                        position += 1
+            if size <= 256:
+                grid = bytes(grid)
+
+        self._tables[key] = grid
+        return grid
+
+    def quantize_indexes(self, frame, bits=QUANTIZE_BITS):
+        """Map every RGB pixel of a frame to the index of the nearest wheel
+        color.
+
+        Parameters
+        ----------
+            frame:
+                bytes-like object (or NumPy uint8 array) with 3 bytes (red,
+                green, blue) per pixel
+            bits:
+                grid resolution, see ``quantization_grid``
+
+        Returns
+        -------
+        bytes or array.array
+            One index per pixel, bytes for wheels of up to 256 colors, an array
+            of unsigned shorts otherwise
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if frame doesn't contain whole pixels,
+            see also ``quantization_grid``
+        """
+
+        grid = self.quantization_grid(bits)
+        pixels = memoryview(frame).cast("B")
+        if len(pixels) % 3:
+            raise ValueError("Frame must contain 3 bytes per pixel")
+        shift = 8 - bits
+
+        numpy = load_numpy() if len(pixels) >= 3 * VECTORIZE_THRESHOLD else None
+        if numpy is not None:
+            colors = numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(-1, 3).astype(numpy.int32)
+            colors >>= shift
+            cells = (colors[:, 0] << (2 * bits)) | (colors[:, 1] << bits) | colors[:, 2]
+            dtype = numpy.uint8 if isinstance(grid, bytes) else numpy.uint16
+            indexes = numpy.frombuffer(grid, dtype=dtype)[cells].tobytes()
+            return indexes if isinstance(grid, bytes) else array.array("H", indexes)
+
+        red_cells = tuple((value >> shift) << (2 * bits) for value in range(256))
+        green_cells = tuple((value >> shift) << bits for value in range(256))
+        blue_cells = tuple(value >> shift for value in range(256))
+        indexes = [grid[red_cells[red] | green_cells[green] | blue_cells[blue]]
+                   for red, green, blue in zip(pixels[0::3], pixels[1::3], pixels[2::3])]
+        return bytes(indexes) if isinstance(grid, bytes) else array.array("H", indexes)
+
+    def quantize(self, frame, out=None, bits=QUANTIZE_BITS):
+        """Replace every RGB pixel of a frame with the nearest wheel color.
+
+        Parameters
+        ----------
+            frame:
+                bytes-like object (or NumPy uint8 array) with 3 bytes (red,
+                green, blue) per pixel
+            out:
+                optional writable buffer of at least the frame size. May be
+                the frame itself
+            bits:
+                grid resolution, see ``quantization_grid``
+
+        Returns
+        -------
+        bytearray or the supplied buffer
+            packed RGB frame of wheel colors
+
+        Raises
+        ------
+        ValueError
+            Raises ValueError exception if out is too small, see also
+            ``quantize_indexes``
+        """
+
+        indexes = self.quantize_indexes(frame, bits)
+        length = 3 * len(indexes)
+        if out is None:
+            out = bytearray(length)
+        elif len(out) < length:
+            raise ValueError(f"Output buffer too small, {length} bytes required")
+        target = memoryview(out).cast("B")
+        packed = self.packed
+
+        numpy = load_numpy() if len(indexes) >= VECTORIZE_THRESHOLD else None
+        if numpy is not None:
+            palette = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(-1, 3)
+            pixels = numpy.frombuffer(target, dtype=numpy.uint8, count=length).reshape(-1, 3)
+            numpy.take(palette, numpy.frombuffer(indexes, dtype=numpy.uint8
+                                                 if isinstance(indexes, bytes)
+                                                 else numpy.uint16),
+                       axis=0, out=pixels)
+            return out
+
+        for channel in range(3):
+            values = packed[channel::3]
+            if isinstance(indexes, bytes):
+                target[channel:length:3] = indexes.translate(values.ljust(256, b"\0"))
+            else:
+                target[channel:length:3] = bytes(values[index] for index in indexes)
+        return out
 
 # -- class methods -----------------------------------------------------------
 
+    @classmethod
+    def from_packed(cls, name, packed):
+        """Create a wheel item from colors packed as RGB triplets.
+
+        Parameters
+        ----------
+            name:
+                Name of the new wheel item
+            packed:
+                bytes-like object with 3 bytes (red, green, blue) per color,
+                see ``packed``
+        """
+
+        new_wheel_item = cls(name, ())
+        new_wheel_item._set_packed(packed)
+        return new_wheel_item
+
     @classmethod
     def complement_wheel_item(cls, reference_wheel, name=""):
         """Use the reference wheel to create a similar, but color complementing
@@ -86,13 +731,14 @@ class WheelItem:
         If no name is provided, uses original name with the '_complement' suffix"""
 
         new_name = name if name else f"{reference_wheel.name}_complement"
-        new_wheel_item = cls(new_name, list())
-
-        for old_color in reference_wheel.colors:
-            new_color = old_color.complement
-            new_wheel_item.colors.append(new_color)
+        try:
+            complement = reference_wheel.complemented(new_name)
+        except ValueError:
+            pass # colors outside 0-255, complement color by color
+        else:
+            return cls(new_name, complement.colors)
 
-        return new_wheel_item
+        return cls(new_name, [old_color.complement for old_color in reference_wheel.colors])
 
     @classmethod
     def rainbow_wheel_item(cls, name, size, amplitude=127, center=128, frequency=0.3):
@@ -100,7 +746,7 @@ class WheelItem:
         defaults.
         """
 
-        new_wheel_item = cls(name, list())
+        new_wheel_item = cls(name, ())
         new_wheel_item.generate_rainbow(size,
                                         amplitude=amplitude,
                                         center=center,
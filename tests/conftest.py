@@ -0,0 +1,24 @@
+"""Shared fixtures. Tests run against the sources in ``src``, like the
+benchmarks."""
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from colorwheels import wheel_item  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with the pure Python code paths, and with NumPy if it is
+    installed"""
+
+    if request.param == "numpy":
+        numpy = pytest.importorskip("numpy")
+        monkeypatch.setattr(wheel_item, "_numpy", numpy)
+    else:
+        monkeypatch.setattr(wheel_item, "_numpy", None)
+    return request.param
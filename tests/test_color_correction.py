@@ -0,0 +1,68 @@
+"""ColorCorrection: lookup tables and the corrected generator output"""
+
+import pytest
+
+from colorwheels import Colorwheels, ColorwheelsContext, ColorCorrection, WheelItem
+from colorwheels.colorwheels import CORRECTED_CACHE_SIZE
+
+
+def test_per_channel_values_from_any_sequence():
+    correction = ColorCorrection(gamma=[2.2, 2.0, 1.8], temperature=[1.0, 0.9, 0.8])
+    assert correction == ColorCorrection(gamma=(2.2, 2.0, 1.8), temperature=(1.0, 0.9, 0.8))
+    assert correction.luts == ColorCorrection(gamma=(2.2, 2.0, 1.8),
+                                              temperature=(1.0, 0.9, 0.8)).luts
+    hash(correction)
+    with pytest.raises(ValueError):
+        ColorCorrection(gamma=[2.2, 2.0])
+    with pytest.raises(ValueError):
+        ColorCorrection(temperature=(1.0,))
+
+
+def reference(value, gamma, brightness, factor):
+    return min(255, max(0, int(round(255 * (value / 255) ** gamma * brightness * factor))))
+
+
+def test_luts_follow_the_formula():
+    correction = ColorCorrection(gamma=(2.2, 1.0, 0.5), brightness=0.8,
+                                 temperature=(1.0, 0.9, 1.2))
+    for lut, gamma, factor in zip(correction.luts, (2.2, 1.0, 0.5), (1.0, 0.9, 1.2)):
+        assert list(lut) == [reference(value, gamma, 0.8, factor) for value in range(256)]
+
+
+def test_identity():
+    assert ColorCorrection().is_identity
+    assert not ColorCorrection(brightness=0.5).is_identity
+    assert ColorCorrection(gamma=2.2).with_brightness(0.5) == \
+        ColorCorrection(gamma=2.2, brightness=0.5)
+
+
+@pytest.fixture
+def wheels():
+    generator = Colorwheels(context=ColorwheelsContext())
+    generator.active_wheel = WheelItem.rainbow_wheel_item("rainbow", 10)
+    return generator
+
+
+def test_generator_serves_corrected_colors(wheels):
+    original = wheels.active_wheel.table()
+    correction = ColorCorrection(gamma=2.2, brightness=0.5)
+    wheels.set_color_correction(correction)
+    red, green, blue = correction.luts
+    assert [next(wheels) for _ in range(10)] == [
+        (red[r], green[g], blue[b]) for r, g, b in original]
+    assert wheels.active_wheel.table() == original
+
+    wheels.set_brightness(1.0)
+    assert wheels.color_correction == ColorCorrection(gamma=2.2)
+    wheels.set_color_correction(ColorCorrection())
+    assert wheels.color_correction is None
+    assert wheels.peek() == original[0]
+
+
+def test_corrected_wheels_cache_is_bounded(wheels):
+    wheels.set_brightness(0.5)
+    context = wheels.wheel_configurations
+    for index in range(3 * CORRECTED_CACHE_SIZE):
+        context.add_wheel_item(WheelItem.rainbow_wheel_item(f"rainbow-{index}", 5))
+        wheels.activate_colorwheel(f"rainbow-{index}")
+    assert len(wheels._corrected_wheels) == CORRECTED_CACHE_SIZE
@@ -0,0 +1,116 @@
+"""Frame export round trips: files, named pipes and shared memory"""
+
+import os
+import threading
+
+import pytest
+
+from colorwheels import (Colorwheels, ColorwheelsContext, FrameReader, FrameWriter,
+                         RingBufferReader, RingBufferWriter)
+
+
+def rainbow_generator(generator_type="rgb_tuple"):
+    wheels = Colorwheels(context=ColorwheelsContext())
+    wheels.rainbow(50)
+    wheels.set_generator_type(generator_type)
+    return wheels
+
+
+def expected_frames(count, frame_size, generator_type="rgb_tuple"):
+    reference = rainbow_generator(generator_type)
+    return [bytes(reference.next_batch(frame_size)) for _ in range(count)]
+
+
+def test_file_round_trip(tmp_path):
+    filename = tmp_path / "frames.cwf"
+    with FrameWriter(str(filename), 16) as writer:
+        writer.export(rainbow_generator(), 10)
+
+    with FrameReader(str(filename)) as reader:
+        assert (reader.channels, reader.frame_size) == (3, 16)
+        frames = [bytes(frame) for frame in reader]
+    assert frames == expected_frames(10, 16)
+
+
+def test_file_read_while_written(tmp_path):
+    filename = str(tmp_path / "frames.cwf")
+    frames = [bytes(range(start, start + 12)) for start in (0, 12, 24)]
+    writer = FrameWriter(filename, 4)
+    writer.flush()
+    reader = FrameReader(filename)
+    try:
+        assert reader.read_frame() is None
+        writer.write_frame(frames[0])
+        writer.flush()
+        first = bytes(reader.read_frame())
+        assert reader.read_frame() is None
+        writer.write_frame(frames[1])
+        writer._stream.write(frames[2][:6]) # half a frame
+        writer.flush()
+        second = bytes(reader.read_frame())
+        assert reader.read_frame() is None
+        writer._stream.write(frames[2][6:])
+        writer.flush()
+        third = bytes(reader.read_frame())
+    finally:
+        writer.close()
+        reader.close()
+    assert [first, second, third] == frames
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes need POSIX")
+def test_pipe_round_trip(tmp_path):
+    pipe = str(tmp_path / "frames.fifo")
+    os.mkfifo(pipe)
+
+    def produce():
+        with FrameWriter(pipe, 16, channels=4) as writer:
+            writer.export(rainbow_generator("rgba_tuple"), 5)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    with FrameReader(pipe) as reader:
+        frames = [bytes(frame) for frame in reader]
+    thread.join()
+    assert frames == expected_frames(5, 16, "rgba_tuple")
+
+
+def test_ring_buffer_round_trip():
+    pytest.importorskip("multiprocessing.shared_memory")
+    writer = RingBufferWriter(8, slots=4)
+    reader = RingBufferReader(writer.name)
+    try:
+        generator = rainbow_generator()
+        expected = expected_frames(10, 8)
+        assert reader.read_frame() is None
+
+        writer.export(generator, 2)
+        assert [bytes(reader.read_frame()), bytes(reader.read_frame())] == expected[:2]
+        assert reader.read_frame() is None
+
+        # of 4 slots, 3 hold readable frames, the oldest is being overwritten
+        writer.export(generator, 6)
+        frame = reader.read_frame()
+        assert bytes(frame) == expected[5]
+        assert reader.frames_lost == 3
+        assert reader.is_valid()
+        del frame
+
+        latest = reader.latest()
+        assert bytes(latest) == expected[7]
+        assert reader.frames_lost == 4
+        assert reader.is_valid()
+        assert reader.read_frame() is None
+        del latest
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_invalid_streams(tmp_path):
+    filename = tmp_path / "not_frames"
+    filename.write_bytes(b"not a frame stream")
+    with pytest.raises(ValueError):
+        FrameReader(str(filename))
+    with pytest.raises(ValueError):
+        FrameWriter(str(tmp_path / "frames.cwf"), 4).write_frame(b"123")
@@ -0,0 +1,72 @@
+"""ColorItem and FrozenColor: slots, interning, 24 bit values"""
+
+import dataclasses
+import gc
+import pickle
+
+import pytest
+
+from colorwheels import ColorItem, FrozenColor, WheelItem
+
+
+def test_color_item_has_slots():
+    color = ColorItem(255, 128, 0)
+    assert not hasattr(color, "__dict__")
+    with pytest.raises(AttributeError):
+        color.alpha = 255
+    color.red = 10
+    assert color.color == (10, 128, 0)
+
+
+def test_frozen_colors_are_interned():
+    red = FrozenColor(255, 0, 0)
+    assert FrozenColor(255.0, 0, 0) is red
+    assert ColorItem(255, 0, 0).frozen() is red
+    assert FrozenColor.from_rgb24(0xff0000) is red
+    assert pickle.loads(pickle.dumps(red)) is red
+    assert red.thawed() == ColorItem(255, 0, 0)
+    assert red == ColorItem(255, 0, 0)
+    assert {red: "alarm"}[FrozenColor(255, 0, 0)] == "alarm"
+
+
+def test_frozen_colors_are_immutable():
+    color = FrozenColor(1, 2, 3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        color.red = 10
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del color.green
+    with pytest.raises(ValueError):
+        FrozenColor(256, 0, 0)
+    with pytest.raises(ValueError):
+        FrozenColor(0, -1, 0)
+
+
+@pytest.mark.parametrize("rgb", [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255),
+                                 (18, 52, 86), (255, 255, 255)])
+def test_rgb24_and_conversions_agree(rgb):
+    color, frozen = ColorItem(*rgb), FrozenColor(*rgb)
+    assert color.rgb24 == frozen.rgb24 == (rgb[0] << 16) | (rgb[1] << 8) | rgb[2]
+    assert FrozenColor.from_rgb24(frozen.rgb24).color == rgb
+    assert frozen.color_hex == color.color_hex == "#{:02x}{:02x}{:02x}".format(*rgb)
+    assert frozen.complement.color == color.complement.color
+
+    floats = tuple(value / 255 for value in rgb)
+    thawed = ColorItem(0, 0, 0)
+    thawed.from_float(floats)
+    assert FrozenColor.from_float(floats).color == thawed.color
+
+
+def test_unused_colors_are_freed():
+    gc.collect()
+    before = FrozenColor.interned_count()
+    wheel = WheelItem.from_packed("gray", bytes(value for value in range(256) for _ in range(3)))
+    colors = list(wheel.colors)
+    assert FrozenColor.interned_count() >= before + 200
+    del colors
+    gc.collect()
+    assert FrozenColor.interned_count() <= before + 1
+
+    # the table of references is swept while it grows
+    for value in range(1 << 16):
+        FrozenColor.from_rgb24(value)
+    assert len(FrozenColor._interned) < 1 << 16
@@ -0,0 +1,108 @@
+"""ColorStream: frame clock, missed deadlines and frames, on a simulated clock"""
+
+import asyncio
+
+import pytest
+
+from colorwheels import Colorwheels, ColorStream, ColorwheelsContext
+
+
+class Clock:
+    """Loop time, which only advances by sleeping, or by consumers doing
+    work"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    simulated = Clock()
+    monkeypatch.setattr(asyncio, "sleep", simulated.sleep)
+    return simulated
+
+
+def run(clock, stream, work=lambda frame: 0.0):
+    """Consume stream. Returns (time, value) of every frame. work returns the
+    seconds the consumer spends on a frame"""
+
+    async def consume():
+        asyncio.get_running_loop().time = clock.time
+        frames = []
+        async for value in stream:
+            frames.append((clock.now, value))
+            clock.now += work(len(frames) - 1)
+        return frames
+
+    return asyncio.run(consume())
+
+
+def rainbow_generator(size=10):
+    wheels = Colorwheels(context=ColorwheelsContext())
+    wheels.rainbow(size)
+    return wheels
+
+
+def test_frames_are_served_on_time(clock):
+    reference = rainbow_generator()
+    frames = run(clock, rainbow_generator().stream(rate=10, max_frames=25),
+                 work=lambda frame: 0.05)
+    assert [value for _, value in frames] == [next(reference) for _ in range(25)]
+    # without drift, although every frame takes half a period of work
+    assert [round(time, 9) for time, _ in frames] == [round(100 + 0.1 * i, 9) for i in range(25)]
+
+
+def test_late_frames_count_as_missed_deadlines(clock):
+    stream = ColorStream(rainbow_generator(), rate=10, max_frames=4)
+    frames = run(clock, stream, work=lambda frame: 0.25 if frame == 0 else 0.0)
+    # frame 1 is late by 1.5 periods: it is served at once, and frame 2 is skipped
+    assert [round(time, 9) for time, _ in frames] == [100.0, 100.25, 100.3, 100.4]
+    assert stream.missed_deadlines == 2
+    assert stream.frames == 4
+
+    stream = ColorStream(rainbow_generator(), rate=10, max_frames=3)
+    run(clock, stream, work=lambda frame: 0.01 if frame == 0 else 0.12)
+    assert stream.missed_deadlines == 1
+
+
+def test_frames_of_many_generators(clock):
+    generators = [rainbow_generator(10), rainbow_generator(7)]
+    generators[1].set_generator_type("rgba_tuple")
+    references = [rainbow_generator(10), rainbow_generator(7)]
+    references[1].set_generator_type("rgba_tuple")
+    stream = ColorStream(generators, rate=30, frame_size=4, max_frames=3)
+
+    served, buffers = [], set()
+
+    async def consume():
+        async for frame in stream:
+            # frame buffers are reused, a frame is valid until the next iteration
+            served.append([bytes(part) for part in frame])
+            buffers.add(tuple(id(part) for part in frame))
+
+    asyncio.run(consume())
+    assert served == [[bytes(reference.next_batch(4)) for reference in references]
+                      for _ in range(3)]
+    assert len(buffers) == 1
+
+
+def test_stop(clock):
+    stream = rainbow_generator().stream(rate=10)
+
+    def stop_after_third(frame):
+        if frame == 2:
+            stream.stop()
+        return 0.0
+
+    assert len(run(clock, stream, work=stop_after_third)) == 3
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        ColorStream(rainbow_generator(), rate=0)
@@ -0,0 +1,73 @@
+"""Colorwheels generator: cursor moves, empty wheels, metrics"""
+
+import pytest
+
+from colorwheels import (Colorwheels, ColorwheelsContext, WheelItem, disable_metrics,
+                         enable_metrics)
+
+
+@pytest.fixture
+def wheels():
+    generator = Colorwheels(context=ColorwheelsContext())
+    generator.active_wheel = WheelItem.rainbow_wheel_item("rainbow", 10)
+    return generator
+
+
+def test_cursor_moves(wheels):
+    table = wheels.active_wheel.table()
+    wheels.seek(23)
+    assert wheels.peek() == table[3]
+    assert next(wheels) == table[3]
+    assert wheels.previous() == table[3]
+    wheels.skip(-4)
+    assert wheels.counter == 9
+    assert wheels.color_at(-1) == table[9]
+    assert bytes(wheels.next_batch(3)) == b"".join(bytes(table[i % 10]) for i in (9, 10, 11))
+    assert wheels.counter == 2
+
+
+@pytest.mark.parametrize("brightness", [None, 0.5])
+def test_replaced_colors_are_served_after_refresh(wheels, brightness):
+    if brightness is not None:
+        wheels.set_brightness(brightness)
+    old = wheels._output_wheel.table()
+    wheels.skip(7)
+    wheels.active_wheel.colors = WheelItem.rainbow_wheel_item("long", 30).colors
+
+    assert [next(wheels), wheels.next(), wheels.next_rgba()[:3]] == list(old[7:10])
+    assert wheels.next_hex() == wheels._output_wheel.table("hexadecimal")[0]
+    assert wheels.counter == 1
+
+    wheels.refresh()
+    new = wheels._output_wheel.table()
+    assert len(new) == 30
+    assert [wheels.next() for _ in range(30)] == list(new[1:] + new[:1])
+
+def test_empty_wheel(wheels):
+    wheels.seek(5)
+    wheels.rainbow(0)
+    assert wheels.counter == 0
+    wheels.seek(3)
+    wheels.skip(2)
+    assert wheels.counter == 0
+    for method in (wheels.peek, wheels.previous, lambda: wheels.color_at(1),
+                   lambda: wheels.next_batch(1), lambda: next(wheels)):
+        with pytest.raises(IndexError):
+            method()
+    assert wheels.next_batch(0) == bytearray()
+
+
+def test_metrics_count_every_color_once(wheels):
+    metrics = enable_metrics()
+    try:
+        metrics.reset()
+        next(wheels)
+        wheels.next()
+        wheels.next_rgba()
+        wheels.next_rgba(alpha=10)
+        wheels.next_hex()
+        wheels.previous()
+        wheels.next_batch(5)
+        assert metrics.snapshot()["colors_served"] == {"rainbow": 11}
+    finally:
+        disable_metrics()
@@ -0,0 +1,100 @@
+"""Loading, caching and reloading of YAML definitions"""
+
+import os
+
+import pytest
+
+from colorwheels import ColorwheelsContext, PaletteWatcher
+
+yaml = pytest.importorskip("yaml")
+
+DEFINITIONS = """
+meta:
+    release: "1"
+wheels:
+    - wheel:
+        name: "rgb"
+        colors:
+            - rgb: [255, 0, 0]
+            - rgb: [0, 255, 0]
+            - rgb: [0, 0, 255]
+    - wheel:
+        name: "rainbow"
+        type: "rainbow"
+        size: 20
+"""
+
+
+@pytest.fixture
+def definition_file(tmp_path):
+    filename = tmp_path / "wheels.yml"
+    filename.write_text(DEFINITIONS)
+    return str(filename)
+
+
+def rewrite(filename, text):
+    """Write text to filename, with a new modification time"""
+
+    status = os.stat(filename)
+    with open(filename, "w") as stream:
+        stream.write(text)
+    os.utime(filename, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+
+
+def test_load_and_reload(definition_file):
+    context = ColorwheelsContext()
+    context.load_wheels(definition_file)
+    assert context.wheel_names[:2] == ["rgb", "rainbow"]
+    assert context.reload_wheels(definition_file) == []
+
+    rewrite(definition_file, DEFINITIONS.replace("size: 20", "size: 30"))
+    assert context.reload_wheels(definition_file) == ["rainbow"]
+    assert len(context.find_wheel("rainbow").colors) == 30
+
+
+def test_cached_load_keeps_definitions(definition_file, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    ColorwheelsContext().load_wheels(definition_file, cache_dir=cache_dir)
+
+    context = ColorwheelsContext()
+    context.load_wheels(definition_file, cache_dir=cache_dir)
+    assert context.find_wheel("rgb").table() == ((255, 0, 0), (0, 255, 0), (0, 0, 255))
+    assert context.reload_wheels(definition_file) == []
+
+
+def test_wheels_outside_byte_range_are_not_cached(definition_file, tmp_path):
+    rewrite(definition_file, DEFINITIONS + "        amplitude: 200\n")
+    cache_dir = tmp_path / "cache"
+    context = ColorwheelsContext()
+    context.load_wheels(definition_file, cache_dir=str(cache_dir))
+    assert context.find_wheel("rainbow").table()[0] == (128, 309, -23)
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("wheel, message", [
+    ('name: "x"', "no list of colors"),
+    ('name: "x"\n        colors:\n            - rgb: [1, 2]', "without rgb value"),
+    ('colors: []', "without name"),
+    ('name: "x"\n        type: "spiral"', "Unknown wheel type"),
+    ('name: "x"\n        colors:\n            - rgb: [1, "2", 3]', "non-numeric rgb value"),
+    ('name: "x"\n        type: "rainbow"\n        size: "x"', "invalid size"),
+    ('name: "x"\n        type: "rainbow"\n        size: 2.5', "invalid size"),
+    ('name: "x"\n        type: "rainbow"\n        amplitude: [1]', "non-numeric amplitude"),
+    ('name: "x"\n        type: "rainbow"\n        frequency: true', "non-numeric frequency"),
+])
+def test_invalid_definitions_fail_at_load(tmp_path, wheel, message):
+    filename = tmp_path / "invalid.yml"
+    filename.write_text(f'meta:\n    release: "1"\nwheels:\n    - wheel:\n        {wheel}\n')
+    with pytest.raises(ValueError, match=message):
+        ColorwheelsContext().load_wheels(str(filename))
+
+
+def test_watcher_loads_file_on_first_check(definition_file):
+    context = ColorwheelsContext()
+    watcher = PaletteWatcher(definition_file, context=context)
+    assert watcher.check() == []
+    assert "rainbow" in context.wheel_names
+    assert watcher.check() is None
+
+    rewrite(definition_file, DEFINITIONS.replace("255, 0, 0", "254, 0, 0"))
+    assert watcher.check() == ["rgb"]
@@ -0,0 +1,65 @@
+"""FrameRenderer against a pixel by pixel reference"""
+
+import itertools
+import math
+
+import pytest
+
+from colorwheels import Colorwheels, ColorwheelsContext, FrameRenderer, WheelItem
+
+
+def reference_frame(packed, width, height, spacing, direction, speed, offset,
+                    row_offset, serpentine, frame):
+    """Frame ``frame``, following the formula of the FrameRenderer docstring"""
+
+    size = len(packed) // 3
+    position = math.floor(offset + frame * speed)
+    pixels = bytearray()
+    for y in range(height):
+        columns = range(width)
+        if serpentine and y % 2:
+            columns = reversed(columns)
+        for x in columns:
+            index = (position + direction * spacing * x + row_offset * y) % size
+            pixels += packed[3 * index:3 * index + 3]
+    return bytes(pixels)
+
+
+LAYOUTS = list(itertools.product(
+    [1, 5, 40],         # width
+    [1, 3],             # height
+    [1, 7],             # spacing
+    [1, -1],            # direction
+    [1, -3, 0.5],       # speed
+    [0, 11],            # offset
+    [0, 4],             # row_offset
+    [False, True],      # serpentine
+))
+
+
+def test_render_matches_reference(backend):
+    wheel = WheelItem.rainbow_wheel_item("rainbow", 13)
+    for layout in LAYOUTS:
+        renderer = FrameRenderer(wheel, *layout)
+        buffer = bytearray(renderer.frame_size)
+        for frame in range(4):
+            assert bytes(renderer.render(buffer)) == \
+                reference_frame(wheel.packed, *layout, frame), (layout, frame)
+
+
+def test_renderer_of_generator_starts_at_counter():
+    wheels = Colorwheels(context=ColorwheelsContext())
+    wheels.rainbow(10)
+    wheels.skip(3)
+    renderer = wheels.frame_renderer(4)
+    assert bytes(renderer.render()) == bytes(wheels.next_batch(4))
+
+
+def test_invalid_layouts():
+    wheel = WheelItem.rainbow_wheel_item("rainbow", 13)
+    with pytest.raises(ValueError):
+        FrameRenderer(wheel, 0)
+    with pytest.raises(ValueError):
+        FrameRenderer(wheel, 4, spacing=0)
+    with pytest.raises(ValueError):
+        FrameRenderer(WheelItem("empty", []), 4)
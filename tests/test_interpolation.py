@@ -0,0 +1,64 @@
+"""InterpolatedWheel: fades between wheel colors"""
+
+import pytest
+
+from colorwheels import Colorwheels, ColorwheelsContext, InterpolatedWheel, WheelItem
+
+GRAYS = WheelItem.from_packed("grays", bytes(value for value in range(256) for _ in range(3)))
+
+
+@pytest.mark.parametrize("space", ["rgb", "linear"])
+def test_wheel_colors_are_served_exactly(space):
+    wheel = InterpolatedWheel(GRAYS, steps=4, space=space)
+    served = [next(wheel) for _ in range(4 * 256)]
+    assert served[0::4] == list(GRAYS.table())
+    assert [wheel.color_at(value) for value in range(256)] == list(GRAYS.table())
+
+
+def test_linear_fades_between_dark_colors():
+    dark = WheelItem.from_packed("dark", bytes([2, 2, 2, 9, 9, 9]))
+    wheel = InterpolatedWheel(dark, steps=8, space="linear")
+    fade = [next(wheel)[0] for _ in range(8)]
+    assert fade == sorted(fade)
+    assert len(set(fade)) > 4
+
+
+def test_rgb_fade_and_wrap_around():
+    wheel = InterpolatedWheel(WheelItem.from_packed("bw", bytes([0, 0, 0, 200, 100, 40])), steps=4)
+    assert [next(wheel) for _ in range(9)] == [
+        (0, 0, 0), (50, 25, 10), (100, 50, 20), (150, 75, 30),
+        (200, 100, 40), (150, 75, 30), (100, 50, 20), (50, 25, 10),
+        (0, 0, 0)]
+    assert wheel.position == 0.25
+
+
+def test_position_and_time():
+    wheel = InterpolatedWheel(WheelItem.from_packed("bw", bytes([0, 0, 0, 200, 100, 40])), steps=4)
+    wheel.position = 1.5
+    assert next(wheel) == (100, 50, 20)
+    assert wheel.color_at(-0.5) == (100, 50, 20)
+    assert wheel.color_at_time(3.0, seconds_per_color=2.0) == wheel.color_at(1.5)
+
+
+def test_linear_midpoint_is_brighter():
+    red_green = WheelItem.from_packed("rg", bytes([255, 0, 0, 0, 255, 0]))
+    rgb = InterpolatedWheel(red_green, steps=2).color_at(0.5)
+    linear = InterpolatedWheel(red_green, steps=2, space="linear").color_at(0.5)
+    assert rgb == (128, 128, 0)
+    assert linear[0] == linear[1] > 128
+
+
+def test_generator_interpolates_corrected_wheel():
+    wheels = Colorwheels(context=ColorwheelsContext())
+    wheels.active_wheel = WheelItem.from_packed("bw", bytes([0, 0, 0, 200, 100, 40]))
+    wheels.set_brightness(0.5)
+    assert wheels.interpolated(steps=2).color_at(1) == (100, 50, 20)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        InterpolatedWheel(WheelItem("empty", []))
+    with pytest.raises(ValueError):
+        InterpolatedWheel(GRAYS, steps=0)
+    with pytest.raises(ValueError):
+        InterpolatedWheel(GRAYS, space="hsv")
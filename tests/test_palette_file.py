@@ -0,0 +1,61 @@
+"""Binary palette files"""
+
+import pytest
+
+from colorwheels import ColorwheelsContext, WheelItem
+from colorwheels.palette_file import PaletteFile, save_palette
+
+
+@pytest.fixture
+def palette_file(tmp_path):
+    filename = str(tmp_path / "wheels.cwp")
+    save_palette(filename, [WheelItem.rainbow_wheel_item("rainbow", 20),
+                            WheelItem.from_packed("rgb", bytes([255, 0, 0, 0, 255, 0]))])
+    return filename
+
+
+def test_round_trip(palette_file):
+    with PaletteFile(palette_file) as palette:
+        assert palette.names == ["rainbow", "rgb"]
+        assert palette.release == "unknown"
+        assert palette.wheel("rainbow") == WheelItem.rainbow_wheel_item("rainbow", 20)
+        assert palette.wheel("rgb").table() == ((255, 0, 0), (0, 255, 0))
+        with pytest.raises(KeyError):
+            palette.wheel("missing")
+
+
+def test_context_round_trip(palette_file, tmp_path):
+    context = ColorwheelsContext()
+    context.load_palette(palette_file, add_base_colors=False)
+    assert context.wheel_names == ["rainbow", "rgb"]
+    assert context.find_wheel("rgb").packed == bytes([255, 0, 0, 0, 255, 0])
+
+    copy = str(tmp_path / "copy.cwp")
+    context.save_palette(copy)
+    with open(palette_file, "rb") as original, open(copy, "rb") as saved:
+        assert original.read() == saved.read()
+
+
+def test_wheels_outside_byte_range_cannot_be_saved(tmp_path):
+    with pytest.raises(ValueError):
+        save_palette(str(tmp_path / "wide.cwp"),
+                     [WheelItem.rainbow_wheel_item("wide", 10, amplitude=200)])
+
+
+def test_other_files_are_rejected(tmp_path):
+    filename = tmp_path / "other.cwp"
+    filename.write_bytes(b"not a palette file, but long enough")
+    with pytest.raises(ValueError, match="not a palette file"):
+        PaletteFile(str(filename))
+    with pytest.raises(FileNotFoundError):
+        PaletteFile(str(tmp_path / "missing.cwp"))
+
+
+def test_truncated_files_fail_on_open(palette_file, tmp_path):
+    with open(palette_file, "rb") as stream:
+        data = stream.read()
+    truncated = tmp_path / "truncated.cwp"
+    for length in (0, 5, 14, 30, len(data) - 1):
+        truncated.write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            PaletteFile(str(truncated))
@@ -0,0 +1,167 @@
+"""ThreadSafeColorwheels: shared and per-thread cursors"""
+
+import collections
+import threading
+
+import pytest
+
+from colorwheels import ColorwheelsContext, ThreadSafeColorwheels, WheelItem
+
+THREADS = 4
+ROUNDS = 500
+
+
+def make_wheels(per_thread_cursors=False):
+    context = ColorwheelsContext()
+    for size in (3, 64, 1000):
+        context.add_wheel_item(WheelItem.rainbow_wheel_item(f"stress-{size}", size))
+    return ThreadSafeColorwheels(context=context, per_thread_cursors=per_thread_cursors)
+
+
+def pull(wheels, count, threads=THREADS):
+    """Pull count colors per thread, from threads started together. Returns
+    the colors served to every thread"""
+
+    barrier = threading.Barrier(threads)
+    served = [None] * threads
+
+    def worker(index):
+        barrier.wait()
+        served[index] = [next(wheels) for _ in range(count)]
+
+    pool = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return served
+
+
+def test_shared_cursor_serves_every_color_once():
+    wheels = make_wheels()
+    wheels.activate_colorwheel("stress-64")
+    table = wheels.active_wheel.table()
+
+    served = collections.Counter()
+    for colors in pull(wheels, 64 * ROUNDS):
+        served.update(colors)
+
+    # colors may repeat within the table, so compare per distinct color
+    for color, occurrences in collections.Counter(table).items():
+        assert served[color] == THREADS * ROUNDS * occurrences
+    assert wheels.counter == 0
+
+
+def test_per_thread_cursors_serve_the_whole_sequence():
+    wheels = make_wheels(per_thread_cursors=True)
+    wheels.activate_colorwheel("stress-64")
+    table = wheels.active_wheel.table()
+
+    for colors in pull(wheels, 100):
+        assert colors == [table[i % 64] for i in range(100)]
+
+
+def test_switching_never_serves_foreign_colors():
+    wheels = make_wheels()
+    valid = set()
+    for size in (3, 64, 1000):
+        valid.update(wheels.wheel_configurations.find_wheel(f"stress-{size}").table())
+    stop = threading.Event()
+
+    def switcher():
+        names = ["stress-3", "stress-64", "stress-1000"]
+        i = 0
+        while not stop.is_set():
+            wheels.activate_colorwheel(names[i % 3])
+            i += 1
+
+    thread = threading.Thread(target=switcher)
+    thread.start()
+    try:
+        served = pull(wheels, 5000)
+    finally:
+        stop.set()
+        thread.join()
+    assert all(set(colors) <= valid for colors in served)
+
+
+@pytest.mark.parametrize("per_thread_cursors", [False, True])
+def test_cursor_moves(per_thread_cursors):
+    wheels = make_wheels(per_thread_cursors)
+    wheels.activate_colorwheel("stress-64")
+    table = wheels.active_wheel.table()
+
+    wheels.seek(70)
+    assert wheels.counter == 6
+    assert wheels.peek() == table[6]
+    assert wheels.peek(60) == table[2]
+    assert next(wheels) == table[6]
+    assert wheels.previous() == table[6]
+    assert wheels.counter == 6
+    wheels.skip(-10)
+    assert wheels.counter == 60
+    assert wheels.color_at(-1) == table[63]
+    assert wheels.color_at(1, "hexadecimal") == wheels.active_wheel.table("hexadecimal")[1]
+    assert bytes(wheels.next_batch(8)) == b"".join(
+        bytes(table[i % 64]) for i in range(60, 68))
+    assert wheels.counter == 4
+
+    wheels.activate_colorwheel("stress-1000", keep_cursor=True)
+    assert wheels.counter == 4
+    wheels.activate_colorwheel("stress-3", keep_cursor=True)
+    assert wheels.counter == 1
+    wheels.activate_colorwheel("stress-64")
+    assert wheels.counter == 0
+
+
+def test_per_thread_cursors_move_independently():
+    wheels = make_wheels(per_thread_cursors=True)
+    wheels.activate_colorwheel("stress-64")
+    wheels.seek(10)
+    positions = []
+
+    def worker():
+        positions.append(wheels.counter)
+        wheels.skip(5)
+        positions.append(wheels.counter)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert positions == [0, 5]
+    assert wheels.counter == 10
+
+
+def test_empty_wheel():
+    wheels = ThreadSafeColorwheels(context=ColorwheelsContext())
+    wheels.rainbow(0)
+    assert wheels.counter == 0
+    wheels.skip(3)
+    for method in (wheels.peek, wheels.previous, lambda: wheels.color_at(1), lambda: next(wheels),
+                   wheels.next, wheels.next_rgba, wheels.next_hex):
+        with pytest.raises(IndexError):
+            method()
+    assert wheels.next_batch(0) == bytearray()
+
+
+def test_per_thread_cursors_keep_positions_on_rebind():
+    wheels = make_wheels(per_thread_cursors=True)
+    wheels.activate_colorwheel("stress-64")
+    wheels.seek(7)
+
+    def rebind(colors):
+        wheels.active_wheel.colors = colors
+        wheels.refresh()
+
+    longer = WheelItem.rainbow_wheel_item("longer", 100).colors
+    thread = threading.Thread(target=rebind, args=(longer,))
+    thread.start()
+    thread.join()
+    assert wheels.counter == 7
+
+    shorter = WheelItem.rainbow_wheel_item("shorter", 5).colors
+    thread = threading.Thread(target=rebind, args=(shorter,))
+    thread.start()
+    thread.join()
+    assert wheels.counter == 2
+    assert next(wheels) == wheels.active_wheel.table()[2]
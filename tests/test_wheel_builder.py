@@ -0,0 +1,40 @@
+"""build_wheels and generate_wheels: rainbows generated in worker processes"""
+
+import pytest
+
+from colorwheels import ColorwheelsContext, WheelItem, build_wheels
+
+SPECS = [{"name": f"rainbow-{size}", "size": size, "frequency": 0.1} for size in (1, 10, 300)]
+
+
+def expected(specs):
+    return [WheelItem.rainbow_wheel_item(spec["name"], spec["size"], frequency=spec["frequency"])
+            for spec in specs]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_wheels_match_rainbow_wheel_item(processes):
+    specs = SPECS + [{"wheel": {"name": "element", "type": "rainbow", "size": 5,
+                                    "frequency": 0.1}}]
+    wheels = build_wheels(specs, processes=processes)
+    assert wheels == expected(SPECS + [{"name": "element", "size": 5, "frequency": 0.1}])
+
+
+@pytest.mark.parametrize("specs, message", [
+    ([{"size": 5}], "without name"),
+    ([{"name": "twice"}, {"name": "twice"}], "defined twice"),
+    ([{"name": "colors", "type": "sequence"}], "cannot be built"),
+    ([{"name": "wide", "amplitude": 200}], "outside 0-255"),
+])
+def test_invalid_specs(specs, message):
+    with pytest.raises(ValueError, match=message):
+        build_wheels(specs, processes=1)
+
+
+def test_generate_wheels_adds_wheels():
+    context = ColorwheelsContext()
+    added = context.generate_wheels(SPECS, processes=2)
+    assert added == expected(SPECS)
+    assert context.find_wheel("rainbow-300") is added[2]
+    with pytest.raises(ValueError, match="Already exists"):
+        context.generate_wheels([{"name": "rainbow-10"}], processes=1)
@@ -0,0 +1,47 @@
+"""WheelGroup: wheels advancing in lockstep"""
+
+import pytest
+
+from colorwheels import Colorwheels, ColorwheelsContext, WheelGroup, WheelItem
+
+
+def reference_tick(wheels, offsets, tick):
+    return b"".join(bytes(wheel.table()[(tick + offset) % len(wheel.colors)])
+                    for wheel, offset in zip(wheels, offsets))
+
+
+def test_ticks_match_reference(backend):
+    wheels = [WheelItem.rainbow_wheel_item(f"rainbow-{size}", size) for size in (1, 5, 12, 100)]
+    offsets = [0, 3, -7, 250]
+    group = WheelGroup(wheels, offsets)
+    assert len(group) == 4
+    for tick in range(30):
+        assert bytes(group.tick()) == reference_tick(wheels, offsets, tick)
+
+    buffer = bytearray(12)
+    group.seek(1000)
+    assert group.current(out=buffer) is buffer
+    assert bytes(buffer) == reference_tick(wheels, offsets, 1000)
+    group.set_offset(1, 0)
+    assert bytes(group.current()) == reference_tick(wheels, [0, 0, -7, 250], 1000)
+    assert group.tick_count == 1000
+
+
+def test_generators_contribute_corrected_wheel_and_counter(backend):
+    generator = Colorwheels(context=ColorwheelsContext())
+    generator.rainbow(10)
+    generator.skip(4)
+    generator.set_brightness(0.5)
+    group = WheelGroup([generator, WheelItem.rainbow_wheel_item("plain", 3)])
+    assert group.offsets == (4, 0)
+    assert bytes(group.tick())[:3] == bytes(generator.peek())
+
+
+def test_invalid_groups():
+    wheel = WheelItem.rainbow_wheel_item("rainbow", 8)
+    with pytest.raises(ValueError):
+        WheelGroup([wheel, wheel], offsets=[0])
+    with pytest.raises(ValueError):
+        WheelGroup([wheel, WheelItem("empty", [])])
+    with pytest.raises(ValueError):
+        WheelGroup([wheel, wheel]).tick(out=bytearray(5))
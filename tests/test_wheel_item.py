@@ -0,0 +1,130 @@
+"""WheelItem: packed colors, bulk transforms, and quantization against brute
+force"""
+
+import dataclasses
+import random
+
+import pytest
+
+from colorwheels import ColorItem, FrozenColor, WheelItem
+
+
+def brute_force_indexes(wheel, frame, bits):
+    """Index of the wheel color nearest to the grid cell center of every pixel"""
+
+    shift = 8 - bits
+    half = (1 << shift) >> 1
+    palette = list(wheel.table())
+    indexes = []
+    for start in range(0, len(frame), 3):
+        center = [((value >> shift) << shift) + half for value in frame[start:start + 3]]
+        distances = [sum((c - p) ** 2 for c, p in zip(center, color)) for color in palette]
+        indexes.append(distances.index(min(distances)))
+    return indexes
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 300])
+@pytest.mark.parametrize("bits", [3, 5])
+def test_quantize_matches_brute_force(backend, size, bits):
+    rng = random.Random(size * 10 + bits)
+    wheel = WheelItem.from_packed("palette", bytes(rng.randrange(256) for _ in range(3 * size)))
+    frame = bytes(rng.randrange(256) for _ in range(3 * 400))
+
+    indexes = wheel.quantize_indexes(frame, bits)
+    assert list(indexes) == brute_force_indexes(wheel, frame, bits)
+
+    packed = wheel.packed
+    expected = b"".join(packed[3 * index:3 * index + 3] for index in indexes)
+    assert bytes(wheel.quantize(frame, bits=bits)) == expected
+
+    buffer = bytearray(frame)
+    assert wheel.quantize(buffer, out=buffer, bits=bits) is buffer
+    assert bytes(buffer) == expected
+
+
+def test_quantize_errors():
+    wheel = WheelItem.rainbow_wheel_item("rainbow", 8)
+    with pytest.raises(ValueError):
+        wheel.quantize_indexes(b"ab")
+    with pytest.raises(ValueError):
+        wheel.quantization_grid(9)
+    with pytest.raises(ValueError):
+        WheelItem("empty", []).quantize(b"abc")
+
+
+def random_wheel(name, size, seed):
+    rng = random.Random(seed)
+    return WheelItem.from_packed(name, bytes(rng.randrange(256) for _ in range(3 * size)))
+
+
+@pytest.mark.parametrize("size", [5, 200])
+def test_transforms_match_per_color_reference(backend, size):
+    wheel = random_wheel("wheel", size, size)
+    colors = [color.color for color in wheel.colors]
+
+    complement = wheel.complemented()
+    assert complement.name == "wheel_complement"
+    assert [color.color for color in complement.colors] == \
+        [ColorItem(*color).complement.color for color in colors]
+
+    assert wheel.scaled(1.5).table() == tuple(
+        tuple(min(255, int(value * 1.5)) for value in color) for color in colors)
+    assert wheel.inverted(name="negative").table() == tuple(
+        tuple(255 - value for value in color) for color in colors)
+    assert wheel.gamma_corrected(2.2).table() == tuple(
+        tuple(int(round(255 * (value / 255) ** 2.2)) for value in color) for color in colors)
+
+
+@pytest.mark.parametrize("size", [5, 200])
+def test_blend_matches_fixed_point_formula(backend, size):
+    wheel = random_wheel("wheel", size, size)
+    other = random_wheel("other", 3, size + 1)
+    blend = wheel.blended(other, ratio=0.25)
+    assert blend.name == "wheel_blend"
+    others = other.packed * size
+    assert blend.packed == bytes((value * 192 + others[i] * 64 + 128) >> 8
+                                 for i, value in enumerate(wheel.packed))
+    assert wheel.blended(other, ratio=0.0) == WheelItem("wheel_blend", wheel.colors)
+    with pytest.raises(ValueError):
+        wheel.blended(WheelItem("empty", []))
+
+
+def test_complement_of_wheel_outside_byte_range():
+    wide = WheelItem.rainbow_wheel_item("wide", 10, amplitude=200)
+    complement = WheelItem.complement_wheel_item(wide)
+    assert list(complement.colors) == [color.complement for color in wide.colors]
+    with pytest.raises(ValueError):
+        wide.complemented()
+
+
+def test_colors_are_a_read_only_view():
+    wheel = WheelItem("wheel", [ColorItem(1, 2, 3), ColorItem(4, 5, 6)])
+    assert wheel.packed == bytes(range(1, 7))
+    assert wheel.colors[1] is FrozenColor(4, 5, 6)
+    assert wheel.colors == [ColorItem(1, 2, 3), ColorItem(4, 5, 6)]
+
+    table = wheel.table()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        wheel.colors[0].red = 10
+    assert wheel.table() is table
+
+    wheel.colors = [ColorItem(10, 2, 3)]
+    assert wheel.table() == ((10, 2, 3),)
+
+
+def test_colors_outside_byte_range():
+    wheel = WheelItem.rainbow_wheel_item("wide", 10, amplitude=200)
+    assert wheel.table()[0] == (128, 309, -23)
+    with pytest.raises(ValueError):
+        wheel.packed
+
+
+def test_rainbow_backends_agree(monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    from colorwheels import wheel_item  # pylint: disable=import-outside-toplevel
+
+    monkeypatch.setattr(wheel_item, "_numpy", None)
+    python = WheelItem.rainbow_wheel_item("rainbow", 1000, frequency=0.05)
+    monkeypatch.setattr(wheel_item, "_numpy", numpy)
+    vectorized = WheelItem.rainbow_wheel_item("rainbow", 1000, frequency=0.05)
+    assert python == vectorized